@@ -3,6 +3,14 @@ import os
 
 from fastapi import FastAPI
 
+from services import (
+    DOCUMENT_CONVERTER_POOL,
+    HTTP_CLIENT_SERVICE,
+    ICON_FINDER_SERVICE,
+    OFFICE_WORKER_POOL,
+    PDF_RASTERIZER,
+    PRESENTATION_GENERATION_JOB_SERVICE,
+)
 from services.database import create_db_and_tables
 from utils.get_env import get_app_data_directory_env
 from utils.model_availability import (
@@ -14,10 +22,25 @@ from utils.model_availability import (
 async def app_lifespan(_: FastAPI):
     """
     Lifespan context manager for FastAPI application.
-    Initializes the application data directory and checks LLM model availability.
+    Initializes the application data directory, checks LLM model availability,
+    warms up the shared icon finder service, checks the office worker pool
+    and starts the presentation generation workers.
+    Stops the generation workers, closes the shared HTTP client sessions
+    and the PDF rasterizer and document converter workers on shutdown.
 
     """
     os.makedirs(get_app_data_directory_env(), exist_ok=True)
     await create_db_and_tables()
     await check_llm_and_image_provider_api_or_model_availability()
+    try:
+        await ICON_FINDER_SERVICE.warm_up()
+    except Exception as e:
+        # Icon finder service will retry initialization on first search
+        print(f"Failed to initialize icon finder service: {e}")
+    await OFFICE_WORKER_POOL.check_health()
+    PRESENTATION_GENERATION_JOB_SERVICE.start()
     yield
+    await PRESENTATION_GENERATION_JOB_SERVICE.stop()
+    await HTTP_CLIENT_SERVICE.close()
+    PDF_RASTERIZER.shutdown()
+    DOCUMENT_CONVERTER_POOL.shutdown()
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from models.database_engine_profile import DatabaseDiagnostics
+from services.database import get_database_diagnostics
+
+DIAGNOSTICS_ROUTER = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+
+
+@DIAGNOSTICS_ROUTER.get("/database", response_model=DatabaseDiagnostics)
+async def get_database_engine_diagnostics():
+    return await get_database_diagnostics()
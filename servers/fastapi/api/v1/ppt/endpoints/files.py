@@ -1,10 +1,13 @@
 from http.client import HTTPException
+import json
 import os
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Tuple
 from fastapi import APIRouter, Body, File, UploadFile
+from fastapi.responses import StreamingResponse
 
 from constants.documents import UPLOAD_ACCEPTED_FILE_TYPES
 from models.decomposed_file_info import DecomposedFileInfo
+from models.sse_response import SSECompleteResponse, SSEErrorResponse, SSEResponse
 from services import TEMP_FILE_SERVICE
 from services.documents_loader import DocumentsLoader
 from utils.randomizers import get_random_uuid
@@ -37,10 +40,7 @@ async def upload_files(files: Optional[List[UploadFile]]):
     return temp_files
 
 
-@FILES_ROUTER.post("/decompose", response_model=List[DecomposedFileInfo])
-async def decompose_files(file_paths: Annotated[List[str], Body(embed=True)]):
-    temp_dir = TEMP_FILE_SERVICE.create_temp_dir(get_random_uuid())
-
+def split_text_files(file_paths: List[str]) -> Tuple[List[str], List[str]]:
     txt_files = []
     other_files = []
     for file_path in file_paths:
@@ -48,13 +48,17 @@ async def decompose_files(file_paths: Annotated[List[str], Body(embed=True)]):
             txt_files.append(file_path)
         else:
             other_files.append(file_path)
+    return txt_files, other_files
 
-    documents_loader = DocumentsLoader(file_paths=other_files)
-    await documents_loader.load_documents(temp_dir)
-    parsed_documents = documents_loader.documents
 
+def get_decomposed_files(
+    documents_loader: DocumentsLoader,
+    other_files: List[str],
+    txt_files: List[str],
+    temp_dir: str,
+) -> List[DecomposedFileInfo]:
     response = []
-    for index, parsed_doc in enumerate(parsed_documents):
+    for index, parsed_doc in enumerate(documents_loader.documents):
         file_path = TEMP_FILE_SERVICE.create_temp_file_path(
             f"{get_random_uuid()}.txt", temp_dir
         )
@@ -76,6 +80,61 @@ async def decompose_files(file_paths: Annotated[List[str], Body(embed=True)]):
     return response
 
 
+@FILES_ROUTER.post("/decompose", response_model=List[DecomposedFileInfo])
+async def decompose_files(file_paths: Annotated[List[str], Body(embed=True)]):
+    temp_dir = TEMP_FILE_SERVICE.create_temp_dir(get_random_uuid())
+    txt_files, other_files = split_text_files(file_paths)
+
+    documents_loader = DocumentsLoader(file_paths=other_files)
+    await documents_loader.load_documents(temp_dir)
+
+    return get_decomposed_files(documents_loader, other_files, txt_files, temp_dir)
+
+
+@FILES_ROUTER.post(
+    "/decompose/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def decompose_files_stream(file_paths: Annotated[List[str], Body(embed=True)]):
+    """
+    Streams the progress of decompose as server-sent "response" events,
+    data of every event is JSON with a type.
+    - progress: index, file_path and status (loading or loaded) of a file
+    - complete: files, the DecomposedFileInfo list returned by /decompose
+    - error: detail of the failure, no more events follow
+    """
+    temp_dir = TEMP_FILE_SERVICE.create_temp_dir(get_random_uuid())
+    txt_files, other_files = split_text_files(file_paths)
+
+    documents_loader = DocumentsLoader(file_paths=other_files)
+
+    async def inner():
+        try:
+            async for progress in documents_loader.load_documents_with_progress(
+                temp_dir
+            ):
+                yield SSEResponse(
+                    event="response",
+                    data=json.dumps({"type": "progress", **progress.model_dump()}),
+                ).to_string()
+        except Exception as e:
+            print(f"Failed to decompose files: {e}")
+            yield SSEErrorResponse(
+                detail=getattr(e, "detail", None) or "Failed to decompose files"
+            ).to_string()
+            return
+
+        response = get_decomposed_files(
+            documents_loader, other_files, txt_files, temp_dir
+        )
+        yield SSECompleteResponse(
+            key="files", value=[each.model_dump(mode="json") for each in response]
+        ).to_string()
+
+    return StreamingResponse(inner(), media_type="text/event-stream")
+
+
 @FILES_ROUTER.post("/update")
 async def update_files(
     file_path: Annotated[str, Body()],
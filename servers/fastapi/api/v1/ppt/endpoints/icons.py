@@ -1,11 +1,15 @@
 from typing import List
 from fastapi import APIRouter
-from services.icon_finder_service import IconFinderService
+from services import ICON_FINDER_SERVICE
 
 ICONS_ROUTER = APIRouter(prefix="/icons", tags=["Icons"])
 
 
 @ICONS_ROUTER.get("/search", response_model=List[str])
 async def search_icons(query: str, limit: int = 20):
-    icon_finder_service = IconFinderService()
-    return await icon_finder_service.search_icons(query, limit)
+    return await ICON_FINDER_SERVICE.search_icons(query, limit)
+
+
+@ICONS_ROUTER.get("/cache/stats")
+async def get_icon_search_cache_stats():
+    return ICON_FINDER_SERVICE.cache.get_stats()
@@ -14,13 +14,17 @@ IMAGES_ROUTER = APIRouter(prefix="/images", tags=["Images"])
 
 @IMAGES_ROUTER.get("/generate")
 async def generate_image(
-    prompt: str, sql_session: AsyncSession = Depends(get_async_session)
+    prompt: str,
+    use_cache: bool = True,
+    sql_session: AsyncSession = Depends(get_async_session),
 ):
     images_directory = get_images_directory()
     image_prompt = ImagePrompt(prompt=prompt)
     image_generation_service = ImageGenerationService(images_directory)
 
-    image = await image_generation_service.generate_image(image_prompt)
+    image = await image_generation_service.generate_image(
+        image_prompt, use_cache=use_cache
+    )
     if not isinstance(image, ImageAsset):
         return image
 
@@ -34,7 +38,10 @@ async def generate_image(
 async def get_generated_images(sql_session: AsyncSession = Depends(get_async_session)):
     try:
         images = await sql_session.scalars(
-            select(ImageAsset).order_by(ImageAsset.created_at.desc())
+            select(ImageAsset)
+            # Stock image urls are only stored as image cache entries
+            .where(~ImageAsset.path.startswith("http"))
+            .order_by(ImageAsset.created_at.desc())
         )
         return images
     except Exception as e:
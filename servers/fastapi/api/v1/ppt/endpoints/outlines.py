@@ -1,26 +1,27 @@
 import asyncio
 import json
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.presentation_outline_model import PresentationOutlineModel
 from models.sql.presentation import PresentationModel
 from models.sse_response import SSECompleteResponse, SSEResponse, SSEStatusResponse
 from services import TEMP_FILE_SERVICE
-from services.database import get_async_session
+from services.database import unit_of_work
 from services.documents_loader import DocumentsLoader
 from services.score_based_chunker import ScoreBasedChunker
+from services.semantic_chunker import SemanticChunker
 from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
 
 OUTLINES_ROUTER = APIRouter(prefix="/outlines", tags=["Outlines"])
 
 
 @OUTLINES_ROUTER.get("/stream")
-async def stream_outlines(
-    presentation_id: str, sql_session: AsyncSession = Depends(get_async_session)
-):
-    presentation = await sql_session.get(PresentationModel, presentation_id)
+async def stream_outlines(presentation_id: str):
+    # Sessions are only opened to load and save, a request scoped session
+    # would hold its connection while documents load and the LLM streams
+    async with unit_of_work() as sql_session:
+        presentation = await sql_session.get(PresentationModel, presentation_id)
 
     if not presentation:
         raise HTTPException(status_code=404, detail="Presentation not found")
@@ -40,16 +41,19 @@ async def stream_outlines(
             documents = documents_loader.documents
             if documents:
                 additional_context = documents[0]
-                chunker = ScoreBasedChunker()
-                try:
-                    chunks = await chunker.get_n_chunks(
-                        documents[0], presentation.n_slides
-                    )
-                    presentation_outlines = PresentationOutlineModel(
-                        slides=[chunk.to_slide_outline() for chunk in chunks]
-                    )
-                except Exception as e:
-                    print(e)
+                # Documents without enough headings are split by topic locally,
+                # the outlines are only generated by the LLM if both fail
+                for chunker in [ScoreBasedChunker(), SemanticChunker()]:
+                    try:
+                        chunks = await chunker.get_n_chunks(
+                            documents[0], presentation.n_slides
+                        )
+                        presentation_outlines = PresentationOutlineModel(
+                            slides=[chunk.to_slide_outline() for chunk in chunks]
+                        )
+                        break
+                    except Exception as e:
+                        print(e)
 
         if not presentation_outlines:
             presentation_outlines_text = ""
@@ -95,8 +99,8 @@ async def stream_outlines(
             .replace("\n", "")
         )
 
-        sql_session.add(presentation)
-        await sql_session.commit()
+        async with unit_of_work() as sql_session:
+            sql_session.add(presentation)
 
         yield SSECompleteResponse(
             key="presentation", value=presentation.model_dump(mode="json")
@@ -1,11 +1,11 @@
 import os
 import shutil
 import tempfile
-import subprocess
 from typing import List, Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from pydantic import BaseModel
 
+from services import PDF_RASTERIZER
 from utils.asset_directory_utils import get_images_directory
 from utils.randomizers import get_random_uuid
 from constants.documents import PDF_MIME_TYPES
@@ -34,7 +34,7 @@ async def process_pdf_slides(
     
     This endpoint:
     1. Validates the uploaded PDF file
-    2. Uses ImageMagick to convert PDF pages to PNG images
+    2. Renders PDF pages to PNG images in parallel
     3. Returns screenshot URLs for each slide/page
     
     Note: Font installation is not needed since PDFs already have fonts embedded.
@@ -62,7 +62,7 @@ async def process_pdf_slides(
                 pdf_content = await pdf_file.read()
                 f.write(pdf_content)
             
-            # Generate screenshots from PDF using ImageMagick
+            # Generate screenshots from PDF pages
             screenshot_paths = await _generate_pdf_screenshots(pdf_path, temp_dir)
             print(f"Generated {len(screenshot_paths)} PDF screenshots")
             
@@ -107,74 +107,20 @@ async def process_pdf_slides(
 
 
 async def _generate_pdf_screenshots(pdf_path: str, temp_dir: str) -> List[str]:
-    """Generate PNG screenshots of PDF pages using ImageMagick (same approach as PPTX endpoint)."""
+    """Generate PNG screenshots of PDF pages in parallel using the PDF rasterizer."""
     screenshots_dir = os.path.join(temp_dir, "screenshots")
-    os.makedirs(screenshots_dir, exist_ok=True)
     
     try:
-        # Convert PDF to individual PNG images using ImageMagick
-        print("Starting ImageMagick PNG conversion...")
-        try:
-            result = subprocess.run([
-                "convert",
-                "-density", "150",  # Same DPI as PPTX endpoint
-                pdf_path,
-                os.path.join(screenshots_dir, "slide_%03d.png")
-            ], check=True, capture_output=True, text=True, timeout=500)
-            
-            print(f"ImageMagick conversion output: {result.stdout}")
-            if result.stderr:
-                print(f"ImageMagick conversion warnings: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            raise Exception("ImageMagick PNG conversion timed out after 500 seconds")
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            raise Exception(f"ImageMagick PNG conversion failed: {error_msg}")
-        
-        # Find generated PNG files (ImageMagick creates slide_000.png, slide_001.png, etc.)
-        print("Checking for generated PNG files...")
-        png_files = sorted([f for f in os.listdir(screenshots_dir) if f.startswith("slide_") and f.endswith('.png')])
-        print(f"Generated PNG files: {png_files}")
-        
-        if not png_files:
-            raise Exception("ImageMagick failed to generate any PNG files")
-        
-        # Determine page count from generated files
-        page_count = len(png_files)
-        print(f"Determined {page_count} pages from ImageMagick output")
+        print("Starting PDF page rendering...")
+        screenshot_paths = await PDF_RASTERIZER.rasterize_all(
+            pdf_path, screenshots_dir, dpi=150, filename_prefix="slide"
+        )
         
-        # Rename files from slide_000.png format to slide_1.png format expected by the API
-        # (Same renaming logic as PPTX endpoint)
-        print("Renaming PNG files to expected format...")
-        screenshot_paths = []
-        for i in range(page_count):
-            # ImageMagick generates slide_000.png, slide_001.png, etc.
-            source_file = f"slide_{i:03d}.png"
-            source_path = os.path.join(screenshots_dir, source_file)
-            
-            # We need slide_1.png, slide_2.png, etc.
-            target_file = f"slide_{i+1}.png"
-            target_path = os.path.join(screenshots_dir, target_file)
-            
-            if os.path.exists(source_path):
-                # Rename to expected format
-                shutil.move(source_path, target_path)
-                screenshot_paths.append(target_path)
-                print(f"✓ Renamed {source_file} to {target_file}")
-            else:
-                print(f"⚠ Warning: Expected file {source_file} not found, creating placeholder")
-                # Create empty placeholder
-                with open(target_path, 'w') as f:
-                    f.write("")
-                screenshot_paths.append(target_path)
+        if not screenshot_paths:
+            raise Exception("Failed to render any PNG files from PDF")
         
         print(f"Successfully generated {len(screenshot_paths)} PDF page screenshots")
         return screenshot_paths
         
     except Exception as e:
-        # Re-raise the specific exceptions we've already handled
-        if "timed out" in str(e) or "failed:" in str(e):
-            raise
-        # Handle any other unexpected exceptions
-        raise Exception(f"PDF screenshot generation failed: {str(e)}") 
\ No newline at end of file
+        raise Exception(f"PDF screenshot generation failed: {str(e)}")
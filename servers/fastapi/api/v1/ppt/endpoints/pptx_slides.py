@@ -2,7 +2,6 @@ import os
 import shutil
 import zipfile
 import tempfile
-import subprocess
 import uuid
 from typing import List, Optional, Dict
 from fastapi import APIRouter, UploadFile, File, HTTPException
@@ -12,6 +11,12 @@ import asyncio
 import xml.etree.ElementTree as ET
 import re
 
+from services import (
+    HTTP_CLIENT_SERVICE,
+    OFFICE_WORKER_POOL,
+    PDF_RASTERIZER,
+    SUBPROCESS_SERVICE,
+)
 from utils.asset_directory_utils import get_images_directory
 from utils.randomizers import get_random_uuid
 from constants.documents import POWERPOINT_TYPES
@@ -193,9 +198,9 @@ async def check_google_font_availability(font_name: str) -> bool:
         formatted_name = font_name.replace(' ', '+')
         url = f"https://fonts.googleapis.com/css2?family={formatted_name}&display=swap"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.head(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                return response.status == 200
+        session = HTTP_CLIENT_SERVICE.get_session()
+        async with session.head(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            return response.status == 200
                 
     except Exception as e:
         print(f"Error checking Google Font availability for {font_name}: {e}")
@@ -264,8 +269,8 @@ async def process_pptx_slides(
     This endpoint:
     1. Validates the uploaded PPTX file
     2. Installs any provided font files
-    3. Unzips the PPTX to extract slide XMLs
-    4. Uses LibreOffice to generate slide screenshots
+    3. Reads slide XMLs from the PPTX archive
+    4. Uses LibreOffice and the PDF rasterizer to generate slide screenshots
     5. Returns both screenshot URLs and XML content for each slide
     """
     
@@ -295,11 +300,11 @@ async def process_pptx_slides(
             if fonts:
                 await _install_fonts(fonts, temp_dir)
             
-            # Extract slide XMLs from PPTX
-            slide_xmls = _extract_slide_xmls(pptx_path, temp_dir)
+            # Extract slide XMLs from PPTX once, shared by screenshots and font analysis
+            slide_xmls = _extract_slide_xmls(pptx_path)
             
             # Generate screenshots using LibreOffice
-            screenshot_paths = await _generate_screenshots(pptx_path, temp_dir)
+            screenshot_paths = await _generate_screenshots(pptx_path, temp_dir, slide_xmls)
             print(f"Screenshot paths: {screenshot_paths}")
             
             # Analyze fonts across all slides
@@ -371,7 +376,7 @@ async def process_pptx_fonts(
             f.write(pptx_content)
 
         # Extract slide XMLs from PPTX
-        slide_xmls = _extract_slide_xmls(pptx_path, temp_dir)
+        slide_xmls = _extract_slide_xmls(pptx_path)
 
         # Analyze fonts across all slides (same logic as in /pptx-slides)
         font_analysis = await analyze_fonts_in_all_slides(slide_xmls)
@@ -428,59 +433,55 @@ async def _install_fonts(fonts: List[UploadFile], temp_dir: str) -> None:
         
         # Install font (copy to system fonts directory)
         try:
-            subprocess.run([
-                "cp", font_path, "/usr/share/fonts/truetype/"
-            ], check=True, capture_output=True)
-        except subprocess.CalledProcessError as e:
+            await asyncio.to_thread(shutil.copy, font_path, "/usr/share/fonts/truetype/")
+        except OSError as e:
             print(f"Warning: Failed to install font {font_file.filename}: {e}")
     
     # Refresh font cache
     try:
-        subprocess.run(["fc-cache", "-f", "-v"], check=True, capture_output=True)
-    except subprocess.CalledProcessError as e:
+        await SUBPROCESS_SERVICE.run(["fc-cache", "-f", "-v"], timeout=120)
+    except Exception as e:
         print(f"Warning: Failed to refresh font cache: {e}")
 
 
-def _extract_slide_xmls(pptx_path: str, temp_dir: str) -> List[str]:
-    """Extract slide XML content from PPTX file."""
-    slide_xmls = []
-    extract_dir = os.path.join(temp_dir, "pptx_extract")
-    
+_SLIDE_XML_MEMBER_PATTERN = re.compile(r"^ppt/slides/slide(\d+)\.xml$")
+
+
+def _extract_slide_xmls(pptx_path: str) -> List[str]:
+    """
+    Read slide XML content straight from the PPTX archive.
+    Only ppt/slides/slideN.xml members are decompressed, media is never unpacked.
+    """
     try:
-        # Unzip PPTX file
         with zipfile.ZipFile(pptx_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-        
-        # Look for slides in ppt/slides/ directory
-        slides_dir = os.path.join(extract_dir, "ppt", "slides")
-        
-        if not os.path.exists(slides_dir):
-            raise Exception("No slides directory found in PPTX file")
-        
-        # Get all slide XML files and sort them numerically
-        slide_files = [f for f in os.listdir(slides_dir) if f.startswith("slide") and f.endswith(".xml")]
-        slide_files.sort(key=lambda x: int(x.replace("slide", "").replace(".xml", "")))
-        
-        # Read XML content from each slide
-        for slide_file in slide_files:
-            slide_path = os.path.join(slides_dir, slide_file)
-            with open(slide_path, 'r', encoding='utf-8') as f:
-                slide_xmls.append(f.read())
-        
-        return slide_xmls
-        
+            slide_members = []
+            for member in zip_ref.infolist():
+                match = _SLIDE_XML_MEMBER_PATTERN.match(member.filename)
+                if match:
+                    slide_members.append((int(match.group(1)), member))
+
+            if not slide_members:
+                raise Exception("No slides directory found in PPTX file")
+
+            # Sort slides numerically (slide2.xml before slide10.xml)
+            slide_members.sort(key=lambda x: x[0])
+            return [
+                zip_ref.read(member).decode('utf-8')
+                for _, member in slide_members
+            ]
+
     except Exception as e:
         raise Exception(f"Failed to extract slide XMLs: {str(e)}")
 
 
-async def _generate_screenshots(pptx_path: str, temp_dir: str) -> List[str]:
-    """Generate PNG screenshots of PPTX slides using LibreOffice + ImageMagick."""
+async def _generate_screenshots(
+    pptx_path: str, temp_dir: str, slide_xmls: List[str]
+) -> List[str]:
+    """Generate PNG screenshots of PPTX slides using LibreOffice and the PDF rasterizer."""
     screenshots_dir = os.path.join(temp_dir, "screenshots")
     os.makedirs(screenshots_dir, exist_ok=True)
     
     try:
-        # First, get the number of slides by extracting XMLs
-        slide_xmls = _extract_slide_xmls(pptx_path, temp_dir)
         slide_count = len(slide_xmls)
         
         # Build font alias config to force variant families to resolve to normalized root families
@@ -494,83 +495,30 @@ async def _generate_screenshots(pptx_path: str, temp_dir: str) -> List[str]:
         
         print(f"Found {slide_count} slides in presentation")
         
-        # Step 1: Convert PPTX to PDF using LibreOffice
+        # Step 1: Convert PPTX to PDF using a LibreOffice worker of the pool
         print("Starting LibreOffice PDF conversion...")
-        pdf_filename = "temp_presentation.pdf"
-        pdf_path = os.path.join(screenshots_dir, pdf_filename)
-        
-        try:
-            result = subprocess.run([
-                "libreoffice",
-                "--headless", 
-                "--convert-to", "pdf",
-                "--outdir", screenshots_dir,
-                pptx_path
-            ], check=True, capture_output=True, text=True, timeout=500, env=env)
-            
-            print(f"LibreOffice PDF conversion output: {result.stdout}")
-            if result.stderr:
-                print(f"LibreOffice PDF conversion warnings: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            raise Exception("LibreOffice PDF conversion timed out after 120 seconds")
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            raise Exception(f"LibreOffice PDF conversion failed: {error_msg}")
-        
-        # Find the generated PDF file (LibreOffice uses original filename)
-        pdf_files = [f for f in os.listdir(screenshots_dir) if f.endswith('.pdf')]
-        if not pdf_files:
-            raise Exception("LibreOffice failed to generate PDF file")
-        
-        actual_pdf_path = os.path.join(screenshots_dir, pdf_files[0])
+        actual_pdf_path = await OFFICE_WORKER_POOL.convert(
+            pptx_path, screenshots_dir, convert_to="pdf", env=env
+        )
         print(f"Generated PDF: {actual_pdf_path}")
         
-        # Step 2: Convert PDF to individual PNG images using ImageMagick
-        print("Starting ImageMagick PNG conversion...")
-        try:
-            result = subprocess.run([
-                "convert",
-                "-density", "150",
-                actual_pdf_path,
-                os.path.join(screenshots_dir, "slide_%03d.png")
-            ], check=True, capture_output=True, text=True, timeout=500, env=env)
-            
-            print(f"ImageMagick conversion output: {result.stdout}")
-            if result.stderr:
-                print(f"ImageMagick conversion warnings: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            raise Exception("ImageMagick PNG conversion timed out after 120 seconds")
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            raise Exception(f"ImageMagick PNG conversion failed: {error_msg}")
-        
-        # Find generated PNG files (ImageMagick creates slide_000.png, slide_001.png, etc.)
-        print("Checking for generated PNG files...")
-        png_files = sorted([f for f in os.listdir(screenshots_dir) if f.startswith("slide_") and f.endswith('.png')])
-        print(f"Generated PNG files: {png_files}")
+        # Step 2: Render PDF pages to PNG images in parallel
+        print("Starting PDF page rendering...")
+        page_image_paths = await PDF_RASTERIZER.rasterize_all(
+            actual_pdf_path, screenshots_dir, dpi=150, filename_prefix="slide"
+        )
+        print(f"Rendered PNG files: {page_image_paths}")
         
-        if not png_files:
-            raise Exception("ImageMagick failed to generate any PNG files")
+        if not page_image_paths:
+            raise Exception("Failed to render any PNG files from PDF")
         
-        # Rename files from slide_000.png format to slide_1.png format expected by the API
-        print("Renaming PNG files to expected format...")
         screenshot_paths = []
         for i in range(slide_count):
-            # ImageMagick generates slide_000.png, slide_001.png, etc.
-            source_file = f"slide_{i:03d}.png"
-            source_path = os.path.join(screenshots_dir, source_file)
-            
-            # We need slide_1.png, slide_2.png, etc.
-            target_file = f"slide_{i+1}.png"
-            target_path = os.path.join(screenshots_dir, target_file)
-            
-            if os.path.exists(source_path):
-                # Rename to expected format
-                shutil.move(source_path, target_path)
-                screenshot_paths.append(target_path)
-                print(f"✓ Renamed {source_file} to {target_file}")
+            if i < len(page_image_paths):
+                screenshot_paths.append(page_image_paths[i])
             else:
-                print(f"⚠ Warning: Expected file {source_file} not found, creating placeholder")
+                target_path = os.path.join(screenshots_dir, f"slide_{i+1}.png")
+                print(f"⚠ Warning: Page {i+1} not rendered, creating placeholder")
                 # Create empty placeholder
                 with open(target_path, 'w') as f:
                     f.write("")
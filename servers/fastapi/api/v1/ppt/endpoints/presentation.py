@@ -3,8 +3,9 @@ import json
 import os
 import random
 from typing import Annotated, List, Literal, Optional
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from dependencies.auth import get_current_user_id
+from enums.job_status import JobStatus
 from fastapi.responses import StreamingResponse
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,34 +20,47 @@ from models.presentation_outline_model import (
 from models.pptx_models import PptxPresentationModel
 from models.presentation_layout import PresentationLayoutModel
 from models.presentation_structure_model import PresentationStructureModel
+from models.presentation_list import PresentationListResponse, PresentationSummary
 from models.presentation_with_slides import PresentationWithSlides
 
-from utils.get_layout_by_name import get_layout_by_name
-from services.icon_finder_service import IconFinderService
 from services.image_generation_service import ImageGenerationService
 from utils.dict_utils import deep_update
 from utils.export_utils import export_presentation
-from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
+from utils.generate_presentation import generate_presentation
 from models.sql.slide import SlideModel
-from models.sse_response import SSECompleteResponse, SSEResponse
+from models.sse_response import SSECompleteResponse, SSEErrorResponse, SSEResponse
 
-from services.database import get_async_session
-from services import TEMP_FILE_SERVICE
+from services.database import get_async_session, unit_of_work
+from services import (
+    ICON_FINDER_SERVICE,
+    PRESENTATION_GENERATION_JOB_SERVICE,
+    TEMP_FILE_SERVICE,
+)
 from models.sql.presentation import PresentationModel
+from models.sql.presentation_generation_job import PresentationGenerationJob
 from services.pptx_presentation_creator import PptxPresentationCreator
 from utils.asset_directory_utils import get_exports_directory, get_images_directory
 from utils.llm_calls.generate_presentation_structure import (
     generate_presentation_structure,
 )
 from utils.llm_calls.generate_slide_content import (
-    get_slide_content_from_type_and_outline,
+    get_slide_contents_from_types_and_outlines,
+)
+from utils.process_slides import SlideAssetsFetcher
+from utils.presentation_cursor import (
+    decode_presentations_cursor,
+    encode_presentations_cursor,
 )
-from utils.process_slides import process_slide_and_fetch_assets
 from utils.randomizers import get_random_uuid
+from utils.slide_diff import diff_slides
 
 
 PRESENTATION_ROUTER = APIRouter(prefix="/presentation", tags=["Presentation"])
 
+# Seconds between job status checks of a job stream
+JOB_STREAM_POLL_INTERVAL = 1
+MAX_PRESENTATIONS_PAGE_SIZE = 100
+
 
 @PRESENTATION_ROUTER.get("", response_model=PresentationWithSlides)
 async def get_presentation(
@@ -96,28 +110,83 @@ async def get_all_presentations(
     sql_session: AsyncSession = Depends(get_async_session),
     user_id: str = Depends(get_current_user_id)
 ):
-    presentations_with_slides = []
-    presentations = await sql_session.scalars(
-        select(PresentationModel).where(PresentationModel.user_id == user_id)
+    # Presentations and their first slide are fetched in one query
+    results = await sql_session.execute(
+        select(PresentationModel, SlideModel)
+        .join(
+            SlideModel,
+            (SlideModel.presentation == PresentationModel.id)
+            & (SlideModel.index == 0),
+        )
+        .where(PresentationModel.user_id == user_id)
+        .order_by(PresentationModel.created_at.desc(), PresentationModel.id.desc())
     )
+    return [
+        PresentationWithSlides(**presentation.model_dump(), slides=[first_slide])
+        for presentation, first_slide in results
+    ]
+
 
-    async def inner(presentation: PresentationModel, sql_session: AsyncSession):
-        first_slide = await sql_session.scalar(
-            select(SlideModel)
-            .where(SlideModel.presentation == presentation.id)
-            .where(SlideModel.index == 0)
+@PRESENTATION_ROUTER.get("/list", response_model=PresentationListResponse)
+async def list_presentations(
+    limit: Annotated[int, Query(ge=1, le=MAX_PRESENTATIONS_PAGE_SIZE)] = 20,
+    cursor: Optional[str] = None,
+    summary: bool = False,
+    sql_session: AsyncSession = Depends(get_async_session),
+    user_id: str = Depends(get_current_user_id),
+):
+    """
+    Lists presentations of the user, newest first, one page at a time.
+    - Pass next_cursor of a page as cursor to get the next page
+    - With summary, only presentation fields are returned, without layout,
+      outlines, structure and slides
+    """
+    if summary:
+        columns = [
+            getattr(PresentationModel, field)
+            for field in PresentationSummary.model_fields
+        ]
+    else:
+        columns = [PresentationModel, SlideModel]
+
+    query = (
+        select(*columns)
+        .join(
+            SlideModel,
+            (SlideModel.presentation == PresentationModel.id)
+            & (SlideModel.index == 0),
         )
-        if not first_slide:
-            return None
-        return PresentationWithSlides(
-            **presentation.model_dump(),
-            slides=[first_slide],
+        .where(PresentationModel.user_id == user_id)
+        .order_by(PresentationModel.created_at.desc(), PresentationModel.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        cursor_created_at, cursor_id = decode_presentations_cursor(cursor)
+        query = query.where(
+            (PresentationModel.created_at < cursor_created_at)
+            | (
+                (PresentationModel.created_at == cursor_created_at)
+                & (PresentationModel.id < cursor_id)
+            )
         )
 
-    tasks = [inner(p, sql_session) for p in presentations]
-    results = await asyncio.gather(*tasks)
-    presentations_with_slides = [r for r in results if r is not None]
-    return presentations_with_slides
+    rows = list(await sql_session.execute(query))
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row = rows[-1][0] if not summary else rows[-1]
+        next_cursor = encode_presentations_cursor(last_row.created_at, last_row.id)
+
+    if summary:
+        presentations = [PresentationSummary(**row._mapping) for row in rows]
+    else:
+        presentations = [
+            PresentationWithSlides(**presentation.model_dump(), slides=[first_slide])
+            for presentation, first_slide in rows
+        ]
+    return PresentationListResponse(
+        presentations=presentations, next_cursor=next_cursor
+    )
 
 
 @PRESENTATION_ROUTER.post("/create", response_model=PresentationModel)
@@ -203,10 +272,12 @@ async def prepare_presentation(
 @PRESENTATION_ROUTER.get("/stream", response_model=PresentationWithSlides)
 async def stream_presentation(
     presentation_id: str, 
-    sql_session: AsyncSession = Depends(get_async_session),
     user_id: str = Depends(get_current_user_id)
 ):
-    presentation = await sql_session.get(PresentationModel, presentation_id)
+    # Sessions are only opened to load and save, a request scoped session
+    # would hold its connection for the whole generation
+    async with unit_of_work() as sql_session:
+        presentation = await sql_session.get(PresentationModel, presentation_id)
     if not presentation:
         raise HTTPException(status_code=404, detail="Presentation not found")
     if not presentation.structure:
@@ -221,65 +292,64 @@ async def stream_presentation(
         )
 
     image_generation_service = ImageGenerationService(get_images_directory())
-    icon_finder_service = IconFinderService()
 
     async def inner():
         structure = presentation.get_structure()
         layout = presentation.get_layout()
         outline = presentation.get_presentation_outline()
 
-        # These tasks will be gathered and awaited after all slides are generated
-        async_assets_generation_tasks = []
+        # Assets of each slide start fetching as soon as the slide is generated
+        assets_fetcher = SlideAssetsFetcher(
+            image_generation_service, ICON_FINDER_SERVICE
+        )
 
         slides: List[SlideModel] = []
         yield SSEResponse(
             event="response",
             data=json.dumps({"type": "chunk", "chunk": '{ "slides": [ '}),
         ).to_string()
-        for i, slide_layout_index in enumerate(structure.slides):
-            slide_layout = layout.slides[slide_layout_index]
-
-            slide_content = await get_slide_content_from_type_and_outline(
-                slide_layout, outline.slides[i], presentation.language
-            )
+        slide_layouts = [layout.slides[index] for index in structure.slides]
+
+        try:
+            # Slides are generated concurrently but streamed in order
+            async for i, slide_content in get_slide_contents_from_types_and_outlines(
+                slide_layouts, outline.slides, presentation.language
+            ):
+                slide_layout = slide_layouts[i]
+
+                slide = SlideModel(
+                    user_id=user_id,  # Associate slide with current user
+                    presentation=presentation_id,
+                    layout_group=layout.name,
+                    layout=slide_layout.id,
+                    index=i,
+                    speaker_note=slide_content.get("__speaker_note__", ""),
+                    content=slide_content,
+                )
+                slides.append(slide)
 
-            slide = SlideModel(
-                user_id=user_id,  # Associate slide with current user
-                presentation=presentation_id,
-                layout_group=layout.name,
-                layout=slide_layout.id,
-                index=i,
-                speaker_note=slide_content.get("__speaker_note__", ""),
-                content=slide_content,
-            )
-            slides.append(slide)
+                slide_chunk = slide.model_dump_json()
+                assets_fetcher.schedule(slide)
 
-            # This will mutate slide
-            async_assets_generation_tasks.append(
-                process_slide_and_fetch_assets(
-                    image_generation_service, icon_finder_service, slide
-                )
-            )
+                yield SSEResponse(
+                    event="response",
+                    data=json.dumps({"type": "chunk", "chunk": slide_chunk}),
+                ).to_string()
 
             yield SSEResponse(
                 event="response",
-                data=json.dumps({"type": "chunk", "chunk": slide.model_dump_json()}),
+                data=json.dumps({"type": "chunk", "chunk": " ] }"}),
             ).to_string()
 
-        yield SSEResponse(
-            event="response",
-            data=json.dumps({"type": "chunk", "chunk": " ] }"}),
-        ).to_string()
+            generated_assets = await assets_fetcher.wait()
+        finally:
+            # Stops fetching assets if the client disconnects mid stream
+            assets_fetcher.cancel()
 
-        generated_assets_lists = await asyncio.gather(*async_assets_generation_tasks)
-        generated_assets = []
-        for assets_list in generated_assets_lists:
-            generated_assets.extend(assets_list)
-
-        sql_session.add(presentation)
-        sql_session.add_all(slides)
-        sql_session.add_all(generated_assets)
-        await sql_session.commit()
+        async with unit_of_work() as sql_session:
+            sql_session.add(presentation)
+            sql_session.add_all(slides)
+            sql_session.add_all(generated_assets)
 
         response = PresentationWithSlides(
             **presentation.model_dump(),
@@ -300,9 +370,8 @@ async def update_presentation(
     sql_session: AsyncSession = Depends(get_async_session),
     user_id: str = Depends(get_current_user_id)
 ):
-    updated_presentation = presentation_with_slides.to_presentation_model()
     updated_slides = presentation_with_slides.slides
-    presentation = await sql_session.get(PresentationModel, updated_presentation.id)
+    presentation = await sql_session.get(PresentationModel, presentation_with_slides.id)
     if not presentation:
         raise HTTPException(status_code=404, detail="Presentation not found")
     
@@ -310,12 +379,23 @@ async def update_presentation(
     if presentation.user_id != user_id:
         raise HTTPException(403, "You don't have permission to update this presentation")
     
-    presentation.sqlmodel_update(updated_presentation)
+    # Request has no user_id, only fields it contains are updated
+    presentation.sqlmodel_update(presentation_with_slides.model_dump(exclude={"slides"}))
 
-    await sql_session.execute(
-        delete(SlideModel).where(SlideModel.presentation == updated_presentation.id)
+    # Autosaves usually change a single slide, only the difference is written
+    stored_slides = await sql_session.scalars(
+        select(SlideModel).where(SlideModel.presentation == presentation_with_slides.id)
     )
-    sql_session.add_all(updated_slides)
+    stored_slides = {slide.id: slide for slide in stored_slides}
+    slides_diff = diff_slides(list(stored_slides.values()), updated_slides)
+
+    if slides_diff.deleted_slide_ids:
+        await sql_session.execute(
+            delete(SlideModel).where(SlideModel.id.in_(slides_diff.deleted_slide_ids))
+        )
+    for slide in slides_diff.changed_slides:
+        stored_slides[slide.id].sqlmodel_update(slide.model_dump(exclude={"id"}))
+    sql_session.add_all(slides_diff.new_slides)
     await sql_session.commit()
 
     return PresentationWithSlides(
@@ -346,126 +426,77 @@ async def create_pptx(
 @PRESENTATION_ROUTER.post("/generate", response_model=PresentationPathAndEditPath)
 async def generate_presentation_api(
     request: GeneratePresentationRequest,
-    sql_session: AsyncSession = Depends(get_async_session),
     user_id: str = Depends(get_current_user_id),
 ):
-    presentation_id = get_random_uuid()
+    return await generate_presentation(request, user_id)
 
-    # 3. Generate Outlines
-    presentation_outlines = None
-    additional_context = ""
-
-    if not presentation_outlines:
-        presentation_outlines_text = ""
-        async for chunk in generate_ppt_outline(
-            request.prompt,
-            request.n_slides,
-            request.language,
-            additional_context,
-        ):
-            presentation_outlines_text += chunk
-
-    try:
-        presentation_outlines_json = json.loads(presentation_outlines_text)
-    except Exception as e:
-        print(e)
-        raise HTTPException(
-            status_code=400,
-            detail="Failed to generate presentation outlines. Please try again.",
-        )
-    presentation_outlines = PresentationOutlineModel(**presentation_outlines_json)
-    outlines = presentation_outlines.slides[: request.n_slides]
-    total_outlines = len(outlines)
 
-    print("-" * 40)
-    print(f"Generated {total_outlines} outlines for the presentation")
-
-    # 4. Parse Layouts
-    layout_model = await get_layout_by_name(request.template)
-    total_slide_layouts = len(layout_model.slides)
+@PRESENTATION_ROUTER.post(
+    "/generate/async", response_model=PresentationGenerationJob, status_code=202
+)
+async def generate_presentation_async_api(
+    request: GeneratePresentationRequest,
+    user_id: str = Depends(get_current_user_id),
+):
+    return await PRESENTATION_GENERATION_JOB_SERVICE.submit(request, user_id)
 
-    # 5. Generate Structure
-    if layout_model.ordered:
-        presentation_structure = layout_model.to_presentation_structure()
-    else:
-        presentation_structure: PresentationStructureModel = (
-            await generate_presentation_structure(
-                presentation_outlines,
-                layout_model,
-            )
-        )
 
-    presentation_structure.slides = presentation_structure.slides[:total_outlines]
-    for index in range(total_outlines):
-        random_slide_index = random.randint(0, total_slide_layouts - 1)
-        if index >= total_outlines:
-            presentation_structure.slides.append(random_slide_index)
-            continue
-        if presentation_structure.slides[index] >= total_slide_layouts:
-            presentation_structure.slides[index] = random_slide_index
+async def get_presentation_generation_job_of_user(job_id: str, user_id: str):
+    job = await PRESENTATION_GENERATION_JOB_SERVICE.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.user_id != user_id:
+        raise HTTPException(403, "You don't have permission to access this job")
+    return job
 
-    # 6. Create PresentationModel
-    presentation = PresentationModel(
-        id=presentation_id,
-        user_id=user_id,  # Associate presentation with current user
-        prompt=request.prompt,
-        n_slides=request.n_slides,
-        language=request.language,
-        outlines=presentation_outlines.model_dump(),
-        layout=layout_model.model_dump(),
-        structure=presentation_structure.model_dump(),
-    )
 
-    image_generation_service = ImageGenerationService(get_images_directory())
-    icon_finder_service = IconFinderService()
-    async_asset_generation_tasks = []
-
-    # 7. Generate slide content and save slides
-    slides: List[SlideModel] = []
-    slide_contents: List[dict] = []
-    for i, slide_layout_index in enumerate(presentation_structure.slides):
-        slide_layout = layout_model.slides[slide_layout_index]
-        print(f"Generating content for slide {i} with layout {slide_layout.id}")
-        slide_content = await get_slide_content_from_type_and_outline(
-            slide_layout, outlines[i], request.language
-        )
-        slide = SlideModel(
-            user_id=user_id,  # Associate slide with current user
-            presentation=presentation_id,
-            layout_group=layout_model.name,
-            layout=slide_layout.id,
-            index=i,
-            speaker_note=slide_content.get("__speaker_note__", ""),
-            content=slide_content,
-        )
-        async_asset_generation_tasks.append(
-            process_slide_and_fetch_assets(
-                image_generation_service, icon_finder_service, slide
-            )
-        )
-        slides.append(slide)
-        slide_contents.append(slide_content)
+@PRESENTATION_ROUTER.get("/generate/job", response_model=PresentationGenerationJob)
+async def get_presentation_generation_job(
+    id: str,
+    user_id: str = Depends(get_current_user_id),
+):
+    return await get_presentation_generation_job_of_user(id, user_id)
 
-    generated_assets_lists = await asyncio.gather(*async_asset_generation_tasks)
-    generated_assets = []
-    for assets_list in generated_assets_lists:
-        generated_assets.extend(assets_list)
 
-    # 8. Save PresentationModel and Slides
-    sql_session.add(presentation)
-    sql_session.add_all(slides)
-    sql_session.add_all(generated_assets)
-    await sql_session.commit()
+@PRESENTATION_ROUTER.get(
+    "/generate/job/stream", response_model=PresentationGenerationJob
+)
+async def stream_presentation_generation_job(
+    id: str,
+    user_id: str = Depends(get_current_user_id),
+):
+    job = await get_presentation_generation_job_of_user(id, user_id)
 
-    # 9. Export
-    presentation_and_path = await export_presentation(
-        presentation_id, presentation.title or get_random_uuid(), request.export_as
-    )
+    async def inner():
+        nonlocal job
+        last_progress = None
+        while True:
+            if job.status == JobStatus.COMPLETED.value:
+                yield SSECompleteResponse(
+                    key="job", value=job.model_dump(mode="json")
+                ).to_string()
+                return
+            if job.status == JobStatus.FAILED.value:
+                yield SSEErrorResponse(detail=job.error or "Job failed").to_string()
+                return
+
+            progress = (job.status, job.stage, job.progress)
+            if progress != last_progress:
+                last_progress = progress
+                yield SSEResponse(
+                    event="response",
+                    data=json.dumps(
+                        {"type": "progress", "job": job.model_dump(mode="json")}
+                    ),
+                ).to_string()
+
+            await asyncio.sleep(JOB_STREAM_POLL_INTERVAL)
+            job = await PRESENTATION_GENERATION_JOB_SERVICE.get(id)
+            if not job:
+                yield SSEErrorResponse(detail="Job not found").to_string()
+                return
 
-    return PresentationPathAndEditPath(
-        **presentation_and_path.model_dump(),
-        edit_path=f"/presentation?id={presentation_id}",
-    )
+    return StreamingResponse(inner(), media_type="text/event-stream")
 
 
 @PRESENTATION_ROUTER.post("/from-template", response_model=PresentationPathAndEditPath)
@@ -5,9 +5,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from dependencies.auth import get_current_user_id
 
 from models.sql.presentation import PresentationModel
+from models.slide_update_request import SlideUpdateRequest
 from models.sql.slide import SlideModel
+from services import ICON_FINDER_SERVICE
 from services.database import get_async_session
-from services.icon_finder_service import IconFinderService
 from services.image_generation_service import ImageGenerationService
 from utils.asset_directory_utils import get_images_directory
 from utils.llm_calls.edit_slide import get_edited_slide_content
@@ -15,6 +16,7 @@ from utils.llm_calls.edit_slide_html import get_edited_slide_html
 from utils.llm_calls.select_slide_type_on_edit import get_slide_layout_from_prompt
 from utils.process_slides import process_old_and_new_slides_and_fetch_assets
 from utils.randomizers import get_random_uuid
+from utils.slide_diff import get_slide_content_hash
 
 
 SLIDE_ROUTER = APIRouter(prefix="/slide", tags=["Slide"])
@@ -51,12 +53,11 @@ async def edit_slide(
     )
 
     image_generation_service = ImageGenerationService(get_images_directory())
-    icon_finder_service = IconFinderService()
 
     # This will mutate edited_slide_content
     new_assets = await process_old_and_new_slides_and_fetch_assets(
         image_generation_service,
-        icon_finder_service,
+        ICON_FINDER_SERVICE,
         slide.content,
         edited_slide_content,
     )
@@ -107,3 +108,28 @@ async def edit_slide_html(
     await sql_session.commit()
 
     return slide
+
+
+@SLIDE_ROUTER.patch("/update", response_model=SlideModel)
+async def update_slide(
+    slide_update: Annotated[SlideUpdateRequest, Body()],
+    sql_session: AsyncSession = Depends(get_async_session),
+    user_id: str = Depends(get_current_user_id),
+):
+    slide = await sql_session.get(SlideModel, slide_update.id)
+    if not slide:
+        raise HTTPException(status_code=404, detail="Slide not found")
+
+    # Update the slide's user_id if it's NULL (for backward compatibility)
+    if not slide.user_id:
+        slide.user_id = user_id
+    elif slide.user_id != user_id:
+        raise HTTPException(status_code=403, detail="You don't have permission to edit this slide")
+
+    stored_hash = get_slide_content_hash(slide)
+    slide.sqlmodel_update(slide_update.model_dump(exclude_unset=True, exclude={"id"}))
+    # Nothing is written if the editor saved the slide without changes
+    if get_slide_content_hash(slide) != stored_hash:
+        await sql_session.commit()
+
+    return slide
@@ -0,0 +1,54 @@
+"""
+Script to benchmark the score based chunker on a large markdown document
+"""
+import argparse
+import time
+import tracemalloc
+
+from services.score_based_chunker import ScoreBasedChunker
+
+
+def generate_markdown_lines(n_headings: int, lines_per_section: int):
+    for i in range(n_headings):
+        level = 1 + i % 4
+        yield f"{'#' * level} Section {i}"
+        for j in range(lines_per_section):
+            yield f"Paragraph {j} of section {i} with some text to chunk."
+
+
+def benchmark(name: str, get_input, top_k: int):
+    chunker = ScoreBasedChunker()
+    tracemalloc.start()
+    start = time.perf_counter()
+    chunks = chunker.get_chunks(get_input(), top_k)
+    elapsed = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name}: {len(chunks)} chunks in {elapsed:.3f}s, "
+        f"peak memory {peak_memory / 1024 / 1024:.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ScoreBasedChunker")
+    parser.add_argument("--headings", type=int, default=10000)
+    parser.add_argument("--lines-per-section", type=int, default=10)
+    parser.add_argument("--top-k", type=int, default=20)
+    args = parser.parse_args()
+
+    text = "\n".join(generate_markdown_lines(args.headings, args.lines_per_section))
+    print(
+        f"Document: {args.headings} headings, {len(text) / 1024 / 1024:.1f} MB"
+    )
+
+    benchmark("String input", lambda: text, args.top_k)
+    benchmark(
+        "Line iterator input",
+        lambda: generate_markdown_lines(args.headings, args.lines_per_section),
+        args.top_k,
+    )
+
+
+if __name__ == "__main__":
+    main()
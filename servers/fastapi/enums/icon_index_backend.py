@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class IconIndexBackend(Enum):
+    CHROMA = "chroma"
+    NUMPY = "numpy"
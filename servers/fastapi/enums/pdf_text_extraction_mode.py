@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class PdfTextExtractionMode(Enum):
+    AUTO = "auto"
+    FAST = "fast"
+    DOCLING = "docling"
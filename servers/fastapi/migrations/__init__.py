@@ -0,0 +1,14 @@
+from migrations import (
+    v001_add_user_id,
+    v002_add_lookup_indexes,
+    v003_add_job_presentation_id,
+    v004_add_image_asset_cache_key,
+)
+
+# Applied in this order, a new migration gets the next version
+MIGRATIONS = [
+    v001_add_user_id,
+    v002_add_lookup_indexes,
+    v003_add_job_presentation_id,
+    v004_add_image_asset_cache_key,
+]
@@ -0,0 +1,96 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlmodel import SQLModel, select
+
+from migrations import MIGRATIONS
+from models.sql.schema_migration import SchemaMigration
+
+# Lock taken by the process running migrations, PostgreSQL needs a number
+MIGRATIONS_LOCK_NAME = "schema_migrations"
+MIGRATIONS_LOCK_ID = 7261001
+
+
+@asynccontextmanager
+async def migrations_lock(engine: AsyncEngine) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Yields a connection holding the migrations lock, so workers starting
+    together apply every migration once instead of racing each other.
+    - PostgreSQL and MySQL hold a session lock until the connection is done
+    - SQLite locks the database only for one transaction, so every
+      transaction on the connection has to take it with begin_migration
+    """
+    async with engine.connect() as conn:
+        dialect = conn.dialect.name
+        if dialect == "postgresql":
+            await conn.execute(
+                text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATIONS_LOCK_ID}
+            )
+        elif dialect == "mysql":
+            await conn.execute(
+                text("SELECT GET_LOCK(:name, -1)"), {"name": MIGRATIONS_LOCK_NAME}
+            )
+        await conn.commit()
+
+        try:
+            yield conn
+        finally:
+            await conn.rollback()
+            if dialect == "postgresql":
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATIONS_LOCK_ID}
+                )
+            elif dialect == "mysql":
+                await conn.execute(
+                    text("SELECT RELEASE_LOCK(:name)"), {"name": MIGRATIONS_LOCK_NAME}
+                )
+            await conn.commit()
+
+
+async def begin_migration(conn: AsyncConnection):
+    if conn.dialect.name == "sqlite":
+        # Waits for other writers, then keeps them out until commit
+        await conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+async def get_applied_versions(conn: AsyncConnection) -> set:
+    return set((await conn.execute(select(SchemaMigration.version))).scalars())
+
+
+async def run_migrations(engine: AsyncEngine):
+    """
+    Applies migrations newer than the database version, each in its own
+    transaction, and records them in the schema_migrations table.
+    Migrations only change what is missing, so tables created by
+    create_all with the current models are left as they are.
+
+    Runs under the migrations lock and checks the applied versions again
+    inside every transaction, so migrations applied by another process
+    in the meantime are skipped.
+    """
+    async with migrations_lock(engine) as conn:
+        await begin_migration(conn)
+        await conn.run_sync(
+            lambda sync_conn: SQLModel.metadata.create_all(
+                sync_conn, tables=[SchemaMigration.__table__]
+            )
+        )
+        await conn.commit()
+
+        for migration in MIGRATIONS:
+            await begin_migration(conn)
+            if migration.VERSION in await get_applied_versions(conn):
+                await conn.rollback()
+                continue
+            print(
+                f"Applying database migration {migration.VERSION}: {migration.DESCRIPTION}"
+            )
+            await conn.run_sync(migration.upgrade)
+            await conn.execute(
+                SchemaMigration.__table__.insert().values(
+                    version=migration.VERSION, description=migration.DESCRIPTION
+                )
+            )
+            await conn.commit()
@@ -0,0 +1,22 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+VERSION = 1
+DESCRIPTION = "Add user_id to presentations and slides"
+
+
+def upgrade(connection: Connection):
+    """
+    Adds user_id columns to databases created before users existed
+    and assigns their rows to the default user.
+    """
+    inspector = inspect(connection)
+    for table in ["presentationmodel", "slidemodel"]:
+        columns = [column["name"] for column in inspector.get_columns(table)]
+        if "user_id" not in columns:
+            connection.execute(
+                text(f"ALTER TABLE {table} ADD COLUMN user_id VARCHAR(255)")
+            )
+        connection.execute(
+            text(f"UPDATE {table} SET user_id = 'default_user' WHERE user_id IS NULL")
+        )
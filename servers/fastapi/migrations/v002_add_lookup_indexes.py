@@ -0,0 +1,32 @@
+from sqlalchemy import Index, MetaData, Table, inspect
+from sqlalchemy.engine import Connection
+
+VERSION = 2
+DESCRIPTION = "Index columns used to look up presentations, slides, images and layouts"
+
+INDEXES = [
+    ("ix_presentationmodel_user_id_created_at", "presentationmodel", ["user_id", "created_at"]),
+    ("ix_slidemodel_presentation_index", "slidemodel", ["presentation", "index"]),
+    ("ix_slidemodel_user_id", "slidemodel", ["user_id"]),
+    ("ix_imageasset_created_at", "imageasset", ["created_at"]),
+    (
+        "ix_presentation_layout_codes_presentation_id_layout_id",
+        "presentation_layout_codes",
+        ["presentation_id", "layout_id"],
+    ),
+]
+
+
+def upgrade(connection: Connection):
+    """
+    Creates the indexes missing from tables created before they were
+    part of the models. New databases already get them from create_all.
+    """
+    inspector = inspect(connection)
+    metadata = MetaData()
+    for name, table_name, columns in INDEXES:
+        existing_indexes = [index["name"] for index in inspector.get_indexes(table_name)]
+        if name in existing_indexes:
+            continue
+        table = Table(table_name, metadata, autoload_with=connection)
+        Index(name, *[table.c[column] for column in columns]).create(connection)
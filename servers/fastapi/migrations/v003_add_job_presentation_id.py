@@ -0,0 +1,24 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+VERSION = 3
+DESCRIPTION = "Add presentation_id to presentation generation jobs"
+
+
+def upgrade(connection: Connection):
+    """
+    Adds the presentation id kept across attempts of a job. Jobs queued
+    before have none and generate a new id on every attempt.
+    """
+    inspector = inspect(connection)
+    columns = [
+        column["name"]
+        for column in inspector.get_columns("presentationgenerationjob")
+    ]
+    if "presentation_id" not in columns:
+        connection.execute(
+            text(
+                "ALTER TABLE presentationgenerationjob "
+                "ADD COLUMN presentation_id VARCHAR(255)"
+            )
+        )
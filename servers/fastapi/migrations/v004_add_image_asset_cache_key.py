@@ -0,0 +1,42 @@
+from sqlalchemy import JSON, column, inspect, select, table, text
+from sqlalchemy.engine import Connection
+
+VERSION = 4
+DESCRIPTION = "Move the image cache key from extras to an indexed column"
+
+
+def upgrade(connection: Connection):
+    """
+    Adds the indexed cache_key column and moves the cache key of
+    existing images out of extras, so lookups don't scan the table.
+    """
+    inspector = inspect(connection)
+    columns = [each["name"] for each in inspector.get_columns("imageasset")]
+    if "cache_key" not in columns:
+        connection.execute(
+            text("ALTER TABLE imageasset ADD COLUMN cache_key VARCHAR(255)")
+        )
+
+    image_asset = table(
+        "imageasset", column("id"), column("extras", JSON), column("cache_key")
+    )
+    existing_indexes = [index["name"] for index in inspector.get_indexes("imageasset")]
+    if "ix_imageasset_cache_key" not in existing_indexes:
+        connection.execute(
+            text("CREATE INDEX ix_imageasset_cache_key ON imageasset (cache_key)")
+        )
+
+    rows = connection.execute(
+        select(image_asset.c.id, image_asset.c.extras).where(
+            image_asset.c.extras.is_not(None)
+        )
+    ).all()
+    for image_asset_id, extras in rows:
+        if not isinstance(extras, dict) or "cache_key" not in extras:
+            continue
+        cache_key = extras.pop("cache_key")
+        connection.execute(
+            image_asset.update()
+            .where(image_asset.c.id == image_asset_id)
+            .values(cache_key=cache_key, extras=extras)
+        )
@@ -0,0 +1,34 @@
+from typing import Dict, Optional, Union
+
+from pydantic import BaseModel
+
+
+class DatabaseEngineProfile(BaseModel):
+    backend: str
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_timeout: Optional[int] = None
+    pool_recycle: Optional[int] = None
+    pool_pre_ping: Optional[bool] = None
+    # Set on every new SQLite connection, in this order
+    sqlite_pragmas: Optional[Dict[str, Union[str, int]]] = None
+
+    def get_engine_options(self) -> dict:
+        options = {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+        return {key: value for key, value in options.items() if value is not None}
+
+
+class DatabaseDiagnostics(BaseModel):
+    backend: str
+    driver: str
+    profile: DatabaseEngineProfile
+    pool_status: str
+    checked_out_connections: Optional[int] = None
+    # Values reported by the database, may differ from the profile
+    sqlite_pragmas: Optional[Dict[str, Union[str, int]]] = None
@@ -0,0 +1,8 @@
+from typing import Literal
+from pydantic import BaseModel
+
+
+class DocumentLoadProgress(BaseModel):
+    index: int
+    file_path: str
+    status: Literal["loading", "loaded"]
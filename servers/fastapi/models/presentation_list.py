@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import List, Optional, Union
+
+from pydantic import BaseModel
+
+from models.presentation_with_slides import PresentationWithSlides
+
+
+class PresentationSummary(BaseModel):
+    id: str
+    prompt: str
+    n_slides: int
+    language: str
+    title: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class PresentationListResponse(BaseModel):
+    presentations: List[Union[PresentationWithSlides, PresentationSummary]]
+    next_cursor: Optional[str] = None
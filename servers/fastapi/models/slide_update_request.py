@@ -0,0 +1,23 @@
+from typing import Optional
+
+from pydantic import BaseModel, field_validator
+
+
+class SlideUpdateRequest(BaseModel):
+    # Only the fields present in the request are updated
+    id: str
+    layout_group: Optional[str] = None
+    layout: Optional[str] = None
+    index: Optional[int] = None
+    content: Optional[dict] = None
+    html_content: Optional[str] = None
+    speaker_note: Optional[str] = None
+    properties: Optional[dict] = None
+
+    @field_validator("layout_group", "layout", "index", "content", "speaker_note")
+    @classmethod
+    def check_not_null(cls, value):
+        # Can be left out, but not cleared, the slide columns are required
+        if value is None:
+            raise ValueError("can not be null")
+        return value
@@ -9,6 +9,10 @@ from utils.randomizers import get_random_uuid
 
 class ImageAsset(SQLModel, table=True):
     id: str = Field(default_factory=get_random_uuid, primary_key=True)
-    created_at: datetime = Field(sa_column=Column(DateTime, default=datetime.now))
+    created_at: datetime = Field(
+        sa_column=Column(DateTime, default=datetime.now, index=True)
+    )
     path: str
+    # Set while the image is served from the image cache
+    cache_key: Optional[str] = Field(default=None, index=True)
     extras: Optional[dict] = Field(sa_column=Column(JSON), default=None)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import JSON, Column, DateTime
+from sqlalchemy import JSON, Column, DateTime, Index
 from sqlmodel import Field, SQLModel
 
 from models.presentation_layout import PresentationLayoutModel
@@ -10,6 +10,10 @@ from utils.randomizers import get_random_uuid
 
 
 class PresentationModel(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_presentationmodel_user_id_created_at", "user_id", "created_at"),
+    )
+
     id: str = Field(primary_key=True)
     user_id: str  # User ID to associate presentations with users (required)
     prompt: str
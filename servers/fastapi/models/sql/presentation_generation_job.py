@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import JSON, Column, DateTime
+from sqlmodel import Field, SQLModel
+
+from enums.job_status import JobStatus
+from utils.randomizers import get_random_uuid
+
+
+class PresentationGenerationJob(SQLModel, table=True):
+    id: str = Field(default_factory=get_random_uuid, primary_key=True)
+    user_id: str = Field(index=True)
+    # Kept across attempts, so a retried job doesn't save a second presentation
+    presentation_id: Optional[str] = Field(default_factory=get_random_uuid)
+    status: str = Field(default=JobStatus.QUEUED.value, index=True)
+    stage: Optional[str] = None
+    progress: int = 0
+    request: dict = Field(sa_column=Column(JSON))
+    result: Optional[dict] = Field(sa_column=Column(JSON), default=None)
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: datetime = Field(sa_column=Column(DateTime, default=datetime.now))
+    updated_at: datetime = Field(sa_column=Column(DateTime, default=datetime.now))
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import Column, DateTime, Text, JSON
+from sqlalchemy import Column, DateTime, Index, Text, JSON
 from sqlmodel import SQLModel, Field
 
 
@@ -8,6 +8,13 @@ class PresentationLayoutCodeModel(SQLModel, table=True):
     """Model for storing presentation layout codes"""
     
     __tablename__ = "presentation_layout_codes"
+    __table_args__ = (
+        Index(
+            "ix_presentation_layout_codes_presentation_id_layout_id",
+            "presentation_id",
+            "layout_id",
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     presentation_id: str = Field(index=True, description="UUID of the presentation")
@@ -0,0 +1,10 @@
+from datetime import datetime
+from sqlmodel import Field, Column, DateTime, SQLModel
+
+
+class SchemaMigration(SQLModel, table=True):
+    __tablename__ = "schema_migrations"
+
+    version: int = Field(primary_key=True)
+    description: str
+    applied_at: datetime = Field(sa_column=Column(DateTime, default=datetime.now))
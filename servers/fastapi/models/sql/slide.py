@@ -1,12 +1,17 @@
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, Column, JSON, SQLModel
 
 from utils.randomizers import get_random_uuid
 
 
 class SlideModel(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_slidemodel_presentation_index", "presentation", "index"),
+    )
+
     id: str = Field(primary_key=True, default_factory=get_random_uuid)
-    user_id: str  # User ID to associate slides with users (required)
+    user_id: str = Field(index=True)  # User ID to associate slides with users (required)
     presentation: str
     layout_group: str
     layout: str
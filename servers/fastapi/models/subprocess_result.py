@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class SubprocessResult(BaseModel):
+    returncode: int
+    stdout: str
+    stderr: str
@@ -1,4 +1,31 @@
+import os
+
+from services.document_converter_pool import DocumentConverterPool
+from services.http_client_service import HttpClientService
+from services.icon_finder_service import IconFinderService
+from services.image_cache_service import ImageCacheService
+from services.llm_client_pool import LLMClientPool
+from services.office_worker_pool import OfficeWorkerPool
+from services.parsed_document_cache import ParsedDocumentCache
+from services.pdf_rasterizer import PdfRasterizer
+from services.presentation_generation_job_service import (
+    PresentationGenerationJobService,
+)
+from services.subprocess_service import SubprocessService
 from services.temp_file_service import TempFileService
 
 
 TEMP_FILE_SERVICE = TempFileService()
+HTTP_CLIENT_SERVICE = HttpClientService()
+ICON_FINDER_SERVICE = IconFinderService()
+IMAGE_CACHE_SERVICE = ImageCacheService()
+LLM_CLIENT_POOL = LLMClientPool()
+SUBPROCESS_SERVICE = SubprocessService()
+OFFICE_WORKER_POOL = OfficeWorkerPool(
+    os.path.join(TEMP_FILE_SERVICE.base_dir, "office_profiles"),
+    subprocess_service=SUBPROCESS_SERVICE,
+)
+PDF_RASTERIZER = PdfRasterizer()
+DOCUMENT_CONVERTER_POOL = DocumentConverterPool()
+PARSED_DOCUMENT_CACHE = ParsedDocumentCache()
+PRESENTATION_GENERATION_JOB_SERVICE = PresentationGenerationJobService()
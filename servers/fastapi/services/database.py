@@ -1,28 +1,40 @@
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 import os
+from typing import Optional
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
-    create_async_engine,
     async_sessionmaker,
     AsyncSession,
 )
 from sqlmodel import SQLModel
 
+from migrations.runner import run_migrations
+from models.database_engine_profile import DatabaseDiagnostics
 from models.sql.image_asset import ImageAsset
 from models.sql.key_value import KeyValueSqlModel
 from models.sql.ollama_pull_status import OllamaPullStatus
 from models.sql.presentation import PresentationModel
+from models.sql.presentation_generation_job import PresentationGenerationJob
 from models.sql.slide import SlideModel
 from models.sql.presentation_layout_code import PresentationLayoutCodeModel
 from models.sql.template import TemplateModel
 from models.sql.organisation import Organisation
 from models.sql.user import User
-from utils.db_utils import get_database_url_and_connect_args
+from utils.db_utils import (
+    create_database_engine,
+    get_database_engine_profile,
+    get_database_url_and_connect_args,
+)
 
 
 database_url, connect_args = get_database_url_and_connect_args()
+database_engine_profile = get_database_engine_profile(database_url)
 
-sql_engine: AsyncEngine = create_async_engine(database_url, connect_args=connect_args)
+sql_engine: AsyncEngine = create_database_engine(
+    database_url, connect_args, database_engine_profile
+)
 async_session_maker = async_sessionmaker(sql_engine, expire_on_commit=False)
 
 
@@ -31,10 +43,27 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@asynccontextmanager
+async def unit_of_work(
+    session_maker: Optional[async_sessionmaker] = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Opens a session for one database step of a long running task, like
+    loading or saving a streamed generation, and commits it when the step
+    succeeds. The connection goes back to the pool when the step ends
+    instead of being held while the task waits on the LLM.
+    """
+    async with (session_maker or async_session_maker)() as session:
+        async with session.begin():
+            yield session
+
+
 # Container DB (Lives inside the container)
 container_db_url = "sqlite+aiosqlite:////app/container.db"
-container_db_engine: AsyncEngine = create_async_engine(
-    container_db_url, connect_args={"check_same_thread": False}
+container_db_engine: AsyncEngine = create_database_engine(
+    container_db_url,
+    {"check_same_thread": False},
+    get_database_engine_profile(container_db_url),
 )
 container_db_async_session_maker = async_sessionmaker(
     container_db_engine, expire_on_commit=False
@@ -61,9 +90,11 @@ async def create_db_and_tables():
                     TemplateModel.__table__,
                     Organisation.__table__,
                     User.__table__,
+                    PresentationGenerationJob.__table__,
                 ],
             )
         )
+    await run_migrations(sql_engine)
 
     async with container_db_engine.begin() as conn:
         await conn.run_sync(
@@ -72,3 +103,29 @@ async def create_db_and_tables():
                 tables=[OllamaPullStatus.__table__],
             )
         )
+
+
+async def get_database_diagnostics() -> DatabaseDiagnostics:
+    """
+    Reports the engine profile and pool usage of the app database,
+    and for SQLite the pragmas the database actually uses.
+    """
+    sqlite_pragmas = None
+    if database_engine_profile.sqlite_pragmas:
+        sqlite_pragmas = {}
+        async with sql_engine.connect() as conn:
+            for name in database_engine_profile.sqlite_pragmas:
+                sqlite_pragmas[name] = (
+                    await conn.execute(text(f"PRAGMA {name}"))
+                ).scalar()
+
+    pool = sql_engine.pool
+    checked_out = getattr(pool, "checkedout", None)
+    return DatabaseDiagnostics(
+        backend=database_engine_profile.backend,
+        driver=sql_engine.dialect.driver,
+        profile=database_engine_profile,
+        pool_status=pool.status(),
+        checked_out_connections=checked_out() if checked_out else None,
+        sqlite_pragmas=sqlite_pragmas,
+    )
@@ -0,0 +1,57 @@
+import asyncio
+import multiprocessing
+from importlib.metadata import version
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from utils.document_converter_worker import init_document_converter, parse_to_markdown
+from utils.get_env import get_document_converter_workers_env
+from utils.parsers import parse_int_or_none
+
+DEFAULT_DOCUMENT_CONVERTER_WORKERS = 2
+
+# Identifies the converter output, parsed documents are cached per options
+DOCUMENT_CONVERTER_OPTIONS = f"docling={version('docling')};format=markdown;ocr=false"
+
+
+class DocumentConverterPool:
+    """
+    Converts documents to markdown with Docling on a pool of worker processes.
+    - Every worker builds its converter once and keeps pipelines and models loaded
+    - Files wait in the pool's queue until a worker is free
+    - Conversions never block the event loop
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or (
+            parse_int_or_none(get_document_converter_workers_env())
+            or DEFAULT_DOCUMENT_CONVERTER_WORKERS
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers don't inherit threads and locks of the server process
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_document_converter,
+            )
+        return self._executor
+
+    async def parse_to_markdown(self, file_path: str) -> str:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), parse_to_markdown, file_path
+            )
+        except BrokenProcessPool:
+            # A crashed worker breaks the pool, next call starts a new one
+            self.shutdown()
+            raise
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
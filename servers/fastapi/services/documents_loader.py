@@ -1,8 +1,7 @@
 import mimetypes
 from fastapi import HTTPException
 import os, asyncio
-from typing import List, Tuple
-import pdfplumber
+from typing import AsyncGenerator, List, Optional, Tuple
 
 from constants.documents import (
     PDF_MIME_TYPES,
@@ -10,15 +9,44 @@ from constants.documents import (
     TEXT_MIME_TYPES,
     WORD_TYPES,
 )
-from services.docling_service import DoclingService
+from enums.pdf_text_extraction_mode import PdfTextExtractionMode
+from models.document_load_progress import DocumentLoadProgress
+from services import DOCUMENT_CONVERTER_POOL, PARSED_DOCUMENT_CACHE, PDF_RASTERIZER
+from services.document_converter_pool import DOCUMENT_CONVERTER_OPTIONS
+from services.pdf_text_extractor import PDF_TEXT_EXTRACTOR_OPTIONS, extract_pdf_markdown
+from utils.get_env import (
+    get_documents_loader_concurrency_env,
+    get_pdf_text_extraction_mode_env,
+)
+from utils.parsers import parse_int_or_none
+
+DEFAULT_DOCUMENTS_LOADER_CONCURRENCY = 4
+PDF_PAGE_IMAGES_DPI = 300
+
+
+def get_pdf_text_extraction_mode() -> PdfTextExtractionMode:
+    try:
+        return PdfTextExtractionMode(get_pdf_text_extraction_mode_env() or "auto")
+    except ValueError:
+        return PdfTextExtractionMode.AUTO
 
 
 class DocumentsLoader:
 
-    def __init__(self, file_paths: List[str]):
+    def __init__(
+        self,
+        file_paths: List[str],
+        max_concurrency: Optional[int] = None,
+        pdf_text_extraction_mode: Optional[PdfTextExtractionMode] = None,
+    ):
         self._file_paths = file_paths
-
-        self.docling_service = DoclingService()
+        self.max_concurrency = max_concurrency or (
+            parse_int_or_none(get_documents_loader_concurrency_env())
+            or DEFAULT_DOCUMENTS_LOADER_CONCURRENCY
+        )
+        self.pdf_text_extraction_mode = (
+            pdf_text_extraction_mode or get_pdf_text_extraction_mode()
+        )
 
         self._documents: List[str] = []
         self._images: List[List[str]] = []
@@ -37,39 +65,110 @@ class DocumentsLoader:
         load_text: bool = True,
         load_images: bool = False,
     ):
-        documents: List[str] = []
-        images: List[str] = []
+        async for _ in self.load_documents_with_progress(
+            temp_dir, load_text, load_images
+        ):
+            pass
 
+    async def load_documents_with_progress(
+        self,
+        temp_dir: str,
+        load_text: bool = True,
+        load_images: bool = False,
+    ) -> AsyncGenerator[DocumentLoadProgress, None]:
+        """
+        Loads up to max_concurrency files at the same time and yields
+        progress of every file as it starts and finishes loading.
+        Documents and images keep the order of the file paths.
+        """
         for file_path in self._file_paths:
             if not os.path.exists(file_path):
                 raise HTTPException(
                     status_code=404, detail=f"File {file_path} not found"
                 )
 
-            document = ""
-            imgs = []
+        documents: List[str] = [""] * len(self._file_paths)
+        images: List[List[str]] = [[] for _ in self._file_paths]
+        progress_queue: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-            mime_type = mimetypes.guess_type(file_path)[0]
-            if mime_type in PDF_MIME_TYPES:
-                document, imgs = await self.load_pdf(
-                    file_path, load_text, load_images, temp_dir
-                )
-            elif mime_type in TEXT_MIME_TYPES:
-                document = await self.load_text(file_path)
-            elif mime_type in POWERPOINT_TYPES:
-                document = self.load_powerpoint(file_path)
-            elif mime_type in WORD_TYPES:
-                document = self.load_msword(file_path)
+        async def load(index: int, file_path: str):
+            try:
+                async with semaphore:
+                    progress_queue.put_nowait(
+                        DocumentLoadProgress(
+                            index=index, file_path=file_path, status="loading"
+                        )
+                    )
+                    # Page images of every file get their own directory
+                    documents[index], images[index] = await self.load_document(
+                        file_path,
+                        load_text,
+                        load_images,
+                        os.path.join(temp_dir, str(index)),
+                    )
+                    progress_queue.put_nowait(
+                        DocumentLoadProgress(
+                            index=index, file_path=file_path, status="loaded"
+                        )
+                    )
+            except Exception as e:
+                progress_queue.put_nowait(e)
 
-            documents.append(document)
-            images.append(imgs)
+        tasks = [
+            asyncio.create_task(load(index, file_path))
+            for index, file_path in enumerate(self._file_paths)
+        ]
+        try:
+            loaded = 0
+            while loaded < len(tasks):
+                progress = await progress_queue.get()
+                if isinstance(progress, Exception):
+                    raise progress
+                if progress.status == "loaded":
+                    loaded += 1
+                yield progress
+        finally:
+            # Stops loading the other files if one fails or the caller stops
+            for task in tasks:
+                task.cancel()
 
         self._documents = documents
         self._images = images
 
+    async def load_document(
+        self,
+        file_path: str,
+        load_text: bool,
+        load_images: bool,
+        temp_dir: str,
+    ) -> Tuple[str, List[str]]:
+        document = ""
+        imgs = []
+
+        mime_type = mimetypes.guess_type(file_path)[0]
+        if mime_type in TEXT_MIME_TYPES:
+            return await self.load_text(file_path), imgs
+        if mime_type not in PDF_MIME_TYPES + POWERPOINT_TYPES + WORD_TYPES:
+            return document, imgs
+
+        # Hashed once, every parsed form of the file is cached under this hash
+        file_hash = await PARSED_DOCUMENT_CACHE.get_file_hash(file_path)
+        if mime_type in PDF_MIME_TYPES:
+            document, imgs = await self.load_pdf(
+                file_path, file_hash, load_text, load_images, temp_dir
+            )
+        elif mime_type in POWERPOINT_TYPES:
+            document = await self.load_powerpoint(file_path, file_hash)
+        elif mime_type in WORD_TYPES:
+            document = await self.load_msword(file_path, file_hash)
+
+        return document, imgs
+
     async def load_pdf(
         self,
         file_path: str,
+        file_hash: str,
         load_text: bool,
         load_images: bool,
         temp_dir: str,
@@ -78,10 +177,12 @@ class DocumentsLoader:
         document: str = ""
 
         if load_text:
-            document = self.docling_service.parse_to_markdown(file_path)
+            document = await self.parse_pdf_to_markdown(file_path, file_hash)
 
         if load_images:
-            image_paths = await self.get_page_images_from_pdf_async(file_path, temp_dir)
+            image_paths = await self.get_page_images_from_pdf_async(
+                file_path, file_hash, temp_dir
+            )
 
         return document, image_paths
 
@@ -89,19 +190,71 @@ class DocumentsLoader:
         with open(file_path, "r") as file:
             return await asyncio.to_thread(file.read)
 
-    def load_msword(self, file_path: str) -> str:
-        return self.docling_service.parse_to_markdown(file_path)
+    async def load_msword(self, file_path: str, file_hash: str) -> str:
+        return await self.parse_to_markdown(file_path, file_hash)
 
-    def load_powerpoint(self, file_path: str) -> str:
-        return self.docling_service.parse_to_markdown(file_path)
+    async def load_powerpoint(self, file_path: str, file_hash: str) -> str:
+        return await self.parse_to_markdown(file_path, file_hash)
 
-    def get_page_images_from_pdf(self, file_path: str, temp_dir: str):
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                img = page.to_image(resolution=300)
-                img.save(os.path.join(temp_dir, f"page_{page.page_number}.png"))
+    async def parse_to_markdown(self, file_path: str, file_hash: str) -> str:
+        cache_key = PARSED_DOCUMENT_CACHE.get_cache_key(
+            file_hash, DOCUMENT_CONVERTER_OPTIONS
+        )
+        document = await PARSED_DOCUMENT_CACHE.get_markdown(cache_key)
+        if document is None:
+            document = await DOCUMENT_CONVERTER_POOL.parse_to_markdown(file_path)
+            await PARSED_DOCUMENT_CACHE.set_markdown(cache_key, document)
+        return document
+
+    async def parse_pdf_to_markdown(self, file_path: str, file_hash: str) -> str:
+        """
+        Reads the text layer directly when the PDF has a simple layout,
+        Docling is only used for PDFs which need layout analysis.
+        PDFs found to need it skip the layout check when loaded again.
+        """
+        if self.pdf_text_extraction_mode == PdfTextExtractionMode.DOCLING:
+            return await self.parse_to_markdown(file_path, file_hash)
+
+        check_layout = self.pdf_text_extraction_mode == PdfTextExtractionMode.AUTO
+        cache_key = PARSED_DOCUMENT_CACHE.get_cache_key(
+            file_hash,
+            f"{PDF_TEXT_EXTRACTOR_OPTIONS};check_layout={check_layout}",
+        )
+        document = await PARSED_DOCUMENT_CACHE.get_markdown(cache_key)
+        if document is not None:
+            return document
+
+        # Empty entry marks PDFs the layout check left to Docling
+        complex_layout_key = PARSED_DOCUMENT_CACHE.get_cache_key(
+            file_hash, f"{PDF_TEXT_EXTRACTOR_OPTIONS};complex_layout"
+        )
+        if (
+            check_layout
+            and await PARSED_DOCUMENT_CACHE.get_markdown(complex_layout_key) is not None
+        ):
+            return await self.parse_to_markdown(file_path, file_hash)
+
+        document = await asyncio.to_thread(
+            extract_pdf_markdown, file_path, check_layout
+        )
+        if document is None:
+            print(f"Using Docling for PDF with complex layout: {file_path}")
+            await PARSED_DOCUMENT_CACHE.set_markdown(complex_layout_key, "")
+            # Cached under the converter's own options by parse_to_markdown
+            return await self.parse_to_markdown(file_path, file_hash)
+        await PARSED_DOCUMENT_CACHE.set_markdown(cache_key, document)
+        return document
 
-    async def get_page_images_from_pdf_async(self, file_path: str, temp_dir: str):
-        return await asyncio.to_thread(
-            self.get_page_images_from_pdf, file_path, temp_dir
+    async def get_page_images_from_pdf_async(
+        self, file_path: str, file_hash: str, temp_dir: str
+    ) -> List[str]:
+        cache_key = PARSED_DOCUMENT_CACHE.get_cache_key(
+            file_hash, f"page_images;dpi={PDF_PAGE_IMAGES_DPI}"
         )
+        image_paths = await PARSED_DOCUMENT_CACHE.get_images(cache_key, temp_dir)
+        if image_paths is None:
+            image_paths = await PDF_RASTERIZER.rasterize_all(
+                file_path, temp_dir, dpi=PDF_PAGE_IMAGES_DPI
+            )
+            await PARSED_DOCUMENT_CACHE.set_images(cache_key, image_paths)
+        return image_paths
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Dict
+import aiohttp
+
+# Keep-alive connection pool of every client session
+HTTP_CLIENT_LIMIT = 100
+HTTP_CLIENT_LIMIT_PER_HOST = 20
+HTTP_CLIENT_DNS_CACHE_TTL = 300
+HTTP_CLIENT_KEEPALIVE_TIMEOUT = 30
+
+HTTP_CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=300, connect=10)
+
+
+class HttpClientService:
+    """
+    Shares pooled aiohttp client sessions for the lifetime of the app, so that
+    outbound calls reuse connections instead of paying for new TLS handshakes.
+    - external: third party APIs and downloads, honours proxy environment variables
+    - internal: calls to the Next.js server or Ollama, never routed through a proxy
+
+    Sessions are created lazily on the running event loop and closed by
+    app_lifespan on shutdown.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._loop = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        return self._get_or_create_session("external", trust_env=True)
+
+    def get_internal_session(self) -> aiohttp.ClientSession:
+        return self._get_or_create_session("internal", trust_env=False)
+
+    def _get_or_create_session(
+        self, name: str, trust_env: bool
+    ) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sessions are bound to the event loop they were created on
+            self._sessions = {}
+            self._loop = loop
+
+        session = self._sessions.get(name)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CLIENT_LIMIT,
+                limit_per_host=HTTP_CLIENT_LIMIT_PER_HOST,
+                ttl_dns_cache=HTTP_CLIENT_DNS_CACHE_TTL,
+                keepalive_timeout=HTTP_CLIENT_KEEPALIVE_TIMEOUT,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=HTTP_CLIENT_TIMEOUT,
+                trust_env=trust_env,
+            )
+            self._sessions[name] = session
+        return session
+
+    async def close(self):
+        sessions = list(self._sessions.values())
+        self._sessions = {}
+        self._loop = None
+        for session in sessions:
+            await session.close()
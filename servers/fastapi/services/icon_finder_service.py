@@ -1,40 +1,138 @@
 import asyncio
+import hashlib
 import json
+import threading
+from typing import Dict, List, Tuple
 import chromadb
 from chromadb.config import Settings
 from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 
+from enums.icon_index_backend import IconIndexBackend
+from services.icon_index import NumpyIconIndex
+from services.icon_search_cache import IconSearchCache
+from utils.get_env import get_icon_index_backend_env
+
+# Concurrent searches arriving within this window (seconds) are merged into one batch
+ICON_SEARCH_BATCH_WINDOW = 0.005
+
+NUMPY_ICON_INDEX_DIRECTORY = "chroma/icons_index"
+
+
+def get_icon_index_backend() -> IconIndexBackend:
+    try:
+        return IconIndexBackend(get_icon_index_backend_env() or "chroma")
+    except ValueError:
+        return IconIndexBackend.CHROMA
+
 
 class IconFinderService:
     def __init__(self):
         self.collection_name = "icons"
-        self.client = chromadb.PersistentClient(
-            path="chroma", settings=Settings(anonymized_telemetry=False)
-        )
-        print('Initializing icons collection...')
-        self._initialize_icons_collection()
-        print('Icons collection initialized.')
+        self.client = None
+        self.collection = None
+        self.numpy_index = None
+        self.icon_documents_hash = None
+        self.embedding_function = None
+        self.cache = IconSearchCache()
+        self._initialized = False
+        self._initialize_lock = threading.Lock()
+
+        # Searches waiting for the next batch, grouped by k
+        self._pending_searches: Dict[int, List[Tuple[str, asyncio.Future]]] = {}
+        self._flush_handle = None
+        self._flush_loop = None
+        self._batch_tasks = set()
+
+    def initialize(self):
+        """
+        Loads the embedding model and the icon index of the selected backend.
+        Runs only once per process, concurrent callers wait for the first one.
+        """
+        if self._initialized:
+            return
+
+        with self._initialize_lock:
+            if self._initialized:
+                return
+
+            print("Initializing icons collection...")
+            self._initialize_embedding_function()
+            if get_icon_index_backend() == IconIndexBackend.NUMPY:
+                self._initialize_numpy_index()
+            else:
+                self.client = chromadb.PersistentClient(
+                    path="chroma", settings=Settings(anonymized_telemetry=False)
+                )
+                self._initialize_icons_collection()
+
+            # Loads the ONNX session eagerly so that concurrent queries
+            # don't race on the embedding function's lazy model loading
+            self.embedding_function(["icon"])
+            self.cache.invalidate(self._get_index_version())
+            self._initialized = True
+            print("Icons collection initialized.")
+
+    async def warm_up(self):
+        """
+        Initializes the service off the event loop and removes cached search
+        results of previous icon index versions.
+        """
+        await asyncio.to_thread(self.initialize)
+        await self.cache.delete_stale_entries()
+
+    def _get_index_version(self) -> str:
+        # Changes whenever the index is rebuilt from a different icon corpus
+        if self.numpy_index:
+            # Retagged icons keep their ids but change search results
+            ids = [*self.numpy_index.ids, self.icon_documents_hash or ""]
+        elif self.collection is not None:
+            ids = self.collection.get(include=[])["ids"]
+        else:
+            ids = []
+        backend = get_icon_index_backend().value
+        digest = hashlib.sha256("\n".join([backend, *sorted(ids)]).encode())
+        return digest.hexdigest()[:16]
+
+    def _initialize_embedding_function(self):
+        if self.embedding_function is not None:
+            return
+        embedding_function = ONNXMiniLM_L6_V2()
+        embedding_function.DOWNLOAD_PATH = "chroma/models"
+        embedding_function._download_model_if_not_exists()
+        self.embedding_function = embedding_function
+
+    def embed(self, texts: List[str]) -> List:
+        """
+        Embeds texts with the ONNX MiniLM model of the icon index,
+        so other services don't load a second copy of it.
+        """
+        if self.embedding_function is None:
+            with self._initialize_lock:
+                self._initialize_embedding_function()
+        return self.embedding_function(texts)
+
+    def _get_icon_documents(self) -> Tuple[List[str], List[str]]:
+        with open("assets/icons.json", "r") as f:
+            icons = json.load(f)
+
+        documents = []
+        ids = []
+
+        for i, each in enumerate(icons["icons"]):
+            if each["name"].split("-")[-1] == "bold":
+                doc_text = f"{each['name']} {each['tags']}"
+                documents.append(doc_text)
+                ids.append(each["name"])
+
+        return documents, ids
 
     def _initialize_icons_collection(self):
-        self.embedding_function = ONNXMiniLM_L6_V2()
-        self.embedding_function.DOWNLOAD_PATH = "chroma/models"
-        self.embedding_function._download_model_if_not_exists()
         try:
             self.collection = self.client.get_collection(
                 self.collection_name, embedding_function=self.embedding_function
             )
         except Exception:
-            with open("assets/icons.json", "r") as f:
-                icons = json.load(f)
-
-            documents = []
-            ids = []
-
-            for i, each in enumerate(icons["icons"]):
-                if each["name"].split("-")[-1] == "bold":
-                    doc_text = f"{each['name']} {each['tags']}"
-                    documents.append(doc_text)
-                    ids.append(each["name"])
+            documents, ids = self._get_icon_documents()
 
             if documents:
                 self.collection = self.client.create_collection(
@@ -44,10 +142,114 @@ class IconFinderService:
                 )
                 self.collection.add(documents=documents, ids=ids)
 
-    async def search_icons(self, query: str, k: int = 1):
-        result = await asyncio.to_thread(
-            self.collection.query,
-            query_texts=[query],
-            n_results=k,
+    def _initialize_numpy_index(self):
+        documents, ids = self._get_icon_documents()
+        self.icon_documents_hash = NumpyIconIndex.get_documents_hash(documents, ids)
+        # Rebuilt when icons were added, renamed or retagged in icons.json
+        self.numpy_index = NumpyIconIndex.load(
+            NUMPY_ICON_INDEX_DIRECTORY, self.icon_documents_hash
         )
-        return [f"/static/icons/bold/{each}.png" for each in result["ids"][0]]
+        if not self.numpy_index:
+            print("Building numpy icon index...")
+            self.numpy_index = NumpyIconIndex.build(
+                NUMPY_ICON_INDEX_DIRECTORY, documents, ids, self.embedding_function
+            )
+
+    def _search_numpy_index(self, queries: List[str], k: int) -> List[List[str]]:
+        query_embeddings = self.embedding_function(queries)
+        return self.numpy_index.search(query_embeddings, k)
+
+    async def search_icons(self, query: str, k: int = 1) -> List[str]:
+        """
+        Searches icons for a single query. Concurrent calls are merged into
+        one batched search by the micro-batching layer.
+        """
+        loop = asyncio.get_running_loop()
+        if self._flush_loop is not loop:
+            # Pending batch belongs to an event loop that is no longer running
+            self._pending_searches = {}
+            self._flush_handle = None
+            self._flush_loop = loop
+
+        future = loop.create_future()
+        self._pending_searches.setdefault(k, []).append((query, future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                ICON_SEARCH_BATCH_WINDOW, self._flush_pending_searches
+            )
+        return await future
+
+    async def search_icons_batch(
+        self, queries: List[str], k: int = 1
+    ) -> List[List[str]]:
+        """
+        Embeds all queries in one forward pass and queries the collection once.
+        Returns icon paths for every query, in the same order as queries.
+        """
+        if not queries:
+            return []
+        if not self._initialized:
+            await self.warm_up()
+
+        icons_by_query, missed_queries = await self.cache.get_many(queries, k)
+        if missed_queries:
+            if self.numpy_index:
+                ids_list = await asyncio.to_thread(
+                    self._search_numpy_index, missed_queries, k
+                )
+            else:
+                result = await asyncio.to_thread(
+                    self.collection.query,
+                    query_texts=missed_queries,
+                    n_results=k,
+                )
+                ids_list = result["ids"]
+
+            searched_icons_by_query = {
+                query: [f"/static/icons/bold/{each}.png" for each in ids]
+                for query, ids in zip(missed_queries, ids_list)
+            }
+            await self.cache.set_many(searched_icons_by_query, k)
+            icons_by_query.update(searched_icons_by_query)
+
+        # Variants of a missed query are only searched under the first of them
+        normalize_query = self.cache.normalize_query
+        icons_by_normalized_query = {
+            normalize_query(query): icons for query, icons in icons_by_query.items()
+        }
+        return [icons_by_normalized_query[normalize_query(query)] for query in queries]
+
+    def _flush_pending_searches(self):
+        pending_searches = self._pending_searches
+        self._pending_searches = {}
+        self._flush_handle = None
+
+        for k, searches in pending_searches.items():
+            task = asyncio.create_task(self._run_batched_searches(searches, k))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batched_searches(
+        self, searches: List[Tuple[str, asyncio.Future]], k: int
+    ):
+        # Same query asked by multiple slides is only searched once
+        queries = list(dict.fromkeys(query for query, _ in searches))
+        try:
+            results = await self.search_icons_batch(queries, k)
+        except BaseException as e:
+            # Callers wait on their futures, so they end with the batch
+            for _, future in searches:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if isinstance(e, Exception):
+                return
+            raise
+
+        results_by_query = dict(zip(queries, results))
+        for query, future in searches:
+            if not future.done():
+                future.set_result(results_by_query[query])
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+from typing import Callable, List, Optional
+import numpy as np
+
+
+class NumpyIconIndex:
+    """
+    In-memory icon index backed by a memory-mapped float32 embedding matrix.
+    Embeddings are L2 normalized, so the dot product is the cosine similarity.
+    """
+
+    EMBEDDINGS_FILE = "embeddings.npy"
+    IDS_FILE = "ids.json"
+    DOCUMENTS_HASH_FILE = "documents.sha256"
+
+    def __init__(self, embeddings: np.ndarray, ids: List[str]):
+        self.embeddings = embeddings
+        self.ids = ids
+
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    @staticmethod
+    def get_documents_hash(documents: List[str], ids: List[str]) -> str:
+        return hashlib.sha256(json.dumps([ids, documents]).encode()).hexdigest()
+
+    @classmethod
+    def load(
+        cls, directory: str, documents_hash: Optional[str] = None
+    ) -> Optional["NumpyIconIndex"]:
+        """
+        Returns None if the index is missing, or if documents_hash is given
+        and the index was built from other documents.
+        """
+        embeddings_path = os.path.join(directory, cls.EMBEDDINGS_FILE)
+        ids_path = os.path.join(directory, cls.IDS_FILE)
+        if not (os.path.exists(embeddings_path) and os.path.exists(ids_path)):
+            return None
+
+        if documents_hash is not None:
+            try:
+                with open(os.path.join(directory, cls.DOCUMENTS_HASH_FILE), "r") as f:
+                    if f.read().strip() != documents_hash:
+                        return None
+            except OSError:
+                return None
+
+        with open(ids_path, "r") as f:
+            ids = json.load(f)
+        # Memory mapped, so workers share the page cache instead of copying
+        embeddings = np.load(embeddings_path, mmap_mode="r")
+        if embeddings.shape[0] != len(ids):
+            return None
+        return cls(embeddings, ids)
+
+    @classmethod
+    def build(
+        cls,
+        directory: str,
+        documents: List[str],
+        ids: List[str],
+        embed: Callable[[List[str]], List],
+    ) -> "NumpyIconIndex":
+        os.makedirs(directory, exist_ok=True)
+        embeddings = cls._normalize(embed(documents))
+
+        np.save(os.path.join(directory, cls.EMBEDDINGS_FILE), embeddings)
+        with open(os.path.join(directory, cls.IDS_FILE), "w") as f:
+            json.dump(ids, f)
+        with open(os.path.join(directory, cls.DOCUMENTS_HASH_FILE), "w") as f:
+            f.write(cls.get_documents_hash(documents, ids))
+
+        return cls.load(directory)
+
+    def search(self, query_embeddings, k: int = 1) -> List[List[str]]:
+        """
+        Returns ids of the top k icons for every query embedding, best first.
+        """
+        k = min(k, len(self.ids))
+        if k <= 0:
+            return [[] for _ in query_embeddings]
+
+        queries = self._normalize(query_embeddings)
+        scores = queries @ self.embeddings.T
+
+        if k < scores.shape[1]:
+            top_k = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top_k = np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+
+        top_k_scores = np.take_along_axis(scores, top_k, axis=1)
+        ordered = np.take_along_axis(top_k, np.argsort(-top_k_scores, axis=1), axis=1)
+        return [[self.ids[index] for index in row] for row in ordered]
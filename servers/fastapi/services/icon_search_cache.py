@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete
+from sqlmodel import select
+
+from models.sql.key_value import KeyValueSqlModel
+from services.database import async_session_maker
+
+ICON_SEARCH_CACHE_KEY_PREFIX = "icon_search"
+
+
+class IconSearchCache:
+    """
+    Two-tier cache of icon search results keyed by normalized query and k.
+    - In-process LRU for repeated queries within a worker
+    - Key value table in the database that survives restarts
+
+    Keys contain the version of the icon index, so results of an older
+    index are never served after the index is rebuilt.
+    """
+
+    def __init__(self, max_size: int = 2048, persistent: bool = True):
+        self.max_size = max_size
+        self.persistent = persistent
+        self.version = "default"
+
+        self._lru: OrderedDict[str, List[str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self._write_tasks = set()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def get_key(self, query: str, k: int) -> str:
+        normalized_query = self.normalize_query(query)
+        prefix = ICON_SEARCH_CACHE_KEY_PREFIX
+        return f"{prefix}:{self.version}:{k}:{normalized_query}"
+
+    def get_stats(self) -> Dict[str, int | str]:
+        return {
+            "version": self.version,
+            "size": len(self._lru),
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+        }
+
+    def invalidate(self, version: str):
+        """
+        Clears cached results and starts using keys of the given index version.
+        """
+        with self._lock:
+            self.version = version
+            self._lru.clear()
+
+    def _get_from_memory(self, key: str) -> Optional[List[str]]:
+        with self._lock:
+            icons = self._lru.get(key)
+            if icons is not None:
+                self._lru.move_to_end(key)
+            return icons
+
+    def _set_in_memory(self, key: str, icons: List[str]):
+        with self._lock:
+            self._lru[key] = icons
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_size:
+                self._lru.popitem(last=False)
+
+    async def get_many(
+        self, queries: List[str], k: int
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        """
+        Returns cached icons by query and the list of queries that missed.
+        Queries differing only in case or whitespace miss once, under the
+        first of them.
+        """
+        cached: Dict[str, List[str]] = {}
+        # Queries normalized to the same key share one lookup
+        keys_to_fetch: Dict[str, List[str]] = {}
+
+        for query in queries:
+            key = self.get_key(query, k)
+            if key in keys_to_fetch:
+                keys_to_fetch[key].append(query)
+                continue
+            icons = self._get_from_memory(key)
+            if icons is not None:
+                self.memory_hits += 1
+                cached[query] = icons
+            else:
+                keys_to_fetch[key] = [query]
+
+        if keys_to_fetch and self.persistent:
+            persisted = await self._get_persistent(list(keys_to_fetch))
+            for key, icons in persisted.items():
+                self.persistent_hits += 1
+                self._set_in_memory(key, icons)
+                for query in keys_to_fetch.pop(key):
+                    cached[query] = icons
+
+        self.misses += len(keys_to_fetch)
+        return cached, [key_queries[0] for key_queries in keys_to_fetch.values()]
+
+    async def set_many(self, icons_by_query: Dict[str, List[str]], k: int):
+        keys_and_icons = {
+            self.get_key(query, k): icons for query, icons in icons_by_query.items()
+        }
+        for key, icons in keys_and_icons.items():
+            self._set_in_memory(key, icons)
+
+        if keys_and_icons and self.persistent:
+            # Persisted in background so searches don't wait on database writes
+            task = asyncio.create_task(self._set_persistent(keys_and_icons))
+            self._write_tasks.add(task)
+            task.add_done_callback(self._write_tasks.discard)
+
+    async def _get_persistent(self, keys: List[str]) -> Dict[str, List[str]]:
+        try:
+            async with async_session_maker() as session:
+                rows = await session.scalars(
+                    select(KeyValueSqlModel).where(KeyValueSqlModel.key.in_(keys))
+                )
+                return {row.key: row.value["icons"] for row in rows}
+        except Exception as e:
+            print(f"Error reading icon search cache: {e}")
+            return {}
+
+    async def _set_persistent(self, keys_and_icons: Dict[str, List[str]]):
+        try:
+            async with async_session_maker() as session:
+                await session.execute(
+                    delete(KeyValueSqlModel).where(
+                        KeyValueSqlModel.key.in_(list(keys_and_icons))
+                    )
+                )
+                session.add_all(
+                    [
+                        KeyValueSqlModel(key=key, value={"icons": icons})
+                        for key, icons in keys_and_icons.items()
+                    ]
+                )
+                await session.commit()
+        except Exception as e:
+            print(f"Error writing icon search cache: {e}")
+
+    async def delete_stale_entries(self):
+        """
+        Removes persisted results that belong to other icon index versions.
+        """
+        if not self.persistent:
+            return
+        try:
+            async with async_session_maker() as session:
+                await session.execute(
+                    delete(KeyValueSqlModel)
+                    .where(
+                        KeyValueSqlModel.key.startswith(
+                            f"{ICON_SEARCH_CACHE_KEY_PREFIX}:"
+                        )
+                    )
+                    .where(
+                        ~KeyValueSqlModel.key.startswith(
+                            f"{ICON_SEARCH_CACHE_KEY_PREFIX}:{self.version}:"
+                        )
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            print(f"Error deleting stale icon search cache entries: {e}")
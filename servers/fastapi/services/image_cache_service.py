@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import delete
+from sqlmodel import select
+
+from models.sql.image_asset import ImageAsset
+from services.database import async_session_maker
+from utils.get_env import (
+    get_image_cache_max_size_mb_env,
+    get_image_cache_ttl_hours_env,
+)
+from utils.parsers import parse_int_or_none
+
+DEFAULT_IMAGE_CACHE_TTL_HOURS = 24 * 30
+DEFAULT_IMAGE_CACHE_MAX_SIZE_MB = 1024
+
+# Eviction scans every cached image, so it runs at most once in this interval (seconds)
+IMAGE_CACHE_EVICTION_INTERVAL = 60 * 60
+
+
+def get_image_cache_ttl() -> timedelta:
+    ttl_hours = parse_int_or_none(get_image_cache_ttl_hours_env())
+    if ttl_hours is None:
+        ttl_hours = DEFAULT_IMAGE_CACHE_TTL_HOURS
+    return timedelta(hours=ttl_hours)
+
+
+def get_image_cache_max_size() -> int:
+    max_size_mb = parse_int_or_none(get_image_cache_max_size_mb_env())
+    if max_size_mb is None:
+        max_size_mb = DEFAULT_IMAGE_CACHE_MAX_SIZE_MB
+    return max_size_mb * 1024 * 1024
+
+
+class ImageCacheService:
+    """
+    Caches resolved images by provider, normalized prompt and theme.
+    - Generated images are regular ImageAsset rows in the images directory
+      with a cache_key
+    - Stock image urls are stored as ImageAsset rows pointing to the url
+
+    Eviction only removes the cache_key of generated images, never the file,
+    because presentations keep referencing it.
+    """
+
+    def __init__(self):
+        self._last_eviction = 0.0
+        self._eviction_tasks = set()
+
+    @staticmethod
+    def normalize_prompt(prompt: Optional[str]) -> str:
+        return " ".join((prompt or "").lower().split())
+
+    def get_cache_key(
+        self, provider: str, prompt: str, theme_prompt: Optional[str] = None
+    ) -> str:
+        key = "\n".join(
+            [
+                provider,
+                self.normalize_prompt(prompt),
+                self.normalize_prompt(theme_prompt),
+            ]
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    async def get(self, cache_key: str) -> Optional[str]:
+        """
+        Returns path or url of the latest image cached under the key,
+        if it is not expired and the file still exists.
+        """
+        expires_before = datetime.now() - get_image_cache_ttl()
+        try:
+            async with async_session_maker() as session:
+                image_asset = await session.scalar(
+                    select(ImageAsset)
+                    .where(ImageAsset.cache_key == cache_key)
+                    .where(ImageAsset.created_at >= expires_before)
+                    .order_by(ImageAsset.created_at.desc())
+                    .limit(1)
+                )
+        except Exception as e:
+            print(f"Error reading image cache: {e}")
+            return None
+
+        if not image_asset:
+            return None
+        if image_asset.path.startswith("http") or os.path.exists(image_asset.path):
+            return image_asset.path
+        return None
+
+    async def set_url(self, cache_key: str, url: str, extras: dict):
+        """
+        Stores a stock image url. Generated images are cached by saving the
+        returned ImageAsset, which already contains the cache_key.
+        """
+        try:
+            async with async_session_maker() as session:
+                session.add(
+                    ImageAsset(path=url, extras=extras, cache_key=cache_key)
+                )
+                await session.commit()
+        except Exception as e:
+            print(f"Error writing image cache: {e}")
+
+    def schedule_eviction(self):
+        if time.monotonic() - self._last_eviction < IMAGE_CACHE_EVICTION_INTERVAL:
+            return
+        self._last_eviction = time.monotonic()
+        task = asyncio.create_task(self.evict())
+        self._eviction_tasks.add(task)
+        task.add_done_callback(self._eviction_tasks.discard)
+
+    async def evict(self):
+        """
+        Removes expired entries and the oldest entries above the size limit.
+        - Stock url entries are deleted
+        - Generated images only lose their cache_key
+        """
+        expires_before = datetime.now() - get_image_cache_ttl()
+        max_size = get_image_cache_max_size()
+        try:
+            async with async_session_maker() as session:
+                image_assets = await session.scalars(
+                    select(ImageAsset)
+                    .where(ImageAsset.cache_key.is_not(None))
+                    .order_by(ImageAsset.created_at.desc())
+                )
+
+                total_size = 0
+                urls_to_delete = []
+                for image_asset in image_assets:
+                    is_url = image_asset.path.startswith("http")
+                    if not is_url and os.path.exists(image_asset.path):
+                        total_size += os.path.getsize(image_asset.path)
+                    if image_asset.created_at >= expires_before and (
+                        total_size <= max_size
+                    ):
+                        continue
+
+                    if is_url:
+                        urls_to_delete.append(image_asset.id)
+                    else:
+                        image_asset.cache_key = None
+
+                if urls_to_delete:
+                    await session.execute(
+                        delete(ImageAsset).where(ImageAsset.id.in_(urls_to_delete))
+                    )
+                await session.commit()
+        except Exception as e:
+            print(f"Error evicting image cache: {e}")
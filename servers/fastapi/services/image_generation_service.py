@@ -1,15 +1,16 @@
 import asyncio
 import os
-import aiohttp
 from google import genai
 from google.genai.types import GenerateContentConfig
 from openai import AsyncOpenAI
 from models.image_prompt import ImagePrompt
 from models.sql.image_asset import ImageAsset
+from services import HTTP_CLIENT_SERVICE, IMAGE_CACHE_SERVICE
 from utils.download_helpers import download_file
 from utils.get_env import get_pexels_api_key_env
 from utils.get_env import get_pixabay_api_key_env
 from utils.image_provider import (
+    get_selected_image_provider,
     is_pixels_selected,
     is_pixabay_selected,
     is_gemini_flash_selected,
@@ -38,25 +39,46 @@ class ImageGenerationService:
     def is_stock_provider_selected(self):
         return is_pixels_selected() or is_pixabay_selected()
 
-    async def generate_image(self, prompt: ImagePrompt) -> str | ImageAsset:
+    async def generate_image(
+        self, prompt: ImagePrompt, use_cache: bool = True
+    ) -> str | ImageAsset:
         """
         Generates an image based on the provided prompt.
         - If no image generation function is available, returns a placeholder image.
         - If the stock provider is selected, it uses the prompt directly,
         otherwise it uses the full image prompt with theme.
         - Output Directory is used for saving the generated image not the stock provider.
+        - Previously resolved images for the same provider, prompt and theme
+        are returned as path without calling the provider, unless use_cache is False.
         """
         if not self.image_gen_func:
             print("No image generation function found. Using placeholder image.")
             return "/static/images/placeholder.jpg"
 
-        image_prompt = prompt.get_image_prompt(
-            with_theme=not self.is_stock_provider_selected()
+        is_stock_provider = self.is_stock_provider_selected()
+        image_prompt = prompt.get_image_prompt(with_theme=not is_stock_provider)
+
+        provider = get_selected_image_provider()
+        cache_key = IMAGE_CACHE_SERVICE.get_cache_key(
+            provider.value if provider else "",
+            prompt.prompt,
+            None if is_stock_provider else prompt.theme_prompt,
         )
+        extras = {
+            "prompt": prompt.prompt,
+            "theme_prompt": prompt.theme_prompt,
+        }
+        IMAGE_CACHE_SERVICE.schedule_eviction()
+        if use_cache:
+            cached_image_path = await IMAGE_CACHE_SERVICE.get(cache_key)
+            if cached_image_path:
+                print(f"Request - Using cached Image for {image_prompt}")
+                return cached_image_path
+
         print(f"Request - Generating Image for {image_prompt}")
 
         try:
-            if self.is_stock_provider_selected():
+            if is_stock_provider:
                 image_path = await self.image_gen_func(image_prompt)
             else:
                 image_path = await self.image_gen_func(
@@ -64,14 +86,12 @@ class ImageGenerationService:
                 )
             if image_path:
                 if image_path.startswith("http"):
+                    await IMAGE_CACHE_SERVICE.set_url(cache_key, image_path, extras)
                     return image_path
                 elif os.path.exists(image_path):
+                    # Saving the asset also adds it to the image cache
                     return ImageAsset(
-                        path=image_path,
-                        extras={
-                            "prompt": prompt.prompt,
-                            "theme_prompt": prompt.theme_prompt,
-                        },
+                        path=image_path, extras=extras, cache_key=cache_key
                     )
             raise Exception(f"Image not found at {image_path}")
 
@@ -111,20 +131,20 @@ class ImageGenerationService:
         return image_path
 
     async def get_image_from_pexels(self, prompt: str) -> str:
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            response = await session.get(
-                f"https://api.pexels.com/v1/search?query={prompt}&per_page=1",
-                headers={"Authorization": f"{get_pexels_api_key_env()}"},
-            )
-            data = await response.json()
-            image_url = data["photos"][0]["src"]["large"]
-            return image_url
+        session = HTTP_CLIENT_SERVICE.get_session()
+        response = await session.get(
+            f"https://api.pexels.com/v1/search?query={prompt}&per_page=1",
+            headers={"Authorization": f"{get_pexels_api_key_env()}"},
+        )
+        data = await response.json()
+        image_url = data["photos"][0]["src"]["large"]
+        return image_url
 
     async def get_image_from_pixabay(self, prompt: str) -> str:
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            response = await session.get(
-                f"https://pixabay.com/api/?key={get_pixabay_api_key_env()}&q={prompt}&image_type=photo&per_page=3"
-            )
-            data = await response.json()
-            image_url = data["hits"][0]["largeImageURL"]
-            return image_url
+        session = HTTP_CLIENT_SERVICE.get_session()
+        response = await session.get(
+            f"https://pixabay.com/api/?key={get_pixabay_api_key_env()}&q={prompt}&image_type=photo&per_page=3"
+        )
+        data = await response.json()
+        image_url = data["hits"][0]["largeImageURL"]
+        return image_url
@@ -38,6 +38,7 @@ from models.llm_tool_call import (
     OpenAIToolCallFunction,
 )
 from models.llm_tools import LLMDynamicTool, LLMTool
+from services import LLM_CLIENT_POOL
 from services.llm_tool_calls_handler import LLMToolCallsHandler
 from utils.async_iterator import iterator_to_async
 from utils.dummy_functions import do_nothing_async
@@ -88,6 +89,27 @@ class LLMClient:
 
     # ? Clients
     def _get_client(self):
+        base_url, api_key = self._get_client_base_url_and_api_key()
+        return LLM_CLIENT_POOL.get_client(
+            self.llm_provider, base_url, api_key, self._create_client
+        )
+
+    def _get_client_base_url_and_api_key(self) -> tuple[str | None, str | None]:
+        match self.llm_provider:
+            case LLMProvider.OPENAI:
+                return None, get_openai_api_key_env()
+            case LLMProvider.GOOGLE:
+                return None, get_google_api_key_env()
+            case LLMProvider.ANTHROPIC:
+                return None, get_anthropic_api_key_env()
+            case LLMProvider.OLLAMA:
+                return get_ollama_url_env(), None
+            case LLMProvider.CUSTOM:
+                return get_custom_llm_url_env(), get_custom_llm_api_key_env()
+            case _:
+                return None, None
+
+    def _create_client(self):
         match self.llm_provider:
             case LLMProvider.OPENAI:
                 return self._get_openai_client()
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from enums.llm_provider import LLMProvider
+
+
+class LLMClientPool:
+    """
+    Keeps one SDK client per LLM provider, so that requests share its
+    connection pool instead of creating a new client for every LLM call.
+
+    Clients are keyed by provider, base url and api key. A different key,
+    e.g. after user config updates the environment, replaces the client.
+    """
+
+    def __init__(self):
+        self._clients: Dict[LLMProvider, Tuple[tuple, Any]] = {}
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        provider: LLMProvider,
+        base_url: Optional[str],
+        api_key: Optional[str],
+        create_client: Callable[[], Any],
+    ):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        key = (provider, base_url, api_key)
+        with self._lock:
+            if self._loop is not loop:
+                # Async clients hold connections bound to the event loop
+                self._clients = {}
+                self._loop = loop
+
+            cached = self._clients.get(provider)
+            if cached and cached[0] == key:
+                return cached[1]
+
+            client = create_client()
+            self._clients[provider] = (key, client)
+            return client
+
+    def clear(self):
+        with self._lock:
+            self._clients = {}
@@ -0,0 +1,177 @@
+import asyncio
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+
+from services.subprocess_service import SubprocessService
+from utils.get_env import (
+    get_office_worker_max_jobs_env,
+    get_office_worker_pool_size_env,
+)
+from utils.parsers import parse_int_or_none
+
+DEFAULT_OFFICE_WORKER_POOL_SIZE = 2
+DEFAULT_OFFICE_WORKER_MAX_JOBS = 50
+OFFICE_CONVERSION_TIMEOUT = 500
+OFFICE_HEALTH_CHECK_TIMEOUT = 30
+# Seconds before a failed health check is retried by the next conversion
+OFFICE_HEALTH_CHECK_COOLDOWN = 60
+
+
+class OfficeWorker:
+    """
+    Slot of the office worker pool with its own LibreOffice user profile.
+    The profile is kept between jobs so later conversions skip profile setup,
+    and concurrent conversions never share (and lock) the same profile.
+    """
+
+    def __init__(self, worker_id: int, profiles_directory: str):
+        self.worker_id = worker_id
+        self.profile_directory = os.path.join(
+            profiles_directory, f"worker_{worker_id}"
+        )
+        self.jobs_completed = 0
+
+    @property
+    def profile_url(self) -> str:
+        return Path(self.profile_directory).as_uri()
+
+    def recycle(self):
+        shutil.rmtree(self.profile_directory, ignore_errors=True)
+        self.jobs_completed = 0
+
+
+class OfficeWorkerPool:
+    """
+    Runs headless LibreOffice conversions on a bounded pool of workers.
+    - Jobs wait in a queue until a worker is free
+    - Every worker uses an isolated profile
+    - A worker's profile is recycled after it failed or ran max_jobs_per_worker jobs
+    - While the health check finds no office binary, conversions fail right away
+      instead of waiting for a worker, the first one after a cooldown checks again
+    """
+
+    def __init__(
+        self,
+        profiles_directory: str,
+        size: Optional[int] = None,
+        max_jobs_per_worker: Optional[int] = None,
+        binary: str = "libreoffice",
+        subprocess_service: Optional[SubprocessService] = None,
+    ):
+        self.profiles_directory = profiles_directory
+        self.subprocess_service = subprocess_service or SubprocessService()
+        self.size = size or (
+            parse_int_or_none(get_office_worker_pool_size_env())
+            or DEFAULT_OFFICE_WORKER_POOL_SIZE
+        )
+        self.max_jobs_per_worker = max_jobs_per_worker or (
+            parse_int_or_none(get_office_worker_max_jobs_env())
+            or DEFAULT_OFFICE_WORKER_MAX_JOBS
+        )
+        self.binary = binary
+        # None until the health check ran
+        self.available: Optional[bool] = None
+        self._last_health_check = 0.0
+        self._workers = [
+            OfficeWorker(worker_id, profiles_directory)
+            for worker_id in range(self.size)
+        ]
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop = None
+
+    def _get_queue(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queue is bound to the event loop it was created on
+            self._queue = asyncio.Queue()
+            for worker in self._workers:
+                self._queue.put_nowait(worker)
+            self._loop = loop
+        return self._queue
+
+    async def check_health(self) -> bool:
+        """
+        Checks that the office binary can be started.
+        """
+        self._last_health_check = time.monotonic()
+        try:
+            await self.subprocess_service.run(
+                [self.binary, "--version"], OFFICE_HEALTH_CHECK_TIMEOUT
+            )
+            self.available = True
+        except Exception as e:
+            print(f"Office health check failed: {e}")
+            self.available = False
+        return self.available
+
+    async def convert(
+        self,
+        input_path: str,
+        output_directory: str,
+        convert_to: str = "pdf",
+        env: Optional[dict] = None,
+        timeout: int = OFFICE_CONVERSION_TIMEOUT,
+    ) -> str:
+        """
+        Converts the file with the next free worker and returns the output path.
+        """
+        if self.available is False and (
+            time.monotonic() - self._last_health_check >= OFFICE_HEALTH_CHECK_COOLDOWN
+        ):
+            await self.check_health()
+        if self.available is False:
+            raise Exception(
+                f"LibreOffice conversion failed: {self.binary} could not be started"
+            )
+
+        queue = self._get_queue()
+        worker: OfficeWorker = await queue.get()
+        try:
+            os.makedirs(worker.profile_directory, exist_ok=True)
+            command = [
+                self.binary,
+                f"-env:UserInstallation={worker.profile_url}",
+                "--headless",
+                "--convert-to",
+                convert_to,
+                "--outdir",
+                output_directory,
+                input_path,
+            ]
+            try:
+                result = await self.subprocess_service.run(
+                    command, timeout, env, check=False
+                )
+            except asyncio.CancelledError:
+                worker.recycle()
+                raise
+            except Exception as e:
+                worker.recycle()
+                raise Exception(f"LibreOffice conversion failed: {e}")
+
+            worker.jobs_completed += 1
+            if result.returncode != 0:
+                worker.recycle()
+                raise Exception(
+                    f"LibreOffice conversion failed: {result.stderr or result.stdout}"
+                )
+
+            print(f"LibreOffice conversion output: {result.stdout}")
+            if result.stderr:
+                print(f"LibreOffice conversion warnings: {result.stderr}")
+
+            extension = convert_to.split(":")[0]
+            output_path = os.path.join(
+                output_directory,
+                f"{os.path.splitext(os.path.basename(input_path))[0]}.{extension}",
+            )
+            if not os.path.exists(output_path):
+                raise Exception(f"LibreOffice failed to generate {extension} file")
+            return output_path
+        finally:
+            if worker.jobs_completed >= self.max_jobs_per_worker:
+                worker.recycle()
+            queue.put_nowait(worker)
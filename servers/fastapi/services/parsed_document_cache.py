@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+import os
+import shutil
+from typing import List, Optional
+
+from utils.asset_directory_utils import get_parsed_documents_directory
+from utils.get_env import get_parsed_document_cache_max_size_mb_env
+from utils.parsers import parse_int_or_none
+from utils.randomizers import get_random_uuid
+
+DEFAULT_PARSED_DOCUMENT_CACHE_MAX_SIZE_MB = 1024
+# Eviction walks the whole cache, so it runs once the tracked size crosses the
+# limit, or every this many writes to catch up with other processes' writes
+PARSED_DOCUMENT_CACHE_EVICTION_WRITES = 50
+
+MARKDOWN_FILENAME = "document.md"
+IMAGES_DIRECTORY_NAME = "images"
+
+
+def get_file_sha256(file_path: str) -> str:
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _get_directory_size(directory: str) -> int:
+    size = 0
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            try:
+                size += os.path.getsize(os.path.join(root, filename))
+            except OSError:
+                pass
+    return size
+
+
+class ParsedDocumentCache:
+    """
+    Caches markdown and page images of parsed documents on disk.
+    - Entries are keyed on the SHA-256 of the file and the converter options,
+      so the same file parsed with other options is a different entry
+    - Using an entry marks it as recently used, least recently used entries
+      are removed once the cache is larger than max_size_mb
+    - Size of the cache is tracked across writes, so the cache directory is
+      only walked when the size limit is crossed
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, max_size_mb: Optional[int] = None
+    ):
+        self._directory = directory
+        max_size_mb = max_size_mb or (
+            parse_int_or_none(get_parsed_document_cache_max_size_mb_env())
+            or DEFAULT_PARSED_DOCUMENT_CACHE_MAX_SIZE_MB
+        )
+        self.max_size = max_size_mb * 1024 * 1024
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop = None
+        # Unknown until the first eviction
+        self._size: Optional[int] = None
+        self._writes_since_eviction = 0
+
+    @property
+    def directory(self) -> str:
+        # App data directory is only known once the app is configured
+        return self._directory or get_parsed_documents_directory()
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Lock is bound to the event loop it was first used on
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    async def get_file_hash(self, file_path: str) -> str:
+        return await asyncio.to_thread(get_file_sha256, file_path)
+
+    def get_cache_key(self, file_hash: str, options: str) -> str:
+        """
+        Returns the key of the file with the hash from get_file_hash
+        parsed with the options.
+        """
+        return hashlib.sha256(f"{file_hash}\n{options}".encode()).hexdigest()
+
+    def _get_entry_directory(self, cache_key: str) -> str:
+        return os.path.join(self.directory, cache_key)
+
+    def _touch(self, entry_directory: str):
+        try:
+            os.utime(entry_directory)
+        except OSError:
+            pass
+
+    async def get_markdown(self, cache_key: str) -> Optional[str]:
+        entry_directory = self._get_entry_directory(cache_key)
+        markdown_path = os.path.join(entry_directory, MARKDOWN_FILENAME)
+
+        def read() -> Optional[str]:
+            try:
+                with open(markdown_path, "r") as file:
+                    markdown = file.read()
+            except OSError:
+                return None
+            self._touch(entry_directory)
+            return markdown
+
+        return await asyncio.to_thread(read)
+
+    async def set_markdown(self, cache_key: str, markdown: str):
+        entry_directory = self._get_entry_directory(cache_key)
+
+        def write() -> int:
+            os.makedirs(entry_directory, exist_ok=True)
+            # Written under a temporary name, readers never see a partial file
+            temp_path = os.path.join(entry_directory, f".{get_random_uuid()}")
+            with open(temp_path, "w") as file:
+                file.write(markdown)
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, os.path.join(entry_directory, MARKDOWN_FILENAME))
+            self._touch(entry_directory)
+            return size
+
+        await self._store(write)
+
+    async def get_images(
+        self, cache_key: str, output_directory: str
+    ) -> Optional[List[str]]:
+        """
+        Copies the cached images to the output directory and returns
+        their paths in page order.
+        """
+        entry_directory = self._get_entry_directory(cache_key)
+        images_directory = os.path.join(entry_directory, IMAGES_DIRECTORY_NAME)
+
+        def copy() -> Optional[List[str]]:
+            try:
+                filenames = sorted(
+                    os.listdir(images_directory),
+                    key=lambda filename: int(filename.split(".")[0]),
+                )
+            except (OSError, ValueError):
+                return None
+            os.makedirs(output_directory, exist_ok=True)
+            image_paths = []
+            for filename in filenames:
+                image_path = os.path.join(output_directory, f"page_{filename}")
+                shutil.copyfile(os.path.join(images_directory, filename), image_path)
+                image_paths.append(image_path)
+            self._touch(entry_directory)
+            return image_paths
+
+        try:
+            return await asyncio.to_thread(copy)
+        except OSError as e:
+            print(f"Failed to read cached document images: {e}")
+            return None
+
+    async def set_images(self, cache_key: str, image_paths: List[str]):
+        """
+        Stores images of the document, image_paths must be in page order.
+        """
+        entry_directory = self._get_entry_directory(cache_key)
+        images_directory = os.path.join(entry_directory, IMAGES_DIRECTORY_NAME)
+
+        def write() -> int:
+            # Images are copied next to the entry and swapped in at once
+            temp_directory = os.path.join(entry_directory, f".{get_random_uuid()}")
+            os.makedirs(temp_directory)
+            for page_number, image_path in enumerate(image_paths, start=1):
+                extension = os.path.splitext(image_path)[1]
+                shutil.copyfile(
+                    image_path,
+                    os.path.join(temp_directory, f"{page_number}{extension}"),
+                )
+            size = _get_directory_size(temp_directory)
+            shutil.rmtree(images_directory, ignore_errors=True)
+            os.replace(temp_directory, images_directory)
+            self._touch(entry_directory)
+            return size
+
+        await self._store(write)
+
+    async def _store(self, write):
+        try:
+            async with self._get_lock():
+                size = await asyncio.to_thread(write)
+                self._writes_since_eviction += 1
+                if self._size is not None:
+                    self._size += size
+                if (
+                    self._size is None
+                    or self._size > self.max_size
+                    or self._writes_since_eviction
+                    >= PARSED_DOCUMENT_CACHE_EVICTION_WRITES
+                ):
+                    self._size = await asyncio.to_thread(self.evict)
+                    self._writes_since_eviction = 0
+        except Exception as e:
+            # Caching is best effort, the parsed document is still returned
+            print(f"Failed to cache parsed document: {e}")
+
+    def evict(self) -> int:
+        """
+        Removes least recently used entries until the cache fits max_size
+        and returns the size of the remaining entries.
+        """
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_dir():
+                continue
+            size = _get_directory_size(entry.path)
+            entries.append((entry.stat().st_mtime, size, entry.path))
+            total_size += size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+        return total_size
@@ -0,0 +1,113 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncGenerator, List, Optional, Sequence, Tuple
+
+from utils.get_env import get_pdf_rasterizer_workers_env
+from utils.parsers import parse_int_or_none
+from utils.pdf_render_worker import get_pdf_page_count, render_pdf_page
+
+# Every worker holds its own pdfplumber and image buffers in memory
+MAX_DEFAULT_PDF_RASTERIZER_WORKERS = 4
+
+
+class PdfRasterizer:
+    """
+    Renders PDF pages to images in parallel on a pool of worker processes.
+    The pool is created on first use and shared by every caller.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or (
+            parse_int_or_none(get_pdf_rasterizer_workers_env())
+            or min(os.cpu_count() or 1, MAX_DEFAULT_PDF_RASTERIZER_WORKERS)
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers don't inherit threads and locks of the server process
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def rasterize(
+        self,
+        pdf_path: str,
+        output_directory: str,
+        dpi: int = 150,
+        pages: Optional[Sequence[int]] = None,
+        image_format: str = "png",
+        filename_prefix: str = "page",
+    ) -> AsyncGenerator[Tuple[int, str], None]:
+        """
+        Yields (page_number, image_path) as soon as each page is rendered.
+        - Page numbers start at 1, all pages are rendered if pages is None
+        - Images are saved as {filename_prefix}_{page_number}.{image_format}
+        """
+        os.makedirs(output_directory, exist_ok=True)
+        if pages is None:
+            page_count = await asyncio.to_thread(get_pdf_page_count, pdf_path)
+            pages = range(1, page_count + 1)
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        futures = {}
+        for page_number in pages:
+            output_path = os.path.join(
+                output_directory, f"{filename_prefix}_{page_number}.{image_format}"
+            )
+            future = loop.run_in_executor(
+                executor,
+                render_pdf_page,
+                pdf_path,
+                page_number,
+                output_path,
+                dpi,
+                image_format,
+            )
+            futures[future] = page_number
+
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield futures[future], future.result()
+        except BrokenProcessPool:
+            # A crashed worker breaks the pool, next call starts a new one
+            self.shutdown()
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def rasterize_all(
+        self,
+        pdf_path: str,
+        output_directory: str,
+        dpi: int = 150,
+        pages: Optional[Sequence[int]] = None,
+        image_format: str = "png",
+        filename_prefix: str = "page",
+    ) -> List[str]:
+        """
+        Renders the pages and returns image paths in page order.
+        """
+        image_paths = {}
+        async for page_number, image_path in self.rasterize(
+            pdf_path, output_directory, dpi, pages, image_format, filename_prefix
+        ):
+            image_paths[page_number] = image_path
+        return [image_paths[page_number] for page_number in sorted(image_paths)]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
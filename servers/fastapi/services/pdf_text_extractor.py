@@ -0,0 +1,173 @@
+from collections import Counter
+from typing import List, Optional
+import pdfplumber
+
+# Changes of the markdown output must change this, parsed documents are cached per options
+PDF_TEXT_EXTRACTOR_OPTIONS = "pdfplumber_text=1"
+
+# Pages checked by the layout heuristic
+PDF_TEXT_SAMPLE_PAGES = 5
+# Pages with less text are probably scanned or mostly graphics
+MIN_CHARS_PER_PAGE = 200
+# Pages with an image covering more of the page need layout analysis
+MAX_IMAGE_AREA_RATIO = 0.5
+# Pages with more lines starting right of the middle have multiple columns
+MAX_RIGHT_COLUMN_LINES_RATIO = 0.3
+# Lines with a font this much larger than the body text are headings
+HEADING_FONT_SIZE_RATIO = 1.15
+MAX_HEADING_LEVELS = 3
+
+BULLET_CHARACTERS = ("•", "◦", "▪", "‣", "–", "-", "*")
+
+
+def _get_sample_pages(pdf) -> list:
+    pages = pdf.pages
+    if len(pages) <= PDF_TEXT_SAMPLE_PAGES:
+        return pages
+    step = len(pages) / PDF_TEXT_SAMPLE_PAGES
+    return [pages[int(index * step)] for index in range(PDF_TEXT_SAMPLE_PAGES)]
+
+
+def is_simple_text_pdf(pdf) -> bool:
+    """
+    Checks sample pages for a text layer without tables, large images
+    or multiple columns, which pdfplumber text is good enough for.
+    """
+    sample_pages = _get_sample_pages(pdf)
+    if not sample_pages:
+        return False
+
+    total_chars = sum(len(page.chars) for page in sample_pages)
+    if total_chars < MIN_CHARS_PER_PAGE * len(sample_pages):
+        return False
+
+    for page in sample_pages:
+        page_area = page.width * page.height
+        for image in page.images:
+            image_area = (image["x1"] - image["x0"]) * (image["bottom"] - image["top"])
+            if image_area > page_area * MAX_IMAGE_AREA_RATIO:
+                return False
+
+        lines = page.extract_text_lines()
+        right_column_lines = [
+            line for line in lines if line["x0"] > page.width * 0.45
+        ]
+        if lines and len(right_column_lines) > len(lines) * MAX_RIGHT_COLUMN_LINES_RATIO:
+            return False
+
+        if page.find_tables():
+            return False
+
+    return True
+
+
+def _get_line_font_size(line: dict) -> float:
+    return round(max(char["size"] for char in line["chars"]), 1)
+
+
+def _get_heading_levels(pages_lines: List[List[dict]]) -> dict:
+    """
+    Maps font sizes larger than the body text to heading levels.
+    """
+    font_sizes = Counter()
+    for lines in pages_lines:
+        for line in lines:
+            for char in line["chars"]:
+                font_sizes[round(char["size"], 1)] += 1
+    if not font_sizes:
+        return {}
+
+    body_font_size = font_sizes.most_common(1)[0][0]
+    heading_font_sizes = sorted(
+        {
+            _get_line_font_size(line)
+            for lines in pages_lines
+            for line in lines
+            if _get_line_font_size(line) >= body_font_size * HEADING_FONT_SIZE_RATIO
+        },
+        reverse=True,
+    )
+    return {
+        font_size: min(level, MAX_HEADING_LEVELS)
+        for level, font_size in enumerate(heading_font_sizes, start=1)
+    }
+
+
+def _join_lines(paragraph: str, text: str) -> str:
+    if not paragraph:
+        return text
+    if paragraph.endswith("-") and text[:1].islower():
+        return paragraph[:-1] + text
+    return f"{paragraph} {text}"
+
+
+def pdf_lines_to_markdown(pages_lines: List[List[dict]]) -> str:
+    """
+    Builds markdown from text lines of every page.
+    - Lines in a larger font than the body text become headings
+    - Lines starting with a bullet become list items
+    - Other lines are joined into paragraphs, split where the vertical gap
+      between lines is larger than usual
+    """
+    heading_levels = _get_heading_levels(pages_lines)
+    blocks: List[str] = []
+
+    for lines in pages_lines:
+        paragraph = ""
+        previous_line = None
+        for line in lines:
+            text = line["text"].strip()
+            if not text:
+                continue
+
+            heading_level = heading_levels.get(_get_line_font_size(line))
+            is_bullet = text.startswith(BULLET_CHARACTERS) and len(text) > 1
+            line_height = line["bottom"] - line["top"]
+            follows_previous_line = (
+                previous_line is not None
+                and line["top"] - previous_line["bottom"] <= line_height * 0.8
+            )
+
+            if paragraph and (
+                not follows_previous_line or heading_level is not None or is_bullet
+            ):
+                blocks.append(paragraph)
+                paragraph = ""
+
+            if heading_level is not None:
+                heading_prefix = "#" * heading_level + " "
+                if (
+                    follows_previous_line
+                    and heading_levels.get(_get_line_font_size(previous_line))
+                    == heading_level
+                ):
+                    # Heading wrapped on multiple lines
+                    blocks[-1] = f"{blocks[-1]} {text}"
+                else:
+                    blocks.append(f"{heading_prefix}{text}")
+            elif is_bullet:
+                paragraph = "- " + text.lstrip("".join(BULLET_CHARACTERS)).strip()
+            else:
+                paragraph = _join_lines(paragraph, text)
+            previous_line = line
+
+        if paragraph:
+            blocks.append(paragraph)
+
+    return "\n\n".join(blocks)
+
+
+def extract_pdf_markdown(pdf_path: str, check_layout: bool = True) -> Optional[str]:
+    """
+    Returns markdown of the PDF text layer, or None if check_layout is True
+    and the PDF needs full layout analysis.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        if check_layout and not is_simple_text_pdf(pdf):
+            return None
+        pages_lines = []
+        for page in pdf.pages:
+            pages_lines.append(page.extract_text_lines(return_chars=True))
+            # Frees parsed objects of pages that are already extracted
+            page.close()
+        return pdf_lines_to_markdown(pages_lines)
@@ -0,0 +1,243 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlmodel import select
+
+from enums.job_status import JobStatus
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.presentation_and_path import PresentationPathAndEditPath
+from models.sql.presentation_generation_job import PresentationGenerationJob
+from services.database import async_session_maker
+from utils.get_env import get_presentation_generation_workers_env
+from utils.parsers import parse_int_or_none
+
+DEFAULT_PRESENTATION_GENERATION_WORKERS = 2
+
+# Seconds between checks for queued jobs submitted by other server processes
+JOB_POLL_INTERVAL = 2
+# Running jobs refresh updated_at in this interval (seconds)
+JOB_HEARTBEAT_INTERVAL = 10
+# Running jobs without a heartbeat for this long (seconds) were interrupted
+JOB_STALE_AFTER = 60
+JOB_MAX_ATTEMPTS = 3
+
+GenerationPipeline = Callable[
+    [
+        GeneratePresentationRequest,
+        str,
+        Callable[[str, int], Awaitable[None]],
+        Optional[str],
+    ],
+    Awaitable[PresentationPathAndEditPath],
+]
+
+
+class PresentationGenerationJobService:
+    """
+    Runs presentation generations as background jobs stored in the database.
+    - Submitting only queues the job, a bounded number of workers run the jobs
+    - Stage and progress of running jobs are persisted, so they can be polled
+      from any server process
+    - Jobs interrupted by a restart stop heartbeating and are queued again,
+      up to max_attempts times. Every attempt generates the same presentation id,
+      so a presentation saved by an earlier attempt is only exported again
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        pipeline: Optional[GenerationPipeline] = None,
+        poll_interval: float = JOB_POLL_INTERVAL,
+        heartbeat_interval: float = JOB_HEARTBEAT_INTERVAL,
+        stale_after: float = JOB_STALE_AFTER,
+        max_attempts: int = JOB_MAX_ATTEMPTS,
+    ):
+        self.workers = workers or (
+            parse_int_or_none(get_presentation_generation_workers_env())
+            or DEFAULT_PRESENTATION_GENERATION_WORKERS
+        )
+        self.pipeline = pipeline
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self._worker_tasks: List[asyncio.Task] = []
+        self._job_submitted: Optional[asyncio.Event] = None
+        self._loop = None
+
+    def _get_job_submitted_event(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Event is bound to the event loop it was first used on
+            self._job_submitted = asyncio.Event()
+            self._loop = loop
+        return self._job_submitted
+
+    async def submit(
+        self, request: GeneratePresentationRequest, user_id: str
+    ) -> PresentationGenerationJob:
+        job = PresentationGenerationJob(
+            user_id=user_id, request=request.model_dump(mode="json")
+        )
+        async with async_session_maker() as session:
+            session.add(job)
+            await session.commit()
+        self._get_job_submitted_event().set()
+        return job
+
+    async def get(self, job_id: str) -> Optional[PresentationGenerationJob]:
+        async with async_session_maker() as session:
+            return await session.get(PresentationGenerationJob, job_id)
+
+    def start(self):
+        """
+        Starts the workers on the running event loop.
+        """
+        if self._worker_tasks:
+            return
+        self._worker_tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self):
+        """
+        Stops the workers, jobs they were running are picked up again
+        once they are detected as stale.
+        """
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    async def _work(self):
+        job_submitted = self._get_job_submitted_event()
+        while True:
+            # Cleared before claiming, so jobs submitted meanwhile aren't missed
+            job_submitted.clear()
+            try:
+                job = await self._claim_next_job()
+            except Exception as e:
+                print(f"Failed to claim presentation generation job: {e}")
+                job = None
+
+            if job:
+                # More jobs may be queued, idle workers check again
+                job_submitted.set()
+                await self._run(job)
+                continue
+
+            try:
+                await asyncio.wait_for(job_submitted.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _claim_next_job(self) -> Optional[PresentationGenerationJob]:
+        async with async_session_maker() as session:
+            await self._requeue_stale_jobs(session)
+            job_ids = list(
+                await session.scalars(
+                    select(PresentationGenerationJob.id)
+                    .where(PresentationGenerationJob.status == JobStatus.QUEUED.value)
+                    .order_by(PresentationGenerationJob.created_at)
+                    .limit(self.workers)
+                )
+            )
+            for job_id in job_ids:
+                # Only one worker, of any server process, can move the job out of queued
+                claimed = await session.execute(
+                    update(PresentationGenerationJob)
+                    .where(
+                        PresentationGenerationJob.id == job_id,
+                        PresentationGenerationJob.status == JobStatus.QUEUED.value,
+                    )
+                    .values(
+                        status=JobStatus.RUNNING.value,
+                        attempts=PresentationGenerationJob.attempts + 1,
+                        updated_at=datetime.now(),
+                    )
+                )
+                await session.commit()
+                if claimed.rowcount == 1:
+                    return await session.get(PresentationGenerationJob, job_id)
+        return None
+
+    async def _requeue_stale_jobs(self, session):
+        stale_before = datetime.now() - timedelta(seconds=self.stale_after)
+        is_stale = [
+            PresentationGenerationJob.status == JobStatus.RUNNING.value,
+            PresentationGenerationJob.updated_at < stale_before,
+        ]
+        await session.execute(
+            update(PresentationGenerationJob)
+            .where(
+                *is_stale,
+                PresentationGenerationJob.attempts >= self.max_attempts,
+            )
+            .values(
+                status=JobStatus.FAILED.value,
+                error="Presentation generation was interrupted too many times",
+                updated_at=datetime.now(),
+            )
+        )
+        await session.execute(
+            update(PresentationGenerationJob)
+            .where(*is_stale)
+            .values(status=JobStatus.QUEUED.value, updated_at=datetime.now())
+        )
+        await session.commit()
+
+    async def _update(self, job_id: str, **values):
+        try:
+            async with async_session_maker() as session:
+                await session.execute(
+                    update(PresentationGenerationJob)
+                    .where(PresentationGenerationJob.id == job_id)
+                    .values(updated_at=datetime.now(), **values)
+                )
+                await session.commit()
+        except Exception as e:
+            print(f"Failed to update presentation generation job {job_id}: {e}")
+
+    async def _heartbeat(self, job_id: str):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self._update(job_id)
+
+    async def _run(self, job: PresentationGenerationJob):
+        async def on_progress(stage: str, progress: int):
+            await self._update(job.id, stage=stage, progress=progress)
+
+        pipeline = self.pipeline
+        if pipeline is None:
+            # Imported here, the pipeline depends on the services package
+            from utils.generate_presentation import generate_presentation
+
+            pipeline = generate_presentation
+
+        heartbeat = asyncio.create_task(self._heartbeat(job.id))
+        try:
+            result = await pipeline(
+                GeneratePresentationRequest(**job.request),
+                job.user_id,
+                on_progress,
+                job.presentation_id,
+            )
+        except Exception as e:
+            print(f"Presentation generation job {job.id} failed: {e}")
+            error = e.detail if isinstance(e, HTTPException) else str(e)
+            await self._update(
+                job.id, status=JobStatus.FAILED.value, error=error or repr(e)
+            )
+            return
+        finally:
+            heartbeat.cancel()
+
+        await self._update(
+            job.id,
+            status=JobStatus.COMPLETED.value,
+            stage=None,
+            progress=100,
+            result=result.model_dump(mode="json"),
+        )
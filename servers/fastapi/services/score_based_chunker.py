@@ -1,21 +1,43 @@
 import asyncio
-from typing import List
+import io
+from typing import Iterable, Iterator, List, Tuple, Union
 
 from models.document_chunk import DocumentChunk
 
 
+def iter_lines(text: str) -> Iterator[str]:
+    """
+    Yields lines of the text without splitting all of it at once.
+    """
+    for line in io.StringIO(text):
+        yield line[:-1] if line.endswith("\n") else line
+
+
 class ScoreBasedChunker:
 
-    def extract_headings(self, text: str) -> List[str]:
-        lines = text.split("\n")
+    def extract_sections(
+        self, lines: Iterable[str]
+    ) -> Tuple[List[str], List[List[str]]]:
+        """
+        Reads the lines once and returns the headings and, for every heading,
+        its own line followed by the lines up to the next heading.
+        Lines before the first heading are not part of any section.
+        """
         headings = []
-        
+        sections = []
+
         for line in lines:
-            line = line.strip()
-            if line.startswith("#"):
-                headings.append(line)
-        
-        return headings
+            line_stripped = line.strip()
+            if line_stripped.startswith("#"):
+                headings.append(line_stripped)
+                sections.append([line])
+            elif sections:
+                sections[-1].append(line)
+
+        return headings, sections
+
+    def extract_headings(self, text: str) -> List[str]:
+        return self.extract_sections(iter_lines(text))[0]
 
     def score_headings(self, headings: List[str]) -> List[float]:
         heading_scores = []
@@ -46,17 +68,9 @@ class ScoreBasedChunker:
 
         return heading_scores
 
-    def get_chunks_from_headings(
-        self,
-        text: str,
-        headings: List[str],
-        heading_scores: List[float],
-        top_k: int = 10,
-    ) -> List[DocumentChunk]:
-        if not heading_scores:
-            heading_scores = self.score_headings(headings)
-
-        chunks = []
+    def select_heading_indices(
+        self, heading_scores: List[float], top_k: int
+    ) -> List[int]:
         heading_indices = []
 
         for i, score in enumerate(heading_scores):
@@ -64,7 +78,7 @@ class ScoreBasedChunker:
                 heading_indices.append((i, score))
 
         if len(heading_indices) == 0:
-            return chunks
+            return []
 
         heading_indices.sort(key=lambda x: (-x[1], x[0]))
 
@@ -111,53 +125,62 @@ class ScoreBasedChunker:
 
             selected_indices.sort()
 
-        lines = text.split("\n")
-        heading_positions = {}
-        
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            if line_stripped.startswith("#"):
-                for heading_idx, heading in enumerate(headings):
-                    if heading == line_stripped and heading_idx not in heading_positions:
-                        heading_positions[heading_idx] = i
-                        break
-        
+        return selected_indices
+
+    def get_chunks_from_sections(
+        self,
+        headings: List[str],
+        sections: List[List[str]],
+        heading_scores: List[float],
+        top_k: int = 10,
+    ) -> List[DocumentChunk]:
+        if not heading_scores:
+            heading_scores = self.score_headings(headings)
+
+        selected_indices = self.select_heading_indices(heading_scores, top_k)
+
+        chunks = []
         for i, heading_idx in enumerate(selected_indices):
-            if heading_idx not in heading_positions:
-                continue
-                
-            heading = headings[heading_idx]
-            heading_line_idx = heading_positions[heading_idx]
-            
             if i + 1 < len(selected_indices):
-                next_heading_idx = selected_indices[i + 1]
-                if next_heading_idx in heading_positions:
-                    next_heading_line_idx = heading_positions[next_heading_idx]
-                    content_end = next_heading_line_idx
-                else:
-                    content_end = len(lines)
+                content_end = selected_indices[i + 1]
             else:
-                content_end = len(lines)
+                content_end = len(sections)
 
-            content_lines = lines[heading_line_idx + 1 : content_end]
+            # Content runs until the next selected heading, so sections of
+            # headings that were not selected are included with their heading line
+            content_lines = sections[heading_idx][1:]
+            for section in sections[heading_idx + 1 : content_end]:
+                content_lines.extend(section)
             content = "\n".join(content_lines).strip()
 
             chunk = DocumentChunk(
-                heading=heading,
+                heading=headings[heading_idx],
                 content=content,
                 heading_index=heading_idx,
                 score=heading_scores[heading_idx],
             )
             chunks.append(chunk)
-            
+
         return chunks
 
-    async def get_n_chunks(self, text: str, n: int) -> List[DocumentChunk]:
-        headings = await asyncio.to_thread(self.extract_headings, text)
-        heading_scores = await asyncio.to_thread(self.score_headings, headings)
-        chunks = await asyncio.to_thread(
-            self.get_chunks_from_headings, text, headings, heading_scores, n
+    def get_chunks(
+        self, text: Union[str, Iterable[str]], top_k: int = 10
+    ) -> List[DocumentChunk]:
+        """
+        Chunks markdown given as a string or as an iterable of lines,
+        reading it in a single pass.
+        """
+        lines = iter_lines(text) if isinstance(text, str) else text
+        headings, sections = self.extract_sections(lines)
+        heading_scores = self.score_headings(headings)
+        return self.get_chunks_from_sections(
+            headings, sections, heading_scores, top_k
         )
+
+    async def get_n_chunks(
+        self, text: Union[str, Iterable[str]], n: int
+    ) -> List[DocumentChunk]:
+        chunks = await asyncio.to_thread(self.get_chunks, text, n)
         if len(chunks) < n:
             raise ValueError(f"Only {len(chunks)} chunks found, requested {n}")
         return chunks
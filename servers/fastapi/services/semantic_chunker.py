@@ -0,0 +1,142 @@
+import asyncio
+import re
+from typing import Callable, List, Optional
+import numpy as np
+
+from models.document_chunk import DocumentChunk
+
+# Sentences end at ., ! or ? followed by whitespace, and at line breaks
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\s*\n+\s*")
+# Longer documents are embedded in groups of consecutive sentences
+MAX_EMBEDDED_UNITS = 2000
+# Sentences compared on each side of a candidate section boundary
+SIMILARITY_WINDOW = 3
+
+
+class SemanticChunker:
+    """
+    Splits documents without enough headings into n sections.
+    - Sections start at sentence boundaries
+    - Every boundary is placed near an equal share of the text, preferring
+      the sentence where the topic changes most, measured by embedding
+      similarity of the sentences before and after it
+    """
+
+    def __init__(self, embed: Optional[Callable[[List[str]], List]] = None):
+        self._embed = embed
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        embed = self._embed
+        if embed is None:
+            # Reuses the MiniLM model already loaded for icon search
+            from services import ICON_FINDER_SERVICE
+
+            embed = ICON_FINDER_SERVICE.embed
+        embeddings = np.asarray(embed(texts), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    def split_sentences(self, text: str) -> List[str]:
+        sentences = []
+        for sentence in SENTENCE_BOUNDARY.split(text):
+            sentence = sentence.strip().lstrip("#").strip()
+            if sentence:
+                sentences.append(sentence)
+        return sentences
+
+    def group_sentences(self, sentences: List[str]) -> List[str]:
+        if len(sentences) <= MAX_EMBEDDED_UNITS:
+            return sentences
+        group_size = -(-len(sentences) // MAX_EMBEDDED_UNITS)
+        return [
+            " ".join(sentences[index : index + group_size])
+            for index in range(0, len(sentences), group_size)
+        ]
+
+    def get_boundary_scores(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Returns for every unit how much the topic changes right before it,
+        from 0 (same topic) to 2 (opposite).
+        """
+        scores = np.zeros(len(embeddings), dtype=np.float32)
+        cumulative = np.vstack(
+            [np.zeros((1, embeddings.shape[1])), np.cumsum(embeddings, axis=0)]
+        )
+        for index in range(1, len(embeddings)):
+            start = max(0, index - SIMILARITY_WINDOW)
+            end = min(len(embeddings), index + SIMILARITY_WINDOW)
+            before = cumulative[index] - cumulative[start]
+            after = cumulative[end] - cumulative[index]
+            norm = np.linalg.norm(before) * np.linalg.norm(after)
+            similarity = float(before @ after / norm) if norm else 1.0
+            scores[index] = 1.0 - similarity
+        return scores
+
+    def select_boundaries(
+        self, lengths: List[int], boundary_scores: np.ndarray, n: int
+    ) -> List[int]:
+        """
+        Picks n - 1 unit indices which start a new section.
+        Every boundary is searched around its ideal position by text length,
+        trading topic change against distance from that position.
+        """
+        total_units = len(lengths)
+        cumulative_lengths = np.cumsum(lengths)
+        total_length = int(cumulative_lengths[-1])
+        search_radius = max(1, total_units // (2 * n))
+
+        boundaries = []
+        previous_boundary = 0
+        for section in range(1, n):
+            target = total_length * section / n
+            ideal = int(np.searchsorted(cumulative_lengths, target)) + 1
+            # Keeps room for at least one unit in every remaining section
+            low = max(previous_boundary + 1, ideal - search_radius)
+            high = min(total_units - (n - section), ideal + search_radius)
+            if low > high:
+                low = high = max(previous_boundary + 1, min(ideal, high))
+
+            best_boundary = low
+            best_score = None
+            for boundary in range(low, high + 1):
+                distance = abs(boundary - ideal) / search_radius
+                score = boundary_scores[boundary] - 0.5 * distance
+                if best_score is None or score > best_score:
+                    best_boundary = boundary
+                    best_score = score
+            boundaries.append(best_boundary)
+            previous_boundary = best_boundary
+
+        return boundaries
+
+    def get_chunks(self, text: str, n: int) -> List[DocumentChunk]:
+        units = self.group_sentences(self.split_sentences(text))
+        if len(units) < n:
+            return []
+
+        boundary_scores = self.get_boundary_scores(self.embed(units))
+        boundaries = self.select_boundaries(
+            [len(unit) for unit in units], boundary_scores, n
+        )
+
+        chunks = []
+        starts = [0, *boundaries]
+        ends = [*boundaries, len(units)]
+        for index, (start, end) in enumerate(zip(starts, ends)):
+            # First sentence of a section serves as its heading
+            chunks.append(
+                DocumentChunk(
+                    heading=units[start],
+                    content=" ".join(units[start + 1 : end]),
+                    heading_index=index,
+                    score=float(boundary_scores[start]),
+                )
+            )
+        return chunks
+
+    async def get_n_chunks(self, text: str, n: int) -> List[DocumentChunk]:
+        chunks = await asyncio.to_thread(self.get_chunks, text, n)
+        if len(chunks) < n:
+            raise ValueError(f"Only {len(chunks)} chunks found, requested {n}")
+        return chunks
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import signal
+from typing import List, Optional
+
+from models.subprocess_result import SubprocessResult
+from utils.get_env import get_subprocess_concurrency_env
+from utils.parsers import parse_int_or_none
+
+DEFAULT_SUBPROCESS_CONCURRENCY = 4
+
+
+class SubprocessService:
+    """
+    Runs external commands without blocking the event loop.
+    - At most max_concurrency commands run at the same time
+    - Output is captured and decoded
+    - Commands exceeding the timeout or whose caller is cancelled are killed
+      together with their child processes
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency or (
+            parse_int_or_none(get_subprocess_concurrency_env())
+            or DEFAULT_SUBPROCESS_CONCURRENCY
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphore is bound to the event loop it was first used on
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(
+        self,
+        command: List[str],
+        timeout: float,
+        env: Optional[dict] = None,
+        check: bool = True,
+    ) -> SubprocessResult:
+        """
+        Runs the command and returns its captured output.
+        Raises if the command times out, or exits with an error when check is True.
+        """
+        name = os.path.basename(command[0])
+        async with self._get_semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout
+                )
+            except asyncio.TimeoutError:
+                await self._kill(process)
+                raise Exception(f"{name} timed out after {timeout} seconds")
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+
+        result = SubprocessResult(
+            returncode=process.returncode,
+            stdout=stdout.decode(errors="replace"),
+            stderr=stderr.decode(errors="replace"),
+        )
+        if check and result.returncode != 0:
+            raise Exception(f"{name} failed: {result.stderr or result.stdout}")
+        return result
+
+    async def _kill(self, process: asyncio.subprocess.Process):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from utils.async_iterator import gather_in_order_with_limit
+
+
+def make_factory(index: int, delay: float, tracker: dict):
+    async def factory():
+        tracker["running"] += 1
+        tracker["max_running"] = max(tracker["max_running"], tracker["running"])
+        await asyncio.sleep(delay)
+        tracker["running"] -= 1
+        return index * 10
+
+    return factory
+
+
+def test_results_are_yielded_in_input_order():
+    """
+    Later tasks finish first but results must still be yielded by index
+    """
+
+    async def run_test():
+        tracker = {"running": 0, "max_running": 0}
+        delays = [0.05, 0.01, 0.03, 0.0]
+        factories = [
+            make_factory(index, delay, tracker) for index, delay in enumerate(delays)
+        ]
+        return [
+            each async for each in gather_in_order_with_limit(factories, limit=4)
+        ]
+
+    results = asyncio.run(run_test())
+    assert results == [(0, 0), (1, 10), (2, 20), (3, 30)]
+
+
+def test_concurrency_is_bounded_by_limit():
+    async def run_test():
+        tracker = {"running": 0, "max_running": 0}
+        factories = [make_factory(index, 0.01, tracker) for index in range(10)]
+        async for _ in gather_in_order_with_limit(factories, limit=3):
+            pass
+        return tracker["max_running"]
+
+    assert asyncio.run(run_test()) == 3
+
+
+def test_failure_cancels_pending_tasks():
+    async def run_test():
+        finished = []
+
+        async def failing():
+            raise ValueError("LLM error")
+
+        async def slow():
+            await asyncio.sleep(1)
+            finished.append(True)
+
+        with pytest.raises(ValueError):
+            async for _ in gather_in_order_with_limit([failing, slow], limit=2):
+                pass
+
+        await asyncio.sleep(0)
+        return finished
+
+    assert asyncio.run(run_test()) == []
@@ -0,0 +1,68 @@
+import asyncio
+from unittest.mock import patch
+
+from sqlalchemy import text
+
+from services.database import get_database_diagnostics
+from utils.db_utils import create_database_engine, get_database_engine_profile
+
+
+def test_sqlite_engine_uses_wal_and_pragmas(tmp_path, monkeypatch):
+    """
+    Every SQLite connection gets the pragmas of the profile, and the
+    diagnostics report what the database actually uses
+    """
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "1234")
+    database_url = f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"
+    profile = get_database_engine_profile(database_url)
+    engine = create_database_engine(
+        database_url, {"check_same_thread": False}, profile
+    )
+
+    async def run():
+        async with engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+        with patch("services.database.sql_engine", engine), patch(
+            "services.database.database_engine_profile", profile
+        ):
+            diagnostics = await get_database_diagnostics()
+        await engine.dispose()
+        return journal_mode, diagnostics
+
+    journal_mode, diagnostics = asyncio.run(run())
+
+    assert profile.get_engine_options() == {}
+    assert journal_mode == "wal"
+    assert diagnostics.backend == "sqlite"
+    assert diagnostics.driver == "aiosqlite"
+    assert diagnostics.sqlite_pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "busy_timeout": 1234,
+        "mmap_size": 256 * 1024 * 1024,
+    }
+
+
+def test_server_database_profile_pools_connections(monkeypatch):
+    """
+    Postgres and MySQL engines get pool settings from the environment,
+    unset or invalid values fall back to the defaults
+    """
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "4")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "invalid")
+    monkeypatch.setenv("DATABASE_POOL_PRE_PING", "false")
+
+    profile = get_database_engine_profile("postgresql+asyncpg://user@host/db")
+
+    assert profile.backend == "postgresql"
+    assert profile.sqlite_pragmas is None
+    assert profile.get_engine_options() == {
+        "pool_size": 4,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": False,
+    }
+    assert get_database_engine_profile("mysql+aiomysql://user@host/db").backend == (
+        "mysql"
+    )
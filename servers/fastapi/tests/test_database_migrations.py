@@ -0,0 +1,193 @@
+import asyncio
+import json
+
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from migrations import MIGRATIONS
+from migrations.runner import run_migrations
+from models.sql.image_asset import ImageAsset
+from models.sql.presentation import PresentationModel
+from models.sql.presentation_generation_job import PresentationGenerationJob
+from models.sql.presentation_layout_code import PresentationLayoutCodeModel
+from models.sql.slide import SlideModel
+
+TABLES = [
+    PresentationModel.__table__,
+    SlideModel.__table__,
+    ImageAsset.__table__,
+    PresentationLayoutCodeModel.__table__,
+    PresentationGenerationJob.__table__,
+]
+
+
+def get_schema(sync_conn):
+    inspector = inspect(sync_conn)
+    return {
+        table: (
+            [column["name"] for column in inspector.get_columns(table)],
+            [index["name"] for index in inspector.get_indexes(table)],
+        )
+        for table in inspector.get_table_names()
+    }
+
+
+async def create_old_database(engine):
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "CREATE TABLE presentationmodel (id VARCHAR PRIMARY KEY, "
+                "content VARCHAR, n_slides INTEGER, language VARCHAR, "
+                "created_at DATETIME, updated_at DATETIME, prompt VARCHAR)"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE TABLE slidemodel (id VARCHAR PRIMARY KEY, "
+                "presentation VARCHAR, layout_group VARCHAR, layout VARCHAR, "
+                "\"index\" INTEGER, content JSON)"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE TABLE presentationgenerationjob (id VARCHAR PRIMARY KEY, "
+                "user_id VARCHAR, status VARCHAR, stage VARCHAR, progress INTEGER, "
+                "request JSON, result JSON, error VARCHAR, attempts INTEGER, "
+                "created_at DATETIME, updated_at DATETIME)"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE TABLE imageasset (id VARCHAR PRIMARY KEY, "
+                "created_at DATETIME, path VARCHAR, extras JSON)"
+            )
+        )
+        await conn.execute(
+            text("INSERT INTO presentationmodel (id, content) VALUES ('p1', 'old')")
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO imageasset (id, path, extras) VALUES "
+                "('i1', 'image.jpg', '{\"prompt\": \"sunset\", \"cache_key\": \"key\"}')"
+            )
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO slidemodel (id, presentation, \"index\") "
+                "VALUES ('s1', 'p1', 0)"
+            )
+        )
+
+
+def test_migrations_upgrade_old_database(tmp_path):
+    """
+    Databases created before user_id, the lookup indexes, the job
+    presentation id and the image cache key column get all of them
+    - Existing rows belong to the default user
+    - Image cache keys move out of extras
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+
+    async def run():
+        await create_old_database(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=TABLES)
+            )
+        await run_migrations(engine)
+        async with engine.connect() as conn:
+            schema = await conn.run_sync(get_schema)
+            user_ids = (
+                await conn.execute(
+                    text(
+                        "SELECT p.user_id, s.user_id FROM presentationmodel p "
+                        "JOIN slidemodel s ON s.presentation = p.id"
+                    )
+                )
+            ).all()
+            image_assets = (
+                await conn.execute(text("SELECT cache_key, extras FROM imageasset"))
+            ).all()
+            versions = (
+                await conn.execute(text("SELECT version FROM schema_migrations"))
+            ).scalars().all()
+        await engine.dispose()
+        return schema, user_ids, image_assets, versions
+
+    schema, user_ids, image_assets, versions = asyncio.run(run())
+
+    assert "user_id" in schema["presentationmodel"][0]
+    assert "user_id" in schema["slidemodel"][0]
+    assert "presentation_id" in schema["presentationgenerationjob"][0]
+    assert user_ids == [("default_user", "default_user")]
+    assert "ix_presentationmodel_user_id_created_at" in schema["presentationmodel"][1]
+    assert "ix_slidemodel_presentation_index" in schema["slidemodel"][1]
+    assert "ix_slidemodel_user_id" in schema["slidemodel"][1]
+    assert "ix_imageasset_created_at" in schema["imageasset"][1]
+    assert "ix_imageasset_cache_key" in schema["imageasset"][1]
+    assert [(cache_key, json.loads(extras)) for cache_key, extras in image_assets] == [
+        ("key", {"prompt": "sunset"})
+    ]
+    assert (
+        "ix_presentation_layout_codes_presentation_id_layout_id"
+        in schema["presentation_layout_codes"][1]
+    )
+    assert sorted(versions) == [migration.VERSION for migration in MIGRATIONS]
+
+
+def test_migrations_run_once(tmp_path):
+    """
+    Applied migrations are skipped, so running them again changes nothing
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'new.db'}")
+
+    async def run():
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=TABLES)
+            )
+        await run_migrations(engine)
+        async with engine.connect() as conn:
+            first_schema = await conn.run_sync(get_schema)
+        await run_migrations(engine)
+        async with engine.connect() as conn:
+            second_schema = await conn.run_sync(get_schema)
+            versions_count = (
+                await conn.execute(text("SELECT COUNT(*) FROM schema_migrations"))
+            ).scalar_one()
+        await engine.dispose()
+        return first_schema, second_schema, versions_count
+
+    first_schema, second_schema, versions_count = asyncio.run(run())
+
+    assert first_schema == second_schema
+    assert versions_count == len(MIGRATIONS)
+
+
+def test_concurrent_migrations_apply_once(tmp_path):
+    """
+    Processes starting together wait for each other's migrations
+    instead of applying them twice
+    """
+    database_url = f"sqlite+aiosqlite:///{tmp_path / 'old.db'}"
+    engines = [create_async_engine(database_url) for _ in range(3)]
+
+    async def run():
+        await create_old_database(engines[0])
+        async with engines[0].begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=TABLES)
+            )
+        await asyncio.gather(*[run_migrations(engine) for engine in engines])
+        async with engines[0].connect() as conn:
+            versions = (
+                await conn.execute(text("SELECT version FROM schema_migrations"))
+            ).scalars().all()
+        for engine in engines:
+            await engine.dispose()
+        return versions
+
+    versions = asyncio.run(run())
+
+    assert sorted(versions) == [migration.VERSION for migration in MIGRATIONS]
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from docx import Document
+
+from services.document_converter_pool import DocumentConverterPool
+
+
+@pytest.fixture(scope="module")
+def converter_pool():
+    converter_pool = DocumentConverterPool(max_workers=1)
+    yield converter_pool
+    converter_pool.shutdown()
+
+
+@pytest.fixture
+def docx_path(tmp_path):
+    document = Document()
+    document.add_heading("Quarterly Report", level=1)
+    document.add_paragraph("Revenue grew by ten percent.")
+    path = str(tmp_path / "report.docx")
+    document.save(path)
+    return path
+
+
+def test_parse_to_markdown_runs_off_the_event_loop(converter_pool, docx_path):
+    """
+    Document is converted to markdown in a worker process
+    - Event loop keeps running while the document is converted
+    - Later conversions reuse the warm worker
+    """
+
+    async def run_test():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        markdowns = [
+            await converter_pool.parse_to_markdown(docx_path) for _ in range(2)
+        ]
+        ticker.cancel()
+        return markdowns, ticks
+
+    markdowns, ticks = asyncio.run(run_test())
+    assert "# Quarterly Report" in markdowns[0]
+    assert "Revenue grew by ten percent." in markdowns[0]
+    assert markdowns[1] == markdowns[0]
+    assert ticks > 10
+
+
+def test_conversion_errors_are_raised(converter_pool, tmp_path):
+    with pytest.raises(Exception):
+        asyncio.run(converter_pool.parse_to_markdown(str(tmp_path / "missing.docx")))
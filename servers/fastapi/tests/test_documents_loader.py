@@ -0,0 +1,154 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from enums.pdf_text_extraction_mode import PdfTextExtractionMode
+from services.document_converter_pool import DOCUMENT_CONVERTER_OPTIONS
+from services.documents_loader import DocumentsLoader
+from services.parsed_document_cache import ParsedDocumentCache, get_file_sha256
+from services.pdf_text_extractor import (
+    PDF_TEXT_EXTRACTOR_OPTIONS,
+    extract_pdf_markdown,
+)
+from tests.pdf_utils import write_pdf
+
+
+class SlowDocumentsLoader(DocumentsLoader):
+    """
+    Loads every file after a delay given by its name
+    """
+
+    def __init__(self, file_paths, max_concurrency):
+        super().__init__(file_paths, max_concurrency)
+        self.running = 0
+        self.max_running = 0
+
+    async def load_document(self, file_path, load_text, load_images, temp_dir):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            with open(file_path) as file:
+                delay = float(file.read())
+            if delay < 0:
+                raise HTTPException(400, f"Failed to load {file_path}")
+            await asyncio.sleep(delay)
+            return f"document {delay}", []
+        finally:
+            self.running -= 1
+
+
+def write_files(tmp_path, delays):
+    file_paths = []
+    for index, delay in enumerate(delays):
+        file_path = tmp_path / f"{index}.pdf"
+        file_path.write_text(str(delay))
+        file_paths.append(str(file_path))
+    return file_paths
+
+
+def test_documents_are_loaded_concurrently_in_order(tmp_path):
+    """
+    At most max_concurrency files are loaded at the same time
+    - Documents keep the order of the files, not the order they finished in
+    - Every file reports loading and loaded progress
+    """
+    file_paths = write_files(tmp_path, [0.5, 0.1, 0.1, 0.0])
+    loader = SlowDocumentsLoader(file_paths, max_concurrency=2)
+
+    async def run_test():
+        return [
+            progress
+            async for progress in loader.load_documents_with_progress(str(tmp_path))
+        ]
+
+    progress = asyncio.run(run_test())
+    assert loader.documents == [
+        "document 0.5",
+        "document 0.1",
+        "document 0.1",
+        "document 0.0",
+    ]
+    assert loader.max_running == 2
+    assert [(each.index, each.status) for each in progress[:2]] == [
+        (0, "loading"),
+        (1, "loading"),
+    ]
+    assert sorted(
+        each.index for each in progress if each.status == "loaded"
+    ) == [0, 1, 2, 3]
+    assert progress[-1].index == 0
+
+
+def test_failed_file_stops_loading(tmp_path):
+    file_paths = write_files(tmp_path, [0.1, -1])
+    loader = SlowDocumentsLoader(file_paths, max_concurrency=2)
+    with pytest.raises(HTTPException, match="Failed to load"):
+        asyncio.run(loader.load_documents(str(tmp_path)))
+
+    loader = SlowDocumentsLoader([str(tmp_path / "missing.pdf")], max_concurrency=2)
+    with pytest.raises(HTTPException, match="not found"):
+        asyncio.run(loader.load_documents(str(tmp_path)))
+
+
+def test_docling_fallback_is_cached_under_converter_options(tmp_path):
+    """
+    PDFs left to Docling in auto mode are only cached under the key of the
+    converter options, so converter changes aren't hidden by the text cache
+    - Layout check isn't run again for the same file
+    """
+    sparse_pdf = write_pdf(tmp_path / "sparse.pdf", [(10, 720, "Figure 1")])
+    cache = ParsedDocumentCache(str(tmp_path / "cache"))
+    loader = DocumentsLoader(
+        [sparse_pdf], pdf_text_extraction_mode=PdfTextExtractionMode.AUTO
+    )
+    parse_to_markdown = AsyncMock(return_value="docling markdown")
+
+    async def run_test():
+        with patch("services.documents_loader.PARSED_DOCUMENT_CACHE", cache), patch(
+            "services.documents_loader.DOCUMENT_CONVERTER_POOL.parse_to_markdown",
+            parse_to_markdown,
+        ), patch(
+            "services.documents_loader.extract_pdf_markdown",
+            wraps=extract_pdf_markdown,
+        ) as extract:
+            file_hash = await cache.get_file_hash(sparse_pdf)
+            document = await loader.parse_pdf_to_markdown(sparse_pdf, file_hash)
+            assert await loader.parse_pdf_to_markdown(sparse_pdf, file_hash) == document
+            assert extract.call_count == 1
+        text_key = cache.get_cache_key(
+            file_hash, f"{PDF_TEXT_EXTRACTOR_OPTIONS};check_layout=True"
+        )
+        converter_key = cache.get_cache_key(file_hash, DOCUMENT_CONVERTER_OPTIONS)
+        return (
+            document,
+            await cache.get_markdown(text_key),
+            await cache.get_markdown(converter_key),
+        )
+
+    assert asyncio.run(run_test()) == ("docling markdown", None, "docling markdown")
+    assert parse_to_markdown.call_count == 1
+
+
+def test_pdf_is_hashed_once_per_load(tmp_path):
+    """
+    Text and page images of a PDF are cached under one hash of the file
+    """
+    pdf_path = write_pdf(tmp_path / "report.pdf", [(10, 720, "Quarterly report")])
+    cache = ParsedDocumentCache(str(tmp_path / "cache"))
+    loader = DocumentsLoader(
+        [pdf_path], pdf_text_extraction_mode=PdfTextExtractionMode.FAST
+    )
+
+    with patch("services.documents_loader.PARSED_DOCUMENT_CACHE", cache), patch(
+        "services.documents_loader.PDF_RASTERIZER.rasterize_all",
+        AsyncMock(return_value=[]),
+    ), patch(
+        "services.parsed_document_cache.get_file_sha256",
+        wraps=get_file_sha256,
+    ) as file_sha256:
+        asyncio.run(loader.load_documents(str(tmp_path), load_images=True))
+
+    assert file_sha256.call_count == 1
+    assert "Quarterly report" in loader.documents[0]
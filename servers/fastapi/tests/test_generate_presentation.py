@@ -0,0 +1,67 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.presentation_and_path import PresentationAndPath
+from models.sql.presentation import PresentationModel
+from utils.generate_presentation import generate_presentation
+
+
+def test_saved_presentation_is_only_exported(tmp_path):
+    """
+    A presentation saved by an earlier attempt isn't generated again,
+    a missing one is generated and saved under the given id
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    generate_and_save = AsyncMock(
+        side_effect=lambda request, user_id, presentation_id, report: (
+            PresentationModel(
+                id=presentation_id,
+                user_id=user_id,
+                prompt=request.prompt,
+                n_slides=request.n_slides,
+                language=request.language,
+            )
+        )
+    )
+
+    async def export(presentation_id, title, export_as):
+        return PresentationAndPath(
+            presentation_id=presentation_id, path=f"/exports/{presentation_id}"
+        )
+
+    async def run_test():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with session_maker() as session:
+            session.add(
+                PresentationModel(
+                    id="saved",
+                    user_id="user",
+                    prompt="saved",
+                    n_slides=1,
+                    language="English",
+                )
+            )
+            await session.commit()
+
+        request = GeneratePresentationRequest(prompt="solar system")
+        with patch("services.database.async_session_maker", session_maker), patch(
+            "utils.generate_presentation.generate_and_save_presentation",
+            generate_and_save,
+        ), patch("utils.generate_presentation.export_presentation", export):
+            saved = await generate_presentation(request, "user", None, "saved")
+            retried = await generate_presentation(request, "user", None, "missing")
+        await engine.dispose()
+        return saved, retried
+
+    saved, retried = asyncio.run(run_test())
+
+    assert saved.path == "/exports/saved"
+    assert retried.edit_path == "/presentation?id=missing"
+    assert generate_and_save.await_count == 1
+    assert generate_and_save.await_args.args[2] == "missing"
@@ -0,0 +1,40 @@
+import asyncio
+
+from services.http_client_service import HttpClientService
+
+
+def test_sessions_are_reused_within_event_loop():
+    """
+    Every call on the same event loop gets the same pooled session
+    - External and internal sessions are separate
+    - Closing the service closes all sessions
+    """
+
+    async def run_test():
+        service = HttpClientService()
+        session = service.get_session()
+        internal_session = service.get_internal_session()
+
+        assert service.get_session() is session
+        assert service.get_internal_session() is internal_session
+        assert session is not internal_session
+        assert session.trust_env and not internal_session.trust_env
+
+        await service.close()
+        assert session.closed and internal_session.closed
+        assert service.get_session() is not session
+        await service.close()
+
+    asyncio.run(run_test())
+
+
+def test_sessions_are_recreated_on_new_event_loop():
+    service = HttpClientService()
+
+    async def get_session():
+        return service.get_session()
+
+    first_session = asyncio.run(get_session())
+    second_session = asyncio.run(get_session())
+    assert first_session is not second_session
+    asyncio.run(service.close())
@@ -0,0 +1,254 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from services.icon_finder_service import IconFinderService
+from services.icon_index import NumpyIconIndex
+from services.icon_search_cache import IconSearchCache
+
+
+@pytest.fixture
+def icon_finder_service():
+    """
+    Creates an IconFinderService with a mocked chroma collection
+    """
+    service = IconFinderService()
+    service.collection = MagicMock()
+    service.collection.query = MagicMock(
+        side_effect=lambda query_texts, n_results: {
+            "ids": [[f"{query}-bold"] * n_results for query in query_texts]
+        }
+    )
+    service.cache = IconSearchCache(persistent=False)
+    service._initialized = True
+    return service
+
+
+def test_search_icons_batch_queries_collection_once(icon_finder_service):
+    results = asyncio.run(
+        icon_finder_service.search_icons_batch(["growth", "team"], k=2)
+    )
+
+    assert results == [
+        ["/static/icons/bold/growth-bold.png", "/static/icons/bold/growth-bold.png"],
+        ["/static/icons/bold/team-bold.png", "/static/icons/bold/team-bold.png"],
+    ]
+    icon_finder_service.collection.query.assert_called_once_with(
+        query_texts=["growth", "team"], n_results=2
+    )
+
+
+def test_concurrent_searches_are_merged_into_one_batch(icon_finder_service):
+    """
+    Searches from different slides arriving together share one collection query
+    - Duplicate queries are only searched once
+    - Every caller receives the result of its own query
+    """
+
+    async def run_test():
+        return await asyncio.gather(
+            icon_finder_service.search_icons("growth"),
+            icon_finder_service.search_icons("team"),
+            icon_finder_service.search_icons("growth"),
+        )
+
+    results = asyncio.run(run_test())
+
+    assert results == [
+        ["/static/icons/bold/growth-bold.png"],
+        ["/static/icons/bold/team-bold.png"],
+        ["/static/icons/bold/growth-bold.png"],
+    ]
+    icon_finder_service.collection.query.assert_called_once_with(
+        query_texts=["growth", "team"], n_results=1
+    )
+
+
+def test_case_and_whitespace_variants_share_one_search(icon_finder_service):
+    """
+    Queries differing only in case or whitespace arriving in one batch are
+    searched once and every caller receives the result
+    """
+
+    async def run_test():
+        return await asyncio.gather(
+            icon_finder_service.search_icons("Growth"),
+            icon_finder_service.search_icons("growth"),
+            icon_finder_service.search_icons("  growth "),
+        )
+
+    results = asyncio.run(run_test())
+
+    assert results == [["/static/icons/bold/Growth-bold.png"]] * 3
+    icon_finder_service.collection.query.assert_called_once_with(
+        query_texts=["Growth"], n_results=1
+    )
+
+
+def test_icon_search_cache_persistent_hit_serves_every_variant():
+    """
+    A persisted result is returned for every query variant of its key
+    """
+    cache = IconSearchCache()
+
+    async def get_persistent(keys):
+        return {keys[0]: ["a"]}
+
+    cache._get_persistent = get_persistent
+    cached, missed = asyncio.run(cache.get_many(["Growth", "growth"], k=1))
+    assert cached == {"Growth": ["a"], "growth": ["a"]}
+    assert missed == []
+
+
+def test_batch_error_is_raised_for_every_caller(icon_finder_service):
+    icon_finder_service.collection.query = MagicMock(
+        side_effect=Exception("Chroma error")
+    )
+
+    async def run_test():
+        return await asyncio.gather(
+            icon_finder_service.search_icons("growth"),
+            icon_finder_service.search_icons("team"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run_test())
+    assert all(isinstance(result, Exception) for result in results)
+
+
+
+def test_cancelled_batch_cancels_every_caller(icon_finder_service):
+    """
+    Callers don't wait forever when the batch task is cancelled
+    """
+    started = asyncio.Event()
+
+    async def search_icons_batch(queries, k):
+        started.set()
+        await asyncio.Event().wait()
+
+    icon_finder_service.search_icons_batch = search_icons_batch
+
+    async def run_test():
+        searches = asyncio.gather(
+            icon_finder_service.search_icons("growth"),
+            icon_finder_service.search_icons("team"),
+            return_exceptions=True,
+        )
+        await started.wait()
+        for task in list(icon_finder_service._batch_tasks):
+            task.cancel()
+        return await asyncio.wait_for(searches, timeout=1)
+
+    results = asyncio.run(run_test())
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+def fake_embed(texts):
+    vectors = {
+        "growth": [1.0, 0.0, 0.0],
+        "team": [0.0, 1.0, 0.0],
+        "security": [0.0, 0.0, 1.0],
+        "chart": [0.9, 0.1, 0.0],
+    }
+    return [vectors[text] for text in texts]
+
+
+def test_numpy_icon_index_build_load_and_search(tmp_path):
+    """
+    Builds the index on disk, loads it memory mapped and searches top k
+    - Results are ordered by similarity
+    - k larger than the corpus returns every icon
+    """
+    directory = str(tmp_path / "icons_index")
+    NumpyIconIndex.build(
+        directory,
+        ["growth", "team", "security", "chart"],
+        ["growth-bold", "team-bold", "security-bold", "chart-bold"],
+        fake_embed,
+    )
+
+    index = NumpyIconIndex.load(directory)
+    assert isinstance(index.embeddings, np.memmap)
+    assert index.embeddings.dtype == np.float32
+
+    results = index.search(fake_embed(["growth", "team"]), k=2)
+    assert results == [["growth-bold", "chart-bold"], ["team-bold", "chart-bold"]]
+    assert len(index.search(fake_embed(["security"]), k=10)[0]) == 4
+
+
+def test_numpy_icon_index_is_not_loaded_for_other_documents(tmp_path):
+    """
+    An index built from other icon documents isn't loaded, so added or
+    renamed icons trigger a rebuild
+    """
+    directory = str(tmp_path / "icons_index")
+    documents = ["growth", "team"]
+    ids = ["growth-bold", "team-bold"]
+    NumpyIconIndex.build(directory, documents, ids, fake_embed)
+
+    documents_hash = NumpyIconIndex.get_documents_hash(documents, ids)
+    assert NumpyIconIndex.load(directory, documents_hash).ids == ids
+    renamed_hash = NumpyIconIndex.get_documents_hash(
+        documents, ["growth-bold", "people-bold"]
+    )
+    assert NumpyIconIndex.load(directory, renamed_hash) is None
+    added_hash = NumpyIconIndex.get_documents_hash(
+        [*documents, "chart"], [*ids, "chart-bold"]
+    )
+    assert NumpyIconIndex.load(directory, added_hash) is None
+
+
+def test_numpy_icon_index_load_returns_none_without_files(tmp_path):
+    assert NumpyIconIndex.load(str(tmp_path)) is None
+
+
+def test_repeated_queries_are_served_from_cache(icon_finder_service):
+    """
+    Normalized queries hit the in-process cache instead of the collection
+    """
+    asyncio.run(icon_finder_service.search_icons_batch(["growth"], k=1))
+    results = asyncio.run(
+        icon_finder_service.search_icons_batch(["  Growth ", "team"], k=1)
+    )
+
+    assert results == [
+        ["/static/icons/bold/growth-bold.png"],
+        ["/static/icons/bold/team-bold.png"],
+    ]
+    assert icon_finder_service.collection.query.call_count == 2
+    icon_finder_service.collection.query.assert_called_with(
+        query_texts=["team"], n_results=1
+    )
+    stats = icon_finder_service.cache.get_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_icon_search_cache_evicts_least_recently_used():
+    cache = IconSearchCache(max_size=2, persistent=False)
+
+    async def run_test():
+        await cache.set_many({"growth": ["a"], "team": ["b"]}, k=1)
+        await cache.get_many(["growth"], k=1)
+        await cache.set_many({"security": ["c"]}, k=1)
+        return await cache.get_many(["growth", "team", "security"], k=1)
+
+    cached, missed = asyncio.run(run_test())
+    assert cached == {"growth": ["a"], "security": ["c"]}
+    assert missed == ["team"]
+
+
+def test_icon_search_cache_invalidate_clears_results():
+    cache = IconSearchCache(persistent=False)
+
+    async def run_test():
+        await cache.set_many({"growth": ["a"]}, k=1)
+        cache.invalidate("rebuilt")
+        return await cache.get_many(["growth"], k=1)
+
+    cached, missed = asyncio.run(run_test())
+    assert cached == {}
+    assert missed == ["growth"]
+    assert cache.version == "rebuilt"
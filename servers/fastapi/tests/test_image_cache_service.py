@@ -0,0 +1,148 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+
+from models.image_prompt import ImagePrompt
+from models.sql.image_asset import ImageAsset
+from services.image_cache_service import ImageCacheService
+from services.image_generation_service import ImageGenerationService
+
+
+@pytest.fixture
+def session_maker(tmp_path):
+    """
+    Points the image cache to a fresh sqlite database
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    asyncio.run(create_tables())
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    with patch("services.image_cache_service.async_session_maker", session_maker):
+        yield session_maker
+
+
+def save_image_asset(session_maker, image_asset: ImageAsset):
+    async def save():
+        async with session_maker() as session:
+            session.add(image_asset)
+            await session.commit()
+
+    asyncio.run(save())
+
+
+def get_image_assets(session_maker):
+    async def get():
+        async with session_maker() as session:
+            return list(await session.scalars(select(ImageAsset)))
+
+    return asyncio.run(get())
+
+
+def test_cache_key_normalizes_prompt_and_theme():
+    cache = ImageCacheService()
+    assert cache.get_cache_key("dall-e-3", "A Sunset ", "dark") == cache.get_cache_key(
+        "dall-e-3", "a  sunset", " Dark"
+    )
+    assert cache.get_cache_key("dall-e-3", "sunset") != cache.get_cache_key(
+        "gemini_flash", "sunset"
+    )
+
+
+def test_generated_image_is_served_from_cache(session_maker, tmp_path):
+    """
+    Generated image saved by the caller is reused for the same prompt
+    - Provider is not called again
+    - use_cache=False calls the provider again
+    """
+    calls = []
+
+    async def mock_openai_generate(prompt, output_directory):
+        image_path = os.path.join(output_directory, f"image_{len(calls)}.jpg")
+        calls.append(prompt)
+        with open(image_path, "w") as f:
+            f.write("fake image content")
+        return image_path
+
+    with patch.dict(os.environ, {"IMAGE_PROVIDER": "dall-e-3"}):
+        service = ImageGenerationService(str(tmp_path))
+        service.image_gen_func = mock_openai_generate
+        prompt = ImagePrompt(prompt="A sunset", theme_prompt="dark")
+
+        image_asset = asyncio.run(service.generate_image(prompt))
+        assert isinstance(image_asset, ImageAsset)
+        save_image_asset(session_maker, image_asset)
+
+        cached = asyncio.run(
+            service.generate_image(ImagePrompt(prompt="a sunset ", theme_prompt="Dark"))
+        )
+        assert cached == image_asset.path
+        assert len(calls) == 1
+
+        bypassed = asyncio.run(service.generate_image(prompt, use_cache=False))
+        assert isinstance(bypassed, ImageAsset)
+        assert len(calls) == 2
+
+
+def test_expired_entries_are_not_served(session_maker, tmp_path):
+    cache = ImageCacheService()
+    image_path = tmp_path / "old.jpg"
+    image_path.write_text("fake image content")
+    save_image_asset(
+        session_maker,
+        ImageAsset(
+            path=str(image_path),
+            created_at=datetime.now() - timedelta(hours=2),
+            cache_key="old",
+        ),
+    )
+
+    with patch.dict(os.environ, {"IMAGE_CACHE_TTL_HOURS": "1"}):
+        assert asyncio.run(cache.get("old")) is None
+    assert asyncio.run(cache.get("old")) == str(image_path)
+
+
+def test_eviction_keeps_newest_entries_within_size_limit(session_maker, tmp_path):
+    """
+    Oldest entries above the size limit are evicted
+    - Stock url entries are deleted
+    - Generated images keep their file and row but lose the cache key
+    """
+    cache = ImageCacheService()
+    for index, size in enumerate([600 * 1024, 600 * 1024]):
+        image_path = tmp_path / f"image_{index}.jpg"
+        image_path.write_bytes(b"0" * size)
+        save_image_asset(
+            session_maker,
+            ImageAsset(
+                path=str(image_path),
+                created_at=datetime.now() - timedelta(minutes=index + 1),
+                cache_key=f"image_{index}",
+            ),
+        )
+    asyncio.run(
+        cache.set_url("stock", "https://example.com/image.jpg", {"prompt": "stock"})
+    )
+
+    with patch.dict(os.environ, {"IMAGE_CACHE_MAX_SIZE_MB": "1"}):
+        asyncio.run(cache.evict())
+        image_assets = get_image_assets(session_maker)
+        assert asyncio.run(cache.get("image_0")) == str(tmp_path / "image_0.jpg")
+        assert asyncio.run(cache.get("image_1")) is None
+
+    assert len(image_assets) == 3
+    assert os.path.exists(tmp_path / "image_1.jpg")
+
+    with patch.dict(os.environ, {"IMAGE_CACHE_TTL_HOURS": "0"}):
+        asyncio.run(cache.evict())
+    image_paths = {each.path for each in get_image_assets(session_maker)}
+    assert image_paths == {str(tmp_path / "image_0.jpg"), str(tmp_path / "image_1.jpg")}
+    assert asyncio.run(cache.get("image_0")) is None
@@ -0,0 +1,49 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from services import LLM_CLIENT_POOL
+from services.llm_client import LLMClient
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_client_pool():
+    LLM_CLIENT_POOL.clear()
+    yield
+    LLM_CLIENT_POOL.clear()
+
+
+def test_llm_clients_share_sdk_client():
+    """
+    LLMClients created with the same config share one SDK client
+    - Changing the api key or base url creates a new SDK client
+    """
+    with patch.dict(
+        os.environ,
+        {
+            "LLM": "custom",
+            "CUSTOM_LLM_URL": "http://llm:8000/v1",
+            "CUSTOM_LLM_API_KEY": "a",
+        },
+    ):
+        sdk_client = LLMClient()._client
+        assert LLMClient()._client is sdk_client
+
+        with patch.dict(os.environ, {"CUSTOM_LLM_API_KEY": "b"}):
+            assert LLMClient()._client is not sdk_client
+
+        with patch.dict(os.environ, {"CUSTOM_LLM_URL": "http://other:8000/v1"}):
+            other_sdk_client = LLMClient()._client
+            assert other_sdk_client is not sdk_client
+            assert str(other_sdk_client.base_url).startswith("http://other:8000")
+
+
+def test_missing_api_key_is_not_cached():
+    with patch.dict(os.environ, {"LLM": "openai", "OPENAI_API_KEY": ""}):
+        with pytest.raises(HTTPException):
+            LLMClient()
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"}):
+            assert LLMClient()._client is LLMClient()._client
@@ -0,0 +1,162 @@
+import asyncio
+import os
+import shutil
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from services.office_worker_pool import OfficeWorkerPool
+
+FAKE_OFFICE_SCRIPT = """#!{python}
+import os
+import shutil
+import sys
+from unittest.mock import patch
+import time
+
+args = sys.argv[1:]
+if args == ["--version"]:
+    print("LibreOffice 7.0")
+    sys.exit(0)
+
+profile = args[0].split("=", 1)[1]
+output_directory = args[args.index("--outdir") + 1]
+input_path = args[-1]
+if "slow" in input_path:
+    time.sleep(10)
+if "broken" in input_path:
+    print("conversion error", file=sys.stderr)
+    sys.exit(1)
+
+time.sleep(0.1)
+with open(os.path.join(os.path.dirname(input_path), "profiles.log"), "a") as f:
+    f.write(profile + "\\n")
+name = os.path.splitext(os.path.basename(input_path))[0]
+with open(os.path.join(output_directory, name + ".pdf"), "w") as f:
+    f.write("pdf")
+"""
+
+
+@pytest.fixture
+def fake_office(tmp_path):
+    """
+    Creates an executable that behaves like libreoffice --convert-to
+    """
+    binary = tmp_path / "fake_office"
+    binary.write_text(FAKE_OFFICE_SCRIPT.format(python=sys.executable))
+    binary.chmod(0o755)
+    return str(binary)
+
+
+def create_input_files(tmp_path, names):
+    paths = []
+    for name in names:
+        path = tmp_path / f"{name}.pptx"
+        path.write_text("pptx")
+        paths.append(str(path))
+    return paths
+
+
+def test_conversions_run_on_isolated_workers(tmp_path, fake_office):
+    """
+    Concurrent conversions are spread over workers with separate profiles
+    - At most pool size conversions share the pool
+    - Every conversion returns the generated file
+    """
+    pool = OfficeWorkerPool(str(tmp_path / "profiles"), size=2, binary=fake_office)
+    input_paths = create_input_files(tmp_path, ["a", "b", "c", "d"])
+
+    async def run_test():
+        return await asyncio.gather(
+            *[pool.convert(path, str(tmp_path)) for path in input_paths]
+        )
+
+    output_paths = asyncio.run(run_test())
+    assert output_paths == [path.replace(".pptx", ".pdf") for path in input_paths]
+
+    profiles = (tmp_path / "profiles.log").read_text().split()
+    assert len(profiles) == 4
+    assert len(set(profiles)) == 2
+
+
+def test_worker_is_recycled_after_max_jobs(tmp_path, fake_office):
+    pool = OfficeWorkerPool(
+        str(tmp_path / "profiles"), size=1, max_jobs_per_worker=2, binary=fake_office
+    )
+    input_paths = create_input_files(tmp_path, ["a", "b", "c"])
+    worker = pool._workers[0]
+
+    async def run_test():
+        for path in input_paths:
+            await pool.convert(path, str(tmp_path))
+
+    asyncio.run(run_test())
+    assert worker.jobs_completed == 1
+
+
+def test_failed_and_timed_out_conversions_raise(tmp_path, fake_office):
+    pool = OfficeWorkerPool(str(tmp_path / "profiles"), size=1, binary=fake_office)
+    broken_path, slow_path, path = create_input_files(
+        tmp_path, ["broken", "slow", "a"]
+    )
+
+    async def run_test():
+        with pytest.raises(Exception, match="conversion failed: conversion error"):
+            await pool.convert(broken_path, str(tmp_path))
+        with pytest.raises(Exception, match="timed out"):
+            await pool.convert(slow_path, str(tmp_path), timeout=1)
+        # Worker is released back to the pool after failures
+        return await pool.convert(path, str(tmp_path))
+
+    assert asyncio.run(run_test()) == path.replace(".pptx", ".pdf")
+
+
+def test_health_check(tmp_path, fake_office):
+    pool = OfficeWorkerPool(str(tmp_path / "profiles"), binary=fake_office)
+    assert asyncio.run(pool.check_health()) is True
+
+    missing_pool = OfficeWorkerPool(
+        str(tmp_path / "profiles"), binary=os.path.join(tmp_path, "missing")
+    )
+    assert asyncio.run(missing_pool.check_health()) is False
+
+
+def test_conversion_fails_fast_without_office_binary(tmp_path):
+    """
+    Conversions don't wait for a worker once the health check failed
+    """
+    pool = OfficeWorkerPool(
+        str(tmp_path / "profiles"), size=1, binary=os.path.join(tmp_path, "missing")
+    )
+    (input_path,) = create_input_files(tmp_path, ["a"])
+
+    async def run_test():
+        await pool.check_health()
+        with pytest.raises(Exception, match="could not be started"):
+            await pool.convert(input_path, str(tmp_path))
+
+    asyncio.run(run_test())
+    assert pool._queue is None
+
+
+def test_health_check_is_retried_after_cooldown(tmp_path, fake_office):
+    """
+    Pool becomes available again once the office binary can be started
+    - Conversions within the cooldown fail without checking again
+    - First conversion after the cooldown checks again and converts
+    """
+    binary = os.path.join(tmp_path, "installed_later")
+    pool = OfficeWorkerPool(str(tmp_path / "profiles"), size=1, binary=binary)
+    (input_path,) = create_input_files(tmp_path, ["a"])
+
+    async def run_test():
+        await pool.check_health()
+        shutil.copy(fake_office, binary)
+        with pytest.raises(Exception, match="could not be started"):
+            await pool.convert(input_path, str(tmp_path))
+        with patch("services.office_worker_pool.OFFICE_HEALTH_CHECK_COOLDOWN", 0):
+            return await pool.convert(input_path, str(tmp_path))
+
+    assert asyncio.run(run_test()) == input_path.replace(".pptx", ".pdf")
+    assert pool.available is True
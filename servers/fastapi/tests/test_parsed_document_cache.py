@@ -0,0 +1,106 @@
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+from services.parsed_document_cache import ParsedDocumentCache
+
+
+def write_file(path, content):
+    with open(path, "w") as file:
+        file.write(content)
+    return str(path)
+
+
+def test_markdown_is_cached_per_content_and_options(tmp_path):
+    """
+    Same content is a hit regardless of the file path
+    - Other content or converter options are a miss
+    """
+    cache = ParsedDocumentCache(str(tmp_path / "cache"))
+    report = write_file(tmp_path / "report.pdf", "report")
+    report_copy = write_file(tmp_path / "report copy.pdf", "report")
+    other = write_file(tmp_path / "other.pdf", "other")
+
+    async def run_test():
+        report_hash = await cache.get_file_hash(report)
+        cache_key = cache.get_cache_key(report_hash, "docling")
+        assert await cache.get_markdown(cache_key) is None
+        await cache.set_markdown(cache_key, "# Report")
+
+        copy_key = cache.get_cache_key(await cache.get_file_hash(report_copy), "docling")
+        assert await cache.get_markdown(copy_key) == "# Report"
+        assert await cache.get_markdown(
+            cache.get_cache_key(report_hash, "docling;ocr=true")
+        ) is None
+        assert await cache.get_markdown(
+            cache.get_cache_key(await cache.get_file_hash(other), "docling")
+        ) is None
+
+    asyncio.run(run_test())
+
+
+def test_images_are_copied_in_page_order(tmp_path):
+    cache = ParsedDocumentCache(str(tmp_path / "cache"))
+    image_paths = [
+        write_file(tmp_path / f"page_{page}.png", f"image {page}")
+        for page in range(1, 12)
+    ]
+
+    async def run_test():
+        await cache.set_images("document", image_paths)
+        return await cache.get_images("document", str(tmp_path / "output"))
+
+    cached_paths = asyncio.run(run_test())
+    assert cached_paths == [
+        str(tmp_path / "output" / f"page_{page}.png") for page in range(1, 12)
+    ]
+    with open(cached_paths[10]) as file:
+        assert file.read() == "image 11"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """
+    Cache of 1 MB keeps two entries of 400 KB
+    - Reading an entry makes it recently used
+    """
+    cache = ParsedDocumentCache(str(tmp_path / "cache"), max_size_mb=1)
+    markdown = "a" * 400 * 1024
+
+    async def run_test():
+        await cache.set_markdown("first", markdown)
+        await cache.set_markdown("second", markdown)
+        old = time.time() - 60
+        os.utime(tmp_path / "cache" / "first", (old, old))
+        os.utime(tmp_path / "cache" / "second", (old - 60, old - 60))
+        await cache.get_markdown("second")
+        await cache.set_markdown("third", markdown)
+        return [
+            await cache.get_markdown(key) is not None
+            for key in ["first", "second", "third"]
+        ]
+
+    assert asyncio.run(run_test()) == [False, True, True]
+
+
+def test_eviction_only_runs_when_size_limit_is_crossed(tmp_path):
+    """
+    Cache directory is walked on the first write and once the tracked size
+    crosses the limit, not on every write
+    """
+    cache = ParsedDocumentCache(str(tmp_path / "cache"), max_size_mb=1)
+    markdown = "a" * 300 * 1024
+
+    async def run_test():
+        with patch.object(cache, "evict", wraps=cache.evict) as evict:
+            for key in ["first", "second", "third"]:
+                await cache.set_markdown(key, markdown)
+            assert evict.call_count == 1
+            await cache.set_markdown("fourth", markdown)
+            assert evict.call_count == 2
+        return [
+            await cache.get_markdown(key) is not None
+            for key in ["first", "second", "third", "fourth"]
+        ]
+
+    assert asyncio.run(run_test()) == [False, True, True, True]
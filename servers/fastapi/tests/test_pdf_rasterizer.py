@@ -0,0 +1,65 @@
+import asyncio
+import os
+
+import pytest
+from PIL import Image
+
+from services.pdf_rasterizer import PdfRasterizer
+
+
+@pytest.fixture(scope="module")
+def rasterizer():
+    rasterizer = PdfRasterizer(max_workers=2)
+    yield rasterizer
+    rasterizer.shutdown()
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """
+    Creates a 3 page PDF of 1 x 1 inch pages
+    """
+    pages = [Image.new("RGB", (72, 72), color) for color in ["red", "green", "blue"]]
+    path = str(tmp_path / "document.pdf")
+    pages[0].save(path, save_all=True, append_images=pages[1:], resolution=72)
+    return path
+
+
+def test_rasterize_all_pages_in_order(rasterizer, pdf_path, tmp_path):
+    """
+    Every page is rendered and paths are returned in page order
+    - Image size follows the requested dpi
+    """
+    output_directory = str(tmp_path / "pages")
+    image_paths = asyncio.run(
+        rasterizer.rasterize_all(pdf_path, output_directory, dpi=144)
+    )
+
+    assert image_paths == [
+        os.path.join(output_directory, f"page_{page}.png") for page in [1, 2, 3]
+    ]
+    with Image.open(image_paths[2]) as image:
+        assert image.size == (144, 144)
+        assert image.convert("RGB").getpixel((72, 72))[2] > 200
+
+
+def test_rasterize_streams_selected_pages(rasterizer, pdf_path, tmp_path):
+    async def run_test():
+        return [
+            each
+            async for each in rasterizer.rasterize(
+                pdf_path,
+                str(tmp_path),
+                dpi=72,
+                pages=[1, 3],
+                image_format="jpeg",
+                filename_prefix="slide",
+            )
+        ]
+
+    results = asyncio.run(run_test())
+    assert sorted(results) == [
+        (1, str(tmp_path / "slide_1.jpeg")),
+        (3, str(tmp_path / "slide_3.jpeg")),
+    ]
+    assert not os.path.exists(tmp_path / "slide_2.jpeg")
@@ -0,0 +1,56 @@
+from services.pdf_text_extractor import extract_pdf_markdown, pdf_lines_to_markdown
+from tests.pdf_utils import write_pdf
+
+BODY_TEXT = "Revenue grew in every region during the last quarter of the year."
+
+
+def make_line(text, size, top):
+    return {
+        "text": text,
+        "top": top,
+        "bottom": top + size,
+        "chars": [{"size": size} for _ in text],
+    }
+
+
+def test_lines_are_converted_to_markdown():
+    """
+    Larger fonts become headings by size
+    - Wrapped lines are joined into paragraphs, gaps start new paragraphs
+    - Bullets become list items
+    """
+    body = "x" * 200
+    lines = [
+        make_line("Annual Report", 24, 0),
+        make_line("Overview", 16, 40),
+        make_line("Sales grew in every", 10, 70),
+        make_line("region.", 10, 82),
+        make_line(body, 10, 110),
+        make_line("• Europe", 10, 122),
+        make_line("• Asia", 10, 134),
+    ]
+    assert pdf_lines_to_markdown([lines]) == "\n\n".join(
+        [
+            "# Annual Report",
+            "## Overview",
+            "Sales grew in every region.",
+            body,
+            "- Europe",
+            "- Asia",
+        ]
+    )
+
+
+def test_text_pdf_is_extracted_and_sparse_pdf_is_left_to_docling(tmp_path):
+    text_pdf = write_pdf(
+        tmp_path / "text.pdf",
+        [(20, 720, "Quarterly Report")]
+        + [(10, 690 - index * 12, BODY_TEXT) for index in range(5)],
+    )
+    markdown = extract_pdf_markdown(text_pdf)
+    assert markdown.startswith("# Quarterly Report\n\n")
+    assert markdown.count(BODY_TEXT) == 5
+
+    sparse_pdf = write_pdf(tmp_path / "sparse.pdf", [(10, 720, "Figure 1")])
+    assert extract_pdf_markdown(sparse_pdf) is None
+    assert extract_pdf_markdown(sparse_pdf, check_layout=False) == "Figure 1"
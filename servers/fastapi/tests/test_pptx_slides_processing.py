@@ -6,6 +6,7 @@ from fastapi import UploadFile
 import pytest
 
 from api.main import app
+from api.v1.ppt.endpoints.pptx_slides import _extract_slide_xmls
 
 
 client = TestClient(app)
@@ -133,6 +134,21 @@ def test_invalid_file_type():
             os.unlink(temp_file.name)
 
 
+def test_extract_slide_xmls_reads_only_slide_members(tmp_path):
+    """Test that slide XMLs are read from the archive in slide order without unpacking it."""
+    pptx_path = tmp_path / "test.pptx"
+    with zipfile.ZipFile(pptx_path, 'w') as zip_file:
+        for number in [10, 2, 1]:
+            zip_file.writestr(f"ppt/slides/slide{number}.xml", f"<slide>{number}</slide>")
+        zip_file.writestr("ppt/slides/_rels/slide1.xml.rels", "<rels/>")
+        zip_file.writestr("ppt/media/video1.mp4", b"0" * 1024)
+
+    slide_xmls = _extract_slide_xmls(str(pptx_path))
+
+    assert slide_xmls == ["<slide>1</slide>", "<slide>2</slide>", "<slide>10</slide>"]
+    assert os.listdir(tmp_path) == ["test.pptx"]
+
+
 if __name__ == "__main__":
     print("Running PPTX slides processing tests...")
     test_pptx_slides_processing()
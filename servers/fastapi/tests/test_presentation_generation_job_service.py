@@ -0,0 +1,212 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from enums.job_status import JobStatus
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.presentation_and_path import PresentationPathAndEditPath
+from models.sql.presentation_generation_job import PresentationGenerationJob
+from services.presentation_generation_job_service import (
+    PresentationGenerationJobService,
+)
+
+
+@pytest.fixture
+def session_maker(tmp_path):
+    """
+    Points the job service to a fresh sqlite database
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    asyncio.run(create_tables())
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    with patch(
+        "services.presentation_generation_job_service.async_session_maker",
+        session_maker,
+    ):
+        yield session_maker
+
+
+async def wait_for_jobs(service, job_ids, timeout=10):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        jobs = [await service.get(job_id) for job_id in job_ids]
+        if all(
+            job.status in (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
+            for job in jobs
+        ):
+            return jobs
+        assert asyncio.get_running_loop().time() < deadline, "Jobs did not finish"
+        await asyncio.sleep(0.05)
+
+
+def test_job_runs_pipeline_and_records_progress(session_maker):
+    """
+    Submitted job is run by a worker
+    - Progress reported by the pipeline is persisted while the job runs
+    - Result is stored once the job completes
+    - Errors of the pipeline fail the job with the error message
+    """
+    progress_seen = []
+
+    async def pipeline(request, user_id, on_progress, presentation_id):
+        if request.prompt == "fail":
+            raise HTTPException(400, "Failed to generate presentation outlines")
+        await on_progress("slides", 50)
+        progress_seen.append((await service.get(job_id)).progress)
+        return PresentationPathAndEditPath(
+            presentation_id="presentation",
+            path=f"/exports/{user_id}.{request.export_as}",
+            edit_path="/presentation?id=presentation",
+        )
+
+    service = PresentationGenerationJobService(workers=1, pipeline=pipeline)
+
+    async def run_test():
+        nonlocal job_id
+        service.start()
+        job = await service.submit(
+            GeneratePresentationRequest(prompt="solar system", export_as="pdf"),
+            "user",
+        )
+        job_id = job.id
+        assert job.status == JobStatus.QUEUED.value
+        failing_job = await service.submit(
+            GeneratePresentationRequest(prompt="fail"), "user"
+        )
+        jobs = await wait_for_jobs(service, [job.id, failing_job.id])
+        await service.stop()
+        return jobs
+
+    job_id = None
+    completed_job, failed_job = asyncio.run(run_test())
+
+    assert progress_seen == [50]
+    assert completed_job.status == JobStatus.COMPLETED.value
+    assert completed_job.progress == 100
+    assert completed_job.attempts == 1
+    assert completed_job.result["path"] == "/exports/user.pdf"
+    assert failed_job.status == JobStatus.FAILED.value
+    assert failed_job.error == "Failed to generate presentation outlines"
+
+
+def test_stale_running_jobs_are_requeued(session_maker):
+    """
+    Running jobs without a recent heartbeat were interrupted
+    - They are run again if they have attempts left
+    - They fail once they ran out of attempts
+    """
+    interrupted_at = datetime.now() - timedelta(minutes=10)
+    jobs = [
+        PresentationGenerationJob(
+            user_id="user",
+            status=JobStatus.RUNNING.value,
+            request={"prompt": "interrupted"},
+            attempts=attempts,
+            created_at=interrupted_at,
+            updated_at=interrupted_at,
+        )
+        for attempts in [1, 3]
+    ]
+
+    async def pipeline(request, user_id, on_progress, presentation_id):
+        return PresentationPathAndEditPath(
+            presentation_id="presentation", path="/exports/a.pptx", edit_path="/"
+        )
+
+    service = PresentationGenerationJobService(
+        workers=1, pipeline=pipeline, max_attempts=3
+    )
+
+    async def run_test():
+        async with session_maker() as session:
+            session.add_all(jobs)
+            await session.commit()
+        service.start()
+        result = await wait_for_jobs(service, [job.id for job in jobs])
+        await service.stop()
+        return result
+
+    retried_job, exhausted_job = asyncio.run(run_test())
+    assert retried_job.status == JobStatus.COMPLETED.value
+    assert retried_job.attempts == 2
+    assert exhausted_job.status == JobStatus.FAILED.value
+    assert exhausted_job.attempts == 3
+
+
+def test_workers_bound_concurrent_generations(session_maker):
+    running = 0
+    max_running = 0
+
+    async def pipeline(request, user_id, on_progress, presentation_id):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.2)
+        running -= 1
+        return PresentationPathAndEditPath(
+            presentation_id=request.prompt, path="/exports/a.pptx", edit_path="/"
+        )
+
+    service = PresentationGenerationJobService(workers=2, pipeline=pipeline)
+
+    async def run_test():
+        service.start()
+        jobs = [
+            await service.submit(GeneratePresentationRequest(prompt=str(i)), "user")
+            for i in range(5)
+        ]
+        result = await wait_for_jobs(service, [job.id for job in jobs])
+        await service.stop()
+        return result
+
+    jobs = asyncio.run(run_test())
+    assert all(job.status == JobStatus.COMPLETED.value for job in jobs)
+    assert max_running == 2
+
+
+def test_retried_job_keeps_its_presentation_id(session_maker):
+    """
+    Every attempt of a job generates the same presentation, so a retry
+    after a crash doesn't save a duplicate
+    """
+    presentation_ids = []
+
+    async def pipeline(request, user_id, on_progress, presentation_id):
+        presentation_ids.append(presentation_id)
+        if len(presentation_ids) == 1:
+            raise asyncio.CancelledError()
+        return PresentationPathAndEditPath(
+            presentation_id=presentation_id, path="/exports/a.pptx", edit_path="/"
+        )
+
+    service = PresentationGenerationJobService(
+        workers=1, pipeline=pipeline, heartbeat_interval=60, stale_after=0
+    )
+
+    async def run_test():
+        job = await service.submit(GeneratePresentationRequest(prompt="a"), "user")
+        claimed_job = await service._claim_next_job()
+        # First attempt is interrupted without finishing the job
+        with pytest.raises(asyncio.CancelledError):
+            await service._run(claimed_job)
+        service.start()
+        (completed_job,) = await wait_for_jobs(service, [job.id])
+        await service.stop()
+        return job, completed_job
+
+    job, completed_job = asyncio.run(run_test())
+
+    assert completed_job.status == JobStatus.COMPLETED.value
+    assert completed_job.attempts == 2
+    assert presentation_ids == [job.presentation_id, job.presentation_id]
+    assert completed_job.result["presentation_id"] == job.presentation_id
@@ -0,0 +1,117 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from api.v1.ppt.endpoints.presentation import PRESENTATION_ROUTER
+from dependencies.auth import get_current_user_id
+from models.sql.presentation import PresentationModel
+from models.sql.slide import SlideModel
+from services.database import get_async_session
+
+
+@pytest.fixture
+def client(tmp_path):
+    """
+    Serves the presentation router on a fresh sqlite database with
+    5 presentations of the user, one presentation without slides and
+    one presentation of another user
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    created_at = datetime(2025, 1, 1)
+
+    def presentation(id, user_id="user", days=0, with_slides=True):
+        models = [
+            PresentationModel(
+                id=id,
+                user_id=user_id,
+                prompt=f"prompt {id}",
+                n_slides=2,
+                language="English",
+                outlines={"slides": []},
+                created_at=created_at + timedelta(days=days),
+                updated_at=created_at + timedelta(days=days),
+            )
+        ]
+        if with_slides:
+            models += [
+                SlideModel(
+                    user_id=user_id,
+                    presentation=id,
+                    layout_group="general",
+                    layout=f"layout-{index}",
+                    index=index,
+                    content={"title": f"{id} slide {index}"},
+                    html_content=None,
+                    speaker_note="",
+                    properties=None,
+                )
+                for index in [1, 0]
+            ]
+        return models
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with session_maker() as session:
+            # Two presentations share created_at, ids break the tie
+            for id, days in [("a", 0), ("b", 1), ("c", 2), ("d", 2), ("e", 3)]:
+                session.add_all(presentation(id, days=days))
+            session.add_all(presentation("draft", days=4, with_slides=False))
+            session.add_all(presentation("other", user_id="other", days=5))
+            await session.commit()
+
+    asyncio.run(create())
+
+    async def get_session():
+        async with session_maker() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(PRESENTATION_ROUTER)
+    app.dependency_overrides[get_async_session] = get_session
+    app.dependency_overrides[get_current_user_id] = lambda: "user"
+    with TestClient(app) as client:
+        yield client
+
+
+def test_all_presentations_come_with_their_first_slide(client):
+    response = client.get("/presentation/all")
+    assert response.status_code == 200
+    presentations = response.json()
+    assert [each["id"] for each in presentations] == ["e", "d", "c", "b", "a"]
+    assert all(len(each["slides"]) == 1 for each in presentations)
+    assert presentations[0]["slides"][0]["content"] == {"title": "e slide 0"}
+
+
+def test_presentations_are_listed_page_by_page(client):
+    """
+    Pages follow each other without gaps or duplicates, newest first
+    - Summary leaves out slides and large JSON fields
+    """
+    ids = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "summary": True}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/presentation/list", params=params).json()
+        ids.append([each["id"] for each in page["presentations"]])
+        assert all("slides" not in each for each in page["presentations"])
+        assert all("layout" not in each for each in page["presentations"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert ids == [["e", "d"], ["c", "b"], ["a"]]
+
+    page = client.get("/presentation/list", params={"limit": 1}).json()
+    assert page["presentations"][0]["slides"][0]["layout"] == "layout-0"
+
+    response = client.get("/presentation/list", params={"cursor": "invalid"})
+    assert response.status_code == 400
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from api.v1.ppt.endpoints.presentation import PRESENTATION_ROUTER
+from api.v1.ppt.endpoints.slide import SLIDE_ROUTER
+from dependencies.auth import get_current_user_id
+from models.sql.presentation import PresentationModel
+from models.sql.slide import SlideModel
+from services.database import get_async_session
+
+
+@pytest.fixture
+def statements():
+    return []
+
+
+@pytest.fixture
+def client(tmp_path, statements):
+    """
+    Serves the presentation and slide routers on a fresh sqlite database
+    with one presentation of 3 slides, and records the slide writes
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with session_maker() as session:
+            session.add(
+                PresentationModel(
+                    id="p",
+                    user_id="user",
+                    prompt="prompt",
+                    n_slides=3,
+                    language="English",
+                    created_at=datetime(2025, 1, 1),
+                    updated_at=datetime(2025, 1, 1),
+                )
+            )
+            session.add_all(
+                [
+                    SlideModel(
+                        id=f"s{index}",
+                        user_id="user",
+                        presentation="p",
+                        layout_group="general",
+                        layout=f"layout-{index}",
+                        index=index,
+                        content={"title": f"slide {index}"},
+                        html_content=None,
+                        speaker_note=f"note {index}",
+                        properties=None,
+                    )
+                    for index in range(3)
+                ]
+            )
+            await session.commit()
+
+    asyncio.run(create())
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        if "slidemodel" in statement and not statement.startswith("SELECT"):
+            statements.append(statement.split()[0])
+
+    async def get_session():
+        async with session_maker() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(PRESENTATION_ROUTER)
+    app.include_router(SLIDE_ROUTER)
+    app.dependency_overrides[get_async_session] = get_session
+    app.dependency_overrides[get_current_user_id] = lambda: "user"
+    with TestClient(app) as client:
+        yield client
+
+
+def test_update_writes_only_changed_slides(client, statements):
+    """
+    Saving the presentation updates changed slides, inserts new slides
+    and deletes removed slides, unchanged slides aren't written
+    """
+    presentation = client.get("/presentation", params={"id": "p"}).json()
+    slides = sorted(presentation["slides"], key=lambda slide: slide["index"])
+    slides[1]["content"] = {"title": "edited"}
+    slides[2] = {
+        **slides[2],
+        "id": "new",
+        "content": {"title": "new slide"},
+    }
+    presentation["slides"] = slides
+
+    response = client.put("/presentation/update", json=presentation)
+    assert response.status_code == 200
+    assert sorted(statements) == ["DELETE", "INSERT", "UPDATE"]
+
+    saved = client.get("/presentation", params={"id": "p"}).json()
+    saved_slides = {slide["id"]: slide for slide in saved["slides"]}
+    assert sorted(saved_slides) == ["new", "s0", "s1"]
+    assert saved_slides["s1"]["content"] == {"title": "edited"}
+    assert saved_slides["new"]["content"] == {"title": "new slide"}
+
+    statements.clear()
+    client.put("/presentation/update", json=saved)
+    assert statements == []
+
+
+def test_patch_updates_given_slide_fields(client, statements):
+    """
+    A partial update only changes the fields in the request
+    """
+    response = client.patch(
+        "/slide/update", json={"id": "s1", "content": {"title": "patched"}}
+    )
+    assert response.status_code == 200
+    slide = response.json()
+    assert slide["content"] == {"title": "patched"}
+    assert slide["speaker_note"] == "note 1"
+    assert statements == ["UPDATE"]
+
+    statements.clear()
+    client.patch("/slide/update", json={"id": "s1", "speaker_note": "note 1"})
+    assert statements == []
+
+    response = client.patch("/slide/update", json={"id": "missing"})
+    assert response.status_code == 404
+
+
+def test_patch_rejects_null_for_required_fields(client, statements):
+    """
+    Required slide fields can't be cleared, optional ones can
+    """
+    for field in ["content", "speaker_note", "layout", "index"]:
+        response = client.patch("/slide/update", json={"id": "s1", field: None})
+        assert response.status_code == 422
+    assert statements == []
+
+    response = client.patch("/slide/update", json={"id": "s1", "properties": None})
+    assert response.status_code == 200
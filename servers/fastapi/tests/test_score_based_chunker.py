@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import pytest
+
+from services.score_based_chunker import ScoreBasedChunker
+
+DOCUMENT = """Preface is not part of any chunk
+# Report
+Intro text
+## Sales
+Sales text
+#### Details
+Detail text
+## Sales
+Second sales text
+"""
+
+
+def test_chunks_run_until_next_selected_heading():
+    """
+    Content of a chunk includes headings that were not selected
+    - Repeated headings map to their own position
+    """
+    chunks = ScoreBasedChunker().get_chunks(DOCUMENT, top_k=3)
+
+    assert [(chunk.heading, chunk.heading_index) for chunk in chunks] == [
+        ("# Report", 0),
+        ("## Sales", 1),
+        ("## Sales", 3),
+    ]
+    assert chunks[0].content == "Intro text"
+    assert chunks[1].content == "Sales text\n#### Details\nDetail text"
+    assert chunks[2].content == "Second sales text"
+
+
+def test_lines_iterator_gives_same_chunks():
+    chunker = ScoreBasedChunker()
+    lines = iter(DOCUMENT.split("\n"))
+    assert chunker.get_chunks(lines, top_k=3) == chunker.get_chunks(DOCUMENT, top_k=3)
+
+
+def test_large_document_is_chunked_in_linear_time():
+    lines = []
+    for i in range(10000):
+        lines.append(f"{'#' * (1 + i % 4)} Section {i}")
+        lines.append(f"Text of section {i}")
+
+    start = time.perf_counter()
+    chunks = asyncio.run(ScoreBasedChunker().get_n_chunks("\n".join(lines), 20))
+    assert time.perf_counter() - start < 2
+    assert len(chunks) == 20
+
+
+def test_get_n_chunks_raises_when_headings_are_missing():
+    with pytest.raises(ValueError, match="Only 4 chunks found"):
+        asyncio.run(ScoreBasedChunker().get_n_chunks(DOCUMENT, 5))
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from services.semantic_chunker import MAX_EMBEDDED_UNITS, SemanticChunker
+
+TOPICS = ["cats", "rockets", "markets"]
+
+
+def embed_by_topic(texts):
+    """
+    Embeds every text as the counts of the topic words it contains
+    """
+    return [[text.count(topic) + 0.01 for topic in TOPICS] for text in texts]
+
+
+def make_document(sentences_per_topic):
+    paragraphs = []
+    for topic, count in zip(TOPICS, sentences_per_topic):
+        paragraphs.append(
+            " ".join(f"Sentence {index} is about {topic}." for index in range(count))
+        )
+    return "\n\n".join(paragraphs)
+
+
+def test_sections_split_where_topic_changes():
+    """
+    Boundaries near an equal share of the text move to the topic changes
+    """
+    chunker = SemanticChunker(embed=embed_by_topic)
+    chunks = asyncio.run(chunker.get_n_chunks(make_document([10, 8, 12]), 3))
+
+    assert [chunk.heading for chunk in chunks] == [
+        "Sentence 0 is about cats.",
+        "Sentence 0 is about rockets.",
+        "Sentence 0 is about markets.",
+    ]
+    for chunk, topic in zip(chunks, TOPICS):
+        assert chunk.content.count(topic) == chunk.content.count("Sentence")
+    assert chunks[1].to_slide_outline().content.count("rockets") == 8
+
+
+def test_too_short_documents_raise():
+    chunker = SemanticChunker(embed=embed_by_topic)
+    with pytest.raises(ValueError, match="Only 0 chunks found"):
+        asyncio.run(chunker.get_n_chunks("One sentence. Two sentences.", 3))
+
+
+def test_long_documents_are_embedded_in_groups():
+    embedded = []
+
+    def embed(texts):
+        embedded.extend(texts)
+        return embed_by_topic(texts)
+
+    chunker = SemanticChunker(embed=embed)
+    chunks = chunker.get_chunks(make_document([3000, 3000, 3000]), 5)
+
+    assert len(embedded) <= MAX_EMBEDDED_UNITS
+    assert len(chunks) == 5
+    assert sum(
+        chunk.to_slide_outline().content.count("Sentence") for chunk in chunks
+    ) == 9000
@@ -0,0 +1,122 @@
+import asyncio
+
+from models.sql.image_asset import ImageAsset
+from models.sql.slide import SlideModel
+from utils.process_slides import SlideAssetsFetcher
+
+
+class FakeImageGenerationService:
+    """
+    Returns an image asset per prompt after a delay, and records when
+    each fetch starts and whether it was cancelled
+    """
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.started = []
+        self.cancelled = []
+
+    async def generate_image(self, prompt):
+        self.started.append(prompt.prompt)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(prompt.prompt)
+            raise
+        return ImageAsset(path=f"/images/{prompt.prompt}.png")
+
+
+class FakeIconFinderService:
+    async def search_icons(self, query, k=1):
+        return [f"/icons/{query}.png"]
+
+
+def make_slide(index):
+    return SlideModel(
+        user_id="user",
+        presentation="presentation",
+        layout_group="general",
+        layout="layout",
+        index=index,
+        content={
+            "image": {"__image_prompt__": f"image-{index}"},
+            "icon": {"__icon_query__": f"icon-{index}"},
+        },
+        html_content=None,
+        speaker_note="",
+        properties=None,
+    )
+
+
+def test_assets_of_early_slides_are_fetched_during_generation():
+    """
+    Assets of a slide start fetching while later slides are still generated
+    """
+    image_generation_service = FakeImageGenerationService()
+    fetcher = SlideAssetsFetcher(image_generation_service, FakeIconFinderService())
+
+    async def run_test():
+        started_before_next_slide = []
+        for index in range(3):
+            fetcher.schedule(make_slide(index))
+            # Generating the next slide takes a while
+            await asyncio.sleep(0.01)
+            started_before_next_slide.append(list(image_generation_service.started))
+        await fetcher.wait()
+        return started_before_next_slide
+
+    assert asyncio.run(run_test()) == [
+        ["image-0"],
+        ["image-0", "image-1"],
+        ["image-0", "image-1", "image-2"],
+    ]
+
+
+def test_wait_returns_assets_of_every_slide():
+    """
+    Waiting returns the image assets of all slides and fills in the urls
+    """
+    fetcher = SlideAssetsFetcher(
+        FakeImageGenerationService(), FakeIconFinderService()
+    )
+    slides = [make_slide(index) for index in range(3)]
+
+    async def run_test():
+        for slide in slides:
+            fetcher.schedule(slide)
+        return await fetcher.wait()
+
+    assets = asyncio.run(run_test())
+
+    assert [asset.path for asset in assets] == [
+        "/images/image-0.png",
+        "/images/image-1.png",
+        "/images/image-2.png",
+    ]
+    assert slides[1].content["image"]["__image_url__"] == "/images/image-1.png"
+    assert slides[1].content["icon"]["__icon_url__"] == "/icons/icon-1.png"
+
+
+def test_cancel_stops_pending_fetches():
+    """
+    Cancelling after a client disconnect stops fetches that are still
+    running, no task is left pending
+    """
+    image_generation_service = FakeImageGenerationService(delay=10)
+    fetcher = SlideAssetsFetcher(image_generation_service, FakeIconFinderService())
+
+    async def run_test():
+        for index in range(2):
+            fetcher.schedule(make_slide(index))
+        await asyncio.sleep(0.01)
+        fetcher.cancel()
+        await asyncio.gather(*fetcher._tasks, return_exceptions=True)
+        return [
+            task
+            for task in asyncio.all_tasks()
+            if task is not asyncio.current_task()
+        ]
+
+    assert asyncio.run(run_test()) == []
+    assert image_generation_service.cancelled == ["image-0", "image-1"]
+    assert all(task.cancelled() for task in fetcher._tasks)
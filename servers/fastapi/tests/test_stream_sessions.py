@@ -0,0 +1,103 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from api.v1.ppt.endpoints.outlines import stream_outlines
+from models.sql.presentation import PresentationModel
+from services.database import unit_of_work
+
+N_STREAMS = 50
+
+
+@pytest.fixture
+def session_maker(tmp_path):
+    """
+    Points sessions to a fresh sqlite database with a single pooled
+    connection and N_STREAMS presentations
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'app.db'}",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=2,
+    )
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with session_maker() as session:
+            session.add_all(
+                [
+                    PresentationModel(
+                        id=f"presentation-{index}",
+                        user_id="user",
+                        prompt=f"prompt {index}",
+                        n_slides=2,
+                        language="English",
+                    )
+                    for index in range(N_STREAMS)
+                ]
+            )
+            await session.commit()
+
+    asyncio.run(create())
+    with patch("services.database.async_session_maker", session_maker):
+        yield session_maker
+    asyncio.run(engine.dispose())
+
+
+async def generate_outline(prompt, n_slides, language, additional_context):
+    outlines = {"slides": [{"content": f"{prompt} slide {i}"} for i in range(n_slides)]}
+    # LLM streams slowly, every stream is waiting at the same time
+    await asyncio.sleep(0.5)
+    yield json.dumps(outlines)
+
+
+def test_outline_streams_share_small_pool(session_maker):
+    """
+    Streams only hold a connection to load and save, so more streams than
+    pooled connections run at the same time without waiting on the pool
+    """
+
+    async def stream(index):
+        response = await stream_outlines(f"presentation-{index}")
+        return [event async for event in response.body_iterator]
+
+    async def run():
+        with patch(
+            "api.v1.ppt.endpoints.outlines.generate_ppt_outline", generate_outline
+        ):
+            results = await asyncio.gather(
+                *[stream(index) for index in range(N_STREAMS)]
+            )
+        async with session_maker() as session:
+            saved = await session.get(PresentationModel, "presentation-7")
+        return results, saved
+
+    results, saved = asyncio.run(run())
+
+    assert all('"type": "complete"' in events[-1] for events in results)
+    assert saved.title == "prompt 7 slide 0"
+    assert saved.outlines["slides"][1]["content"] == "prompt 7 slide 1"
+
+
+def test_unit_of_work_rolls_back_failed_step(session_maker):
+    """
+    Changes of a failed step are not committed
+    """
+
+    async def run():
+        with pytest.raises(ValueError):
+            async with unit_of_work() as session:
+                presentation = await session.get(PresentationModel, "presentation-0")
+                presentation.title = "changed"
+                raise ValueError("step failed")
+        async with unit_of_work() as session:
+            return await session.get(PresentationModel, "presentation-0")
+
+    assert asyncio.run(run()).title is None
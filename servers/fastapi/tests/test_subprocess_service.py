@@ -0,0 +1,77 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from services.subprocess_service import SubprocessService
+
+
+def python_command(code: str):
+    return [sys.executable, "-c", code]
+
+
+def test_run_captures_output():
+    service = SubprocessService()
+    result = asyncio.run(
+        service.run(
+            python_command("import sys; print('out'); print('err', file=sys.stderr)"),
+            timeout=10,
+        )
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip() == "out"
+    assert result.stderr.strip() == "err"
+
+
+def test_failed_and_timed_out_commands_raise():
+    service = SubprocessService()
+
+    async def run_test():
+        with pytest.raises(Exception, match="failed: boom"):
+            await service.run(
+                python_command("import sys; sys.exit('boom')"), timeout=10
+            )
+
+        result = await service.run(
+            python_command("import sys; sys.exit(3)"), timeout=10, check=False
+        )
+        assert result.returncode == 3
+
+        with pytest.raises(Exception, match="timed out"):
+            await service.run(python_command("import time; time.sleep(10)"), timeout=0.5)
+
+    asyncio.run(run_test())
+
+
+def test_commands_do_not_block_event_loop_and_are_limited():
+    """
+    Event loop keeps running while commands run
+    - Only max_concurrency commands run at the same time
+    """
+    service = SubprocessService(max_concurrency=2)
+
+    async def run_test():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        start = time.monotonic()
+        await asyncio.gather(
+            *[
+                service.run(python_command("import time; time.sleep(0.5)"), timeout=10)
+                for _ in range(4)
+            ]
+        )
+        elapsed = time.monotonic() - start
+        ticker.cancel()
+        return ticks, elapsed
+
+    ticks, elapsed = asyncio.run(run_test())
+    assert ticks > 20
+    assert elapsed >= 1.0
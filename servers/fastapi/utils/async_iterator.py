@@ -1,5 +1,14 @@
 import asyncio
-from typing import AsyncGenerator, Callable, Iterator, TypeVar
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
@@ -14,3 +23,41 @@ def iterator_to_async(
             await asyncio.sleep(0)
 
     return wrapper
+
+
+async def gather_in_order_with_limit(
+    factories: List[Callable[[], Awaitable[T]]],
+    limit: int,
+) -> AsyncGenerator[Tuple[int, T], None]:
+    """
+    Runs at most `limit` awaitables at a time and yields (index, result) pairs
+    in input order, as soon as every earlier result is available.
+    Pending tasks are cancelled if the consumer stops iterating or a task fails.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    tasks = [asyncio.create_task(run(factory)) for factory in factories]
+    task_indices = {task: index for index, task in enumerate(tasks)}
+    completed: Dict[int, T] = {}
+    next_index = 0
+    pending = set(tasks)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                completed[task_indices[task]] = task.result()
+
+            while next_index in completed:
+                yield next_index, completed.pop(next_index)
+                next_index += 1
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
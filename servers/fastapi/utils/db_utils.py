@@ -1,8 +1,30 @@
 import os
-from utils.get_env import get_app_data_directory_env, get_database_url_env
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from models.database_engine_profile import DatabaseEngineProfile
+from utils.get_env import (
+    get_app_data_directory_env,
+    get_database_max_overflow_env,
+    get_database_pool_pre_ping_env,
+    get_database_pool_recycle_env,
+    get_database_pool_size_env,
+    get_database_pool_timeout_env,
+    get_database_url_env,
+    get_sqlite_busy_timeout_ms_env,
+    get_sqlite_mmap_size_mb_env,
+)
+from utils.parsers import parse_bool_or_none, parse_int_or_none
 from urllib.parse import urlsplit, urlunsplit, parse_qsl
 import ssl
 
+DEFAULT_DATABASE_POOL_SIZE = 10
+DEFAULT_DATABASE_MAX_OVERFLOW = 20
+DEFAULT_DATABASE_POOL_TIMEOUT = 30
+# Connections are replaced before servers or proxies drop them for being idle
+DEFAULT_DATABASE_POOL_RECYCLE = 1800
+DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+DEFAULT_SQLITE_MMAP_SIZE_MB = 256
+
 
 def get_database_url_and_connect_args() -> tuple[str, dict]:
     database_url = get_database_url_env() or "sqlite:///" + os.path.join(
@@ -46,3 +68,71 @@ def get_database_url_and_connect_args() -> tuple[str, dict]:
         pass
 
     return database_url, connect_args
+
+
+def _get_int_env(value: str | None, default: int) -> int:
+    parsed = parse_int_or_none(value)
+    return default if parsed is None else parsed
+
+
+def get_database_engine_profile(database_url: str) -> DatabaseEngineProfile:
+    """
+    Returns the engine settings for the database backend.
+    - Postgres and MySQL keep a pool of connections which are checked before
+      use and recycled, instead of opening connections under load
+    - SQLite uses WAL, so readers don't block the writer, and waits for
+      locks instead of failing with "database is locked"
+    """
+    backend = database_url.split(":", 1)[0].split("+", 1)[0]
+    if backend == "sqlite":
+        return DatabaseEngineProfile(
+            backend=backend,
+            sqlite_pragmas={
+                "journal_mode": "WAL",
+                # Durable in WAL mode, only the last commits may be lost on power loss
+                "synchronous": "NORMAL",
+                "busy_timeout": _get_int_env(
+                    get_sqlite_busy_timeout_ms_env(), DEFAULT_SQLITE_BUSY_TIMEOUT_MS
+                ),
+                "mmap_size": _get_int_env(
+                    get_sqlite_mmap_size_mb_env(), DEFAULT_SQLITE_MMAP_SIZE_MB
+                )
+                * 1024
+                * 1024,
+            },
+        )
+
+    pool_pre_ping = parse_bool_or_none(get_database_pool_pre_ping_env())
+    return DatabaseEngineProfile(
+        backend=backend,
+        pool_size=_get_int_env(get_database_pool_size_env(), DEFAULT_DATABASE_POOL_SIZE),
+        max_overflow=_get_int_env(
+            get_database_max_overflow_env(), DEFAULT_DATABASE_MAX_OVERFLOW
+        ),
+        pool_timeout=_get_int_env(
+            get_database_pool_timeout_env(), DEFAULT_DATABASE_POOL_TIMEOUT
+        ),
+        pool_recycle=_get_int_env(
+            get_database_pool_recycle_env(), DEFAULT_DATABASE_POOL_RECYCLE
+        ),
+        pool_pre_ping=True if pool_pre_ping is None else pool_pre_ping,
+    )
+
+
+def create_database_engine(
+    database_url: str, connect_args: dict, profile: DatabaseEngineProfile
+) -> AsyncEngine:
+    engine = create_async_engine(
+        database_url, connect_args=connect_args, **profile.get_engine_options()
+    )
+
+    if profile.sqlite_pragmas:
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, _):
+            cursor = dbapi_connection.cursor()
+            for name, value in profile.sqlite_pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return engine
@@ -0,0 +1,24 @@
+# Entry points of the document converter worker processes. Kept outside the
+# services package, so spawned workers only import docling instead of
+# creating every service singleton.
+
+# Converter of the worker process, created once when the worker starts
+_docling_service = None
+
+
+def init_document_converter():
+    global _docling_service
+    # Imported here, only worker processes load docling
+    from docling.datamodel.base_models import InputFormat
+    from utils.docling_service import DoclingService
+
+    _docling_service = DoclingService()
+    try:
+        # Loads the PDF layout models before the first job arrives
+        _docling_service.converter.initialize_pipeline(InputFormat.PDF)
+    except Exception as e:
+        print(f"Failed to preload document conversion pipeline: {e}")
+
+
+def parse_to_markdown(file_path: str) -> str:
+    return _docling_service.parse_to_markdown(file_path)
@@ -4,8 +4,7 @@ import mimetypes
 from typing import List, Optional
 from urllib.parse import urlparse
 
-import aiohttp
-
+from services import HTTP_CLIENT_SERVICE
 from utils.randomizers import get_random_uuid
 
 
@@ -18,40 +17,35 @@ async def download_file(
         parsed_url = urlparse(url)
         filename = os.path.basename(parsed_url.path)
 
-        if not filename or "." not in filename:
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.head(url, headers=headers) as response:
-                    if response.status == 200:
-                        content_disposition = response.headers.get(
-                            "Content-Disposition", ""
+        session = HTTP_CLIENT_SERVICE.get_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                print(f"Failed to download file. HTTP status: {response.status}")
+                return None
+
+            # Filename is resolved from the GET response headers
+            # instead of a separate HEAD request
+            if not filename or "." not in filename:
+                content_disposition = response.headers.get("Content-Disposition", "")
+                if "filename=" in content_disposition:
+                    filename = content_disposition.split("filename=")[1].strip("\"'")
+                else:
+                    content_type = response.headers.get("Content-Type", "")
+                    if content_type:
+                        extension = mimetypes.guess_extension(
+                            content_type.split(";")[0]
                         )
-                        if "filename=" in content_disposition:
-                            filename = content_disposition.split("filename=")[1].strip(
-                                "\"'"
-                            )
-                        else:
-                            content_type = response.headers.get("Content-Type", "")
-                            if content_type:
-                                extension = mimetypes.guess_extension(
-                                    content_type.split(";")[0]
-                                )
-                                if extension:
-                                    filename = f"{get_random_uuid()}{extension}"
+                        if extension:
+                            filename = f"{get_random_uuid()}{extension}"
 
-        filename = filename or get_random_uuid()
-        save_path = os.path.join(save_directory, filename)
+            filename = filename or get_random_uuid()
+            save_path = os.path.join(save_directory, filename)
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    with open(save_path, "wb") as file:
-                        async for chunk in response.content.iter_chunked(8192):
-                            file.write(chunk)
-                    print(f"File downloaded successfully: {save_path}")
-                    return save_path
-                else:
-                    print(f"Failed to download file. HTTP status: {response.status}")
-                    return None
+            with open(save_path, "wb") as file:
+                async for chunk in response.content.iter_chunked(8192):
+                    file.write(chunk)
+            print(f"File downloaded successfully: {save_path}")
+            return save_path
 
     except Exception as e:
         print(f"Error downloading file from {url}: {e}")
@@ -1,6 +1,5 @@
 import json
 import os
-import aiohttp
 from typing import Literal
 from fastapi import HTTPException
 from pathvalidate import sanitize_filename
@@ -8,7 +7,7 @@ from pathvalidate import sanitize_filename
 from models.pptx_models import PptxPresentationModel
 from models.presentation_and_path import PresentationAndPath
 from services.pptx_presentation_creator import PptxPresentationCreator
-from services import TEMP_FILE_SERVICE
+from services import HTTP_CLIENT_SERVICE, TEMP_FILE_SERVICE
 from utils.asset_directory_utils import get_exports_directory
 from utils.randomizers import get_random_uuid
 
@@ -19,18 +18,18 @@ async def export_presentation(
     if export_as == "pptx":
 
         # Get the converted PPTX model from the Next.js service
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"http://localhost/api/presentation_to_pptx_model?id={presentation_id}"
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    print(f"Failed to get PPTX model: {error_text}")
-                    raise HTTPException(
-                        status_code=500,
-                        detail="Failed to convert presentation to PPTX model",
-                    )
-                pptx_model_data = await response.json()
+        session = HTTP_CLIENT_SERVICE.get_internal_session()
+        async with session.get(
+            f"http://localhost/api/presentation_to_pptx_model?id={presentation_id}"
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                print(f"Failed to get PPTX model: {error_text}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="Failed to convert presentation to PPTX model",
+                )
+            pptx_model_data = await response.json()
 
         # Create PPTX file using the converted model
         pptx_model = PptxPresentationModel(**pptx_model_data)
@@ -50,15 +49,15 @@ async def export_presentation(
             path=pptx_path,
         )
     else:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "http://localhost/api/export-as-pdf",
-                json={
-                    "id": presentation_id,
-                    "title": sanitize_filename(title or get_random_uuid()),
-                },
-            ) as response:
-                response_json = await response.json()
+        session = HTTP_CLIENT_SERVICE.get_internal_session()
+        async with session.post(
+            "http://localhost/api/export-as-pdf",
+            json={
+                "id": presentation_id,
+                "title": sanitize_filename(title or get_random_uuid()),
+            },
+        ) as response:
+            response_json = await response.json()
 
         return PresentationAndPath(
             presentation_id=presentation_id,
@@ -0,0 +1,182 @@
+import json
+import random
+from typing import Awaitable, Callable, List, Optional
+
+from fastapi import HTTPException
+
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.presentation_and_path import PresentationPathAndEditPath
+from models.presentation_outline_model import PresentationOutlineModel
+from models.presentation_structure_model import PresentationStructureModel
+from models.sql.presentation import PresentationModel
+from models.sql.slide import SlideModel
+from services import ICON_FINDER_SERVICE
+from services.database import unit_of_work
+from services.image_generation_service import ImageGenerationService
+from utils.asset_directory_utils import get_images_directory
+from utils.export_utils import export_presentation
+from utils.get_layout_by_name import get_layout_by_name
+from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
+from utils.llm_calls.generate_presentation_structure import (
+    generate_presentation_structure,
+)
+from utils.llm_calls.generate_slide_content import (
+    get_slide_contents_from_types_and_outlines,
+)
+from utils.process_slides import SlideAssetsFetcher
+from utils.randomizers import get_random_uuid
+
+# Called with the current stage and the progress in percent
+ProgressCallback = Callable[[str, int], Awaitable[None]]
+
+
+async def generate_presentation(
+    request: GeneratePresentationRequest,
+    user_id: str,
+    on_progress: Optional[ProgressCallback] = None,
+    presentation_id: Optional[str] = None,
+) -> PresentationPathAndEditPath:
+    """
+    Generates outlines, structure, slides and assets of a presentation,
+    saves it and exports it.
+    If the presentation of presentation_id was already saved, e.g. by an
+    interrupted attempt of the same job, it is only exported.
+    """
+
+    async def report(stage: str, progress: int):
+        if on_progress:
+            await on_progress(stage, progress)
+
+    presentation = None
+    if presentation_id:
+        async with unit_of_work() as sql_session:
+            presentation = await sql_session.get(PresentationModel, presentation_id)
+    else:
+        presentation_id = get_random_uuid()
+
+    if presentation is None:
+        presentation = await generate_and_save_presentation(
+            request, user_id, presentation_id, report
+        )
+
+    # 7. Export
+    await report("export", 90)
+    presentation_and_path = await export_presentation(
+        presentation_id, presentation.title or get_random_uuid(), request.export_as
+    )
+
+    return PresentationPathAndEditPath(
+        **presentation_and_path.model_dump(),
+        edit_path=f"/presentation?id={presentation_id}",
+    )
+
+
+async def generate_and_save_presentation(
+    request: GeneratePresentationRequest,
+    user_id: str,
+    presentation_id: str,
+    report: ProgressCallback,
+) -> PresentationModel:
+    # 1. Generate Outlines
+    await report("outlines", 5)
+    presentation_outlines_text = ""
+    async for chunk in generate_ppt_outline(
+        request.prompt,
+        request.n_slides,
+        request.language,
+        "",
+    ):
+        presentation_outlines_text += chunk
+
+    try:
+        presentation_outlines_json = json.loads(presentation_outlines_text)
+    except Exception as e:
+        print(e)
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to generate presentation outlines. Please try again.",
+        )
+    presentation_outlines = PresentationOutlineModel(**presentation_outlines_json)
+    outlines = presentation_outlines.slides[: request.n_slides]
+    total_outlines = len(outlines)
+
+    print("-" * 40)
+    print(f"Generated {total_outlines} outlines for the presentation")
+
+    # 2. Parse Layouts
+    await report("structure", 15)
+    layout_model = await get_layout_by_name(request.template)
+    total_slide_layouts = len(layout_model.slides)
+
+    # 3. Generate Structure
+    if layout_model.ordered:
+        presentation_structure = layout_model.to_presentation_structure()
+    else:
+        presentation_structure: PresentationStructureModel = (
+            await generate_presentation_structure(
+                presentation_outlines,
+                layout_model,
+            )
+        )
+
+    presentation_structure.slides = presentation_structure.slides[:total_outlines]
+    for index in range(total_outlines):
+        random_slide_index = random.randint(0, total_slide_layouts - 1)
+        if index >= len(presentation_structure.slides):
+            presentation_structure.slides.append(random_slide_index)
+            continue
+        if presentation_structure.slides[index] >= total_slide_layouts:
+            presentation_structure.slides[index] = random_slide_index
+
+    # 4. Create PresentationModel
+    presentation = PresentationModel(
+        id=presentation_id,
+        user_id=user_id,  # Associate presentation with current user
+        prompt=request.prompt,
+        n_slides=request.n_slides,
+        language=request.language,
+        outlines=presentation_outlines.model_dump(),
+        layout=layout_model.model_dump(),
+        structure=presentation_structure.model_dump(),
+    )
+
+    image_generation_service = ImageGenerationService(get_images_directory())
+    assets_fetcher = SlideAssetsFetcher(image_generation_service, ICON_FINDER_SERVICE)
+
+    # 5. Generate slide content and save slides
+    await report("slides", 20)
+    slides: List[SlideModel] = []
+    slide_layouts = [
+        layout_model.slides[index] for index in presentation_structure.slides
+    ]
+    try:
+        async for i, slide_content in get_slide_contents_from_types_and_outlines(
+            slide_layouts, outlines, request.language
+        ):
+            slide_layout = slide_layouts[i]
+            print(f"Generated content for slide {i} with layout {slide_layout.id}")
+            slide = SlideModel(
+                user_id=user_id,  # Associate slide with current user
+                presentation=presentation_id,
+                layout_group=layout_model.name,
+                layout=slide_layout.id,
+                index=i,
+                speaker_note=slide_content.get("__speaker_note__", ""),
+                content=slide_content,
+            )
+            assets_fetcher.schedule(slide)
+            slides.append(slide)
+            await report("slides", 20 + 60 * len(slides) // len(slide_layouts))
+
+        await report("assets", 85)
+        generated_assets = await assets_fetcher.wait()
+    finally:
+        assets_fetcher.cancel()
+
+    # 6. Save PresentationModel and Slides
+    async with unit_of_work() as sql_session:
+        sql_session.add(presentation)
+        sql_session.add_all(slides)
+        sql_session.add_all(generated_assets)
+
+    return presentation
@@ -95,3 +95,83 @@ def get_extended_reasoning_env():
 
 def get_web_grounding_env():
     return os.getenv("WEB_GROUNDING")
+
+
+def get_slide_generation_concurrency_env():
+    return os.getenv("SLIDE_GENERATION_CONCURRENCY")
+
+
+def get_icon_index_backend_env():
+    return os.getenv("ICON_INDEX_BACKEND")
+
+
+def get_image_cache_ttl_hours_env():
+    return os.getenv("IMAGE_CACHE_TTL_HOURS")
+
+
+def get_image_cache_max_size_mb_env():
+    return os.getenv("IMAGE_CACHE_MAX_SIZE_MB")
+
+
+def get_office_worker_pool_size_env():
+    return os.getenv("OFFICE_WORKER_POOL_SIZE")
+
+
+def get_office_worker_max_jobs_env():
+    return os.getenv("OFFICE_WORKER_MAX_JOBS")
+
+
+def get_pdf_rasterizer_workers_env():
+    return os.getenv("PDF_RASTERIZER_WORKERS")
+
+
+def get_subprocess_concurrency_env():
+    return os.getenv("SUBPROCESS_CONCURRENCY")
+
+
+def get_document_converter_workers_env():
+    return os.getenv("DOCUMENT_CONVERTER_WORKERS")
+
+
+def get_parsed_document_cache_max_size_mb_env():
+    return os.getenv("PARSED_DOCUMENT_CACHE_MAX_SIZE_MB")
+
+
+def get_documents_loader_concurrency_env():
+    return os.getenv("DOCUMENTS_LOADER_CONCURRENCY")
+
+
+def get_pdf_text_extraction_mode_env():
+    return os.getenv("PDF_TEXT_EXTRACTION_MODE")
+
+
+def get_presentation_generation_workers_env():
+    return os.getenv("PRESENTATION_GENERATION_WORKERS")
+
+
+def get_database_pool_size_env():
+    return os.getenv("DATABASE_POOL_SIZE")
+
+
+def get_database_max_overflow_env():
+    return os.getenv("DATABASE_MAX_OVERFLOW")
+
+
+def get_database_pool_timeout_env():
+    return os.getenv("DATABASE_POOL_TIMEOUT")
+
+
+def get_database_pool_recycle_env():
+    return os.getenv("DATABASE_POOL_RECYCLE")
+
+
+def get_database_pool_pre_ping_env():
+    return os.getenv("DATABASE_POOL_PRE_PING")
+
+
+def get_sqlite_busy_timeout_ms_env():
+    return os.getenv("SQLITE_BUSY_TIMEOUT_MS")
+
+
+def get_sqlite_mmap_size_mb_env():
+    return os.getenv("SQLITE_MMAP_SIZE_MB")
@@ -1,8 +1,12 @@
+from typing import AsyncGenerator, List, Tuple
 from models.llm_message import LLMSystemMessage, LLMUserMessage
 from models.presentation_layout import SlideLayoutModel
 from models.presentation_outline_model import SlideOutlineModel
 from services.llm_client import LLMClient
+from utils.async_iterator import gather_in_order_with_limit
+from utils.get_env import get_slide_generation_concurrency_env
 from utils.llm_provider import get_model
+from utils.parsers import parse_int_or_none
 from utils.schema_utils import add_field_in_schema, remove_fields_from_schema
 
 system_prompt = """
@@ -24,6 +28,8 @@ system_prompt = """
     **Strictly follow the max and min character limit for every property in the slide.**
 """
 
+DEFAULT_SLIDE_GENERATION_CONCURRENCY = 4
+
 
 def get_user_prompt(outline: str, language: str):
     return f"""
@@ -82,3 +88,35 @@ async def get_slide_content_from_type_and_outline(
         strict=False,
     )
     return response
+
+
+def get_slide_generation_concurrency() -> int:
+    return (
+        parse_int_or_none(get_slide_generation_concurrency_env())
+        or DEFAULT_SLIDE_GENERATION_CONCURRENCY
+    )
+
+
+async def get_slide_contents_from_types_and_outlines(
+    slide_layouts: List[SlideLayoutModel],
+    outlines: List[SlideOutlineModel],
+    language: str,
+) -> AsyncGenerator[Tuple[int, dict], None]:
+    """
+    Generates content for every slide concurrently (bounded by
+    SLIDE_GENERATION_CONCURRENCY) and yields (index, content) in slide order.
+    """
+
+    def get_factory(slide_layout: SlideLayoutModel, outline: SlideOutlineModel):
+        return lambda: get_slide_content_from_type_and_outline(
+            slide_layout, outline, language
+        )
+
+    factories = [
+        get_factory(slide_layout, outline)
+        for slide_layout, outline in zip(slide_layouts, outlines)
+    ]
+    async for index, slide_content in gather_in_order_with_limit(
+        factories, get_slide_generation_concurrency()
+    ):
+        yield index, slide_content
@@ -0,0 +1,26 @@
+import pdfplumber
+
+# Entry points of the PDF rasterizer worker processes. Kept outside the
+# services package, so spawned workers only import pdfplumber instead of
+# creating every service singleton.
+
+
+def get_pdf_page_count(pdf_path: str) -> int:
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def render_pdf_page(
+    pdf_path: str,
+    page_number: int,
+    output_path: str,
+    dpi: int,
+    image_format: str,
+) -> str:
+    # Runs in a worker process, every page opens the document on its own
+    with pdfplumber.open(pdf_path, pages=[page_number]) as pdf:
+        image = pdf.pages[0].to_image(resolution=dpi).original
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(output_path, format=image_format.upper())
+    return output_path
@@ -0,0 +1,20 @@
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import HTTPException
+
+
+def encode_presentations_cursor(created_at: datetime, presentation_id: str) -> str:
+    cursor = f"{created_at.isoformat()}|{presentation_id}"
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+
+def decode_presentations_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, presentation_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+        return datetime.fromisoformat(created_at), presentation_id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
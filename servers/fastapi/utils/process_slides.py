@@ -58,6 +58,49 @@ async def process_slide_and_fetch_assets(
     return return_assets
 
 
+class SlideAssetsFetcher:
+    """
+    Starts fetching images and icons of a slide as soon as its content is
+    generated, so asset resolution overlaps with the remaining text generation.
+    """
+
+    def __init__(
+        self,
+        image_generation_service: ImageGenerationService,
+        icon_finder_service: IconFinderService,
+    ):
+        self.image_generation_service = image_generation_service
+        self.icon_finder_service = icon_finder_service
+        self._tasks: List[asyncio.Task] = []
+
+    def schedule(self, slide: SlideModel):
+        # This will mutate slide once the task runs
+        self._tasks.append(
+            asyncio.create_task(
+                process_slide_and_fetch_assets(
+                    self.image_generation_service, self.icon_finder_service, slide
+                )
+            )
+        )
+
+    async def wait(self) -> List[ImageAsset]:
+        try:
+            assets_lists = await asyncio.gather(*self._tasks)
+        except BaseException:
+            self.cancel()
+            raise
+
+        assets = []
+        for assets_list in assets_lists:
+            assets.extend(assets_list)
+        return assets
+
+    def cancel(self):
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+
 async def process_old_and_new_slides_and_fetch_assets(
     image_generation_service: ImageGenerationService,
     icon_finder_service: IconFinderService,
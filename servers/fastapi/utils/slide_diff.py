@@ -0,0 +1,58 @@
+import hashlib
+import json
+from typing import List
+
+from pydantic import BaseModel
+
+from models.sql.slide import SlideModel
+
+
+class SlidesDiff(BaseModel):
+    # Incoming slides without a stored slide of the same id
+    new_slides: List[SlideModel]
+    # Incoming slides whose stored slide has different content
+    changed_slides: List[SlideModel]
+    unchanged_slide_ids: List[str]
+    deleted_slide_ids: List[str]
+
+
+def get_slide_content_hash(slide: SlideModel) -> str:
+    """
+    Hashes every field of the slide except its id.
+    """
+    data = slide.model_dump(mode="json", exclude={"id"})
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def diff_slides(
+    stored_slides: List[SlideModel], incoming_slides: List[SlideModel]
+) -> SlidesDiff:
+    """
+    Compares incoming slides with the stored slides of the same id.
+    Stored slides missing from the incoming slides are deleted.
+    """
+    stored_hashes = {
+        slide.id: get_slide_content_hash(slide) for slide in stored_slides
+    }
+    incoming_ids = {slide.id for slide in incoming_slides}
+
+    new_slides = []
+    changed_slides = []
+    unchanged_slide_ids = []
+    for slide in incoming_slides:
+        stored_hash = stored_hashes.get(slide.id)
+        if stored_hash is None:
+            new_slides.append(slide)
+        elif stored_hash != get_slide_content_hash(slide):
+            changed_slides.append(slide)
+        else:
+            unchanged_slide_ids.append(slide.id)
+
+    return SlidesDiff(
+        new_slides=new_slides,
+        changed_slides=changed_slides,
+        unchanged_slide_ids=unchanged_slide_ids,
+        deleted_slide_ids=[
+            slide.id for slide in stored_slides if slide.id not in incoming_ids
+        ],
+    )